@@ -0,0 +1,201 @@
+import csv
+import json
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+
+from OptimizationStrategy.StrategyMetrics import StrategyMetrics
+from OptimizationStrategy.StrategyRegistry import StrategyRegistry
+from TestFunctions.CachedFunction import CachedFunction
+from TestFunctions.FunctionRegistry import FunctionRegistry
+
+
+class BenchmarkSuite:
+    """
+    Набор замеров "стратегия × тестовая функция" без графического интерфейса.
+
+    Каждая стратегия запускается на каждой функции из сетки начальных точек.
+    Для каждой пары измеряются суммарное время, среднее число итераций,
+    вычислений функции и градиента, доля успешных запусков и пиковая память
+    одного запуска. В режиме профилирования добавляется время фаз итерации
+    из StrategyMetrics. Для функций произвольной размерности начальные
+    точки дополняются до dimension повторением координат.
+
+    С кэшированием вычислений функция каждой пары оборачивается в
+    CachedFunction и добавляется доля попаданий в кэш по замеренным
+    запускам. Замер памяти выполняется с новым, пустым кэшем.
+
+    Attributes:
+        strategies: Словарь имя -> фабрика стратегии
+        functions: Словарь имя -> класс тестовой функции
+    """
+
+    STRATEGIES = {name: partial(StrategyRegistry.create, name) for name in StrategyRegistry.names()}
+
+    FUNCTIONS = {name: FunctionRegistry.get(name) for name in FunctionRegistry.names()}
+
+    FIELDS = ['strategy', 'function', 'runs', 'wall_time_s', 'mean_time_ms',
+              'mean_iterations', 'mean_func_evals', 'mean_grad_evals',
+              'mean_hessian_evals', 'success_rate', 'peak_memory_kb']
+
+    PHASE_FIELDS = [f'{phase}_ms' for phase in StrategyMetrics.PHASES]
+
+    def __init__(self, strategies=None, functions=None, profile=False, cache=False, cache_quantum=None,
+                 dimension=2):
+        self.profile = profile
+        self.dimension = dimension
+        self.cache = cache
+        self.cache_quantum = cache_quantum
+        self.fields = (self.FIELDS + (self.PHASE_FIELDS if profile else [])
+                       + (['cache_hit_rate'] if cache else []))
+        self.strategies = {name: self.STRATEGIES[name] for name in (strategies or self.STRATEGIES)}
+        self.functions = {name: self.FUNCTIONS[name] for name in (functions or self.FUNCTIONS)}
+
+    @staticmethod
+    def starting_points(bounds=(-4, 4, -4, 4), grid_size=5):
+        """Равномерная сетка начальных точек формы (grid_size ** 2, 2)."""
+        x_min, x_max, y_min, y_max = bounds
+        x, y = np.meshgrid(np.linspace(x_min, x_max, grid_size),
+                           np.linspace(y_min, y_max, grid_size))
+        return np.column_stack([x.ravel(), y.ravel()])
+
+    def run(self, starting_points, lr=1e-3, max_iters=1000, tolerance=1e-4):
+        """
+        Выполняет все замеры.
+
+        Запуск считается успешным, если он закончился сходимостью
+        (trajectory.converged) и значение функции в конечной точке конечно.
+
+        Returns:
+            list: Строки результатов (словари с ключами FIELDS)
+        """
+        results = []
+        for strategy_name, make_strategy in self.strategies.items():
+            for function_name, func_class in self.functions.items():
+                strategy = make_strategy()
+                func = self._wrap(func_class)
+                strategy.set_func(func)
+                strategy.metrics.timing = self.profile
+                points = [func_class.expand_point(point, func_class.dimension or self.dimension)
+                          for point in starting_points]
+
+                iterations = np.empty(len(points))
+                success = np.empty(len(points), dtype=bool)
+                evals = {'func_evals': 0, 'grad_evals': 0, 'hessian_evals': 0}
+                phase_times = dict.fromkeys(StrategyMetrics.PHASES, 0.0)
+                start = time.perf_counter()
+                for i, point in enumerate(points):
+                    trajectory = strategy.optimize(point, lr, max_iters, tolerance)
+                    iterations[i] = len(trajectory) - 1
+                    success[i] = trajectory.converged and np.isfinite(trajectory.values[-1])
+                    # Метрики сбрасываются в начале каждого запуска
+                    for key in evals:
+                        evals[key] += getattr(strategy.metrics, key)
+                    for phase, seconds in strategy.metrics.phase_times.items():
+                        phase_times[phase] += seconds
+                wall_time = time.perf_counter() - start
+                if self.cache:
+                    # Доля попаданий только по замеренным запускам
+                    hit_rate = func.hit_rate
+                    func.clear()
+
+                # Замер памяти с пустым кэшем, как у первого запуска пары
+                strategy.set_func(self._wrap(func_class))
+                peak_memory = self._peak_memory(strategy, points[0], lr, max_iters, tolerance)
+
+                runs = len(points)
+                row = {
+                    'strategy': strategy_name,
+                    'function': function_name,
+                    'runs': runs,
+                    'wall_time_s': wall_time,
+                    'mean_time_ms': 1000 * wall_time / runs,
+                    'mean_iterations': float(iterations.mean()),
+                    'mean_func_evals': evals['func_evals'] / runs,
+                    'mean_grad_evals': evals['grad_evals'] / runs,
+                    'mean_hessian_evals': evals['hessian_evals'] / runs,
+                    'success_rate': float(success.mean()),
+                    'peak_memory_kb': peak_memory / 1024,
+                }
+                if self.profile:
+                    for phase, seconds in phase_times.items():
+                        row[f'{phase}_ms'] = 1000 * seconds / runs
+                if self.cache:
+                    row['cache_hit_rate'] = hit_rate
+                results.append(row)
+        return results
+
+    def _wrap(self, func_class):
+        """Функция пары: с кэшированием - в новом CachedFunction."""
+        if self.cache:
+            return CachedFunction(func_class, quantum=self.cache_quantum)
+        return func_class
+
+    @staticmethod
+    def _peak_memory(strategy, point, lr, max_iters, tolerance):
+        # Отдельный запуск: tracemalloc замедляет код и исказил бы замер времени
+        tracemalloc.start()
+        try:
+            strategy.optimize(point, lr, max_iters, tolerance)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    @classmethod
+    def save_json(cls, results, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    def save_csv(self, results, path):
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=self.fields)
+            writer.writeheader()
+            writer.writerows(results)
+
+    @staticmethod
+    def load_json(path):
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def compare(results, baseline, threshold=0.2):
+        """
+        Сравнивает результаты с сохраненным эталоном.
+
+        Регрессией считается рост среднего времени запуска или среднего
+        числа вычислений функции/градиента/гессиана больше чем на threshold,
+        а также падение доли успешных запусков.
+
+        Returns:
+            list: Описания найденных регрессий
+        """
+        reference = {(row['strategy'], row['function']): row for row in baseline}
+        regressions = []
+        for row in results:
+            base = reference.get((row['strategy'], row['function']))
+            if base is None:
+                continue
+            for field in ('mean_time_ms', 'mean_func_evals', 'mean_grad_evals', 'mean_hessian_evals'):
+                # Поля, которых нет в старом эталоне, не сравниваются
+                if base.get(field, 0) > 0 and row[field] > base[field] * (1 + threshold):
+                    regressions.append(
+                        f"{row['strategy']}/{row['function']}: {field} "
+                        f"{base[field]:.4g} -> {row[field]:.4g}"
+                    )
+            if row['success_rate'] < base['success_rate']:
+                regressions.append(
+                    f"{row['strategy']}/{row['function']}: success_rate "
+                    f"{base['success_rate']:.2f} -> {row['success_rate']:.2f}"
+                )
+        return regressions
+
+    def format_table(self, results):
+        lines = ['\t'.join(self.fields)]
+        for row in results:
+            lines.append('\t'.join(
+                f"{row[field]:.4g}" if isinstance(row[field], float) else str(row[field])
+                for field in self.fields
+            ))
+        return '\n'.join(lines)
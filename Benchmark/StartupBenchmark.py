@@ -0,0 +1,130 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# Замер запуска GUI в отдельном интерпретаторе. Время отсчитывается от
+# начала скрипта; окончание - сигнал plotReady после первой поверхности
+_GUI_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from GUI.MainWindow import MainWindow
+imported = time.perf_counter()
+window = MainWindow()
+constructed = time.perf_counter()
+marks = {}
+
+class PaintProbe(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and 'first_paint' not in marks:
+            marks['first_paint'] = time.perf_counter()
+        return False
+
+probe = PaintProbe()
+window.installEventFilter(probe)
+
+def on_plot():
+    marks['first_plot'] = time.perf_counter()
+    app.quit()
+
+window.plotReady.connect(on_plot)
+window.show()
+QTimer.singleShot(60000, app.quit)
+app.exec_()
+print(json.dumps({
+    'import_ms': 1000 * (imported - start),
+    'construct_ms': 1000 * (constructed - imported),
+    'first_paint_ms': 1000 * (marks.get('first_paint', float('nan')) - start),
+    'first_plot_ms': 1000 * (marks.get('first_plot', float('nan')) - start),
+    'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+# Замер запуска интерфейса командной строки: только импорт cli
+_CLI_PROBE = """
+import json, resource, time
+start = time.perf_counter()
+import cli
+imported = time.perf_counter()
+print(json.dumps({
+    'import_ms': 1000 * (imported - start),
+    'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+class StartupBenchmark:
+    """
+    Замер холодного старта GUI и интерфейса командной строки.
+
+    Каждый замер выполняется в новом интерпретаторе, чтобы импортированные
+    модули и скомпилированные ядра функций не переиспользовались. Для GUI
+    измеряются импорт MainWindow, конструктор окна, время до первой
+    отрисовки окна (first_paint) и до готовой поверхности (first_plot).
+    Итог - медиана по повторам и общее время процесса.
+
+    Attributes:
+        repeats: Число повторов каждого замера
+        offscreen: Запускать Qt без дисплея (QT_QPA_PLATFORM=offscreen)
+    """
+
+    PROBES = {'gui': _GUI_PROBE, 'cli': _CLI_PROBE}
+
+    def __init__(self, repeats=5, offscreen=True):
+        self.repeats = repeats
+        self.offscreen = offscreen
+
+    def run(self, modes=('gui', 'cli')):
+        """
+        Выполняет замеры.
+
+        Returns:
+            list: Строки результатов (режим, число повторов, медианы полей
+                замера и общего времени процесса process_ms). Для режима,
+                замер которого завершился ошибкой, строка содержит runs=0 и
+                последнюю строку сообщения об ошибке error
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+        if self.offscreen:
+            env['QT_QPA_PLATFORM'] = 'offscreen'
+
+        results = []
+        for mode in modes:
+            samples = []
+            error = None
+            for _ in range(self.repeats):
+                start = time.perf_counter()
+                completed = subprocess.run([sys.executable, '-c', self.PROBES[mode]], cwd=root, env=env,
+                                           capture_output=True, text=True)
+                if completed.returncode != 0:
+                    # Режим недоступен (нет PyQt5, дисплея и т.п.): остальные режимы замеряются
+                    lines = completed.stderr.strip().splitlines()
+                    error = lines[-1] if lines else f"код возврата {completed.returncode}"
+                    break
+                sample = json.loads(completed.stdout.strip().splitlines()[-1])
+                sample['process_ms'] = 1000 * (time.perf_counter() - start)
+                samples.append(sample)
+
+            if error is not None:
+                results.append({'mode': mode, 'runs': 0, 'error': error})
+                continue
+            row = {'mode': mode, 'runs': self.repeats}
+            for field in samples[0]:
+                row[field] = float(np.median([sample[field] for sample in samples]))
+            results.append(row)
+        return results
+
+    @staticmethod
+    def format_table(results):
+        lines = []
+        for row in results:
+            lines.append('\t'.join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                                   for key, value in row.items()))
+        return '\n'.join(lines)
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class BlitAnimator:
+    """
+    Инкрементальная анимация пути оптимизации с использованием блиттинга.
+
+    Статичный фон (поверхность, оси) копируется один раз после каждой полной
+    отрисовки холста, а на каждом кадре перерисовываются только линия пути
+    и маркер текущей точки. На трехмерных осях путь рисуется над
+    поверхностью (высота - значение функции), на двумерных - проекцией на
+    плоскость первых двух координат.
+
+    Attributes:
+        path_line: Линия пройденного пути
+        current_point: Маркер текущей точки
+        simplex_line: Контур текущего симплекса (для симплекс-метода)
+    """
+
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self._background = None
+        self._points = None
+        self._values = None
+        self._simplices = None
+        self._simplex_values = None
+        self._is_3d = ax.name == '3d'
+
+        empty = ([], [], []) if self._is_3d else ([], [])
+        self.path_line, = ax.plot(*empty, 'r-', linewidth=1.5, animated=True)
+        self.current_point, = ax.plot(
+            *empty, 'o',
+            color='lime',
+            markersize=8,
+            markeredgecolor='black',
+            animated=True
+        )
+        self.simplex_line, = ax.plot(*empty, 'b-', linewidth=1.0, animated=True)
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_path(self, points, values, simplices=None, simplex_values=None):
+        """
+        Задает массивы пути, из которых берутся данные кадров.
+
+        Args:
+            points: Точки пути формы (n, d); рисуется проекция на первые
+                две координаты
+            values: Значения функции в точках пути формы (n,)
+            simplices: Симплексы на каждой итерации формы (n, 3, 2) или None
+            simplex_values: Значения в вершинах симплексов формы (n, 3) или None
+        """
+        self._points = points
+        self._values = values
+        # Контур симплекса рисуется только для двумерной задачи
+        if simplices is not None and simplices.shape[-1] != 2:
+            simplices = simplex_values = None
+        self._simplices = simplices
+        self._simplex_values = simplex_values
+
+    def show_frame(self, index):
+        """
+        Отображает путь до точки с указанным индексом включительно.
+
+        Args:
+            index: Индекс последней отображаемой точки пути
+        """
+        x = self._points[:index + 1, 0]
+        y = self._points[:index + 1, 1]
+        z = self._values[:index + 1]
+        self._set_data(self.path_line, x, y, z)
+        self._set_data(self.current_point, x[-1:], y[-1:], z[-1:])
+        if self._simplices is not None:
+            # Замкнутый контур: первая вершина повторяется в конце
+            vertices = np.append(np.arange(self._simplices.shape[1]), 0)
+            simplex = self._simplices[index, vertices]
+            self._set_data(self.simplex_line, simplex[:, 0], simplex[:, 1],
+                           self._simplex_values[index, vertices])
+
+        if self._background is None:
+            # Фон еще не сохранен - полная отрисовка вызовет _on_draw
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def _set_data(self, line, x, y, z):
+        if self._is_3d:
+            line.set_data_3d(x, y, z)
+        else:
+            line.set_data(x, y)
+
+    def _on_draw(self, event):
+        """Сохраняет фон после полной отрисовки и дорисовывает анимируемые элементы."""
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.path_line)
+        self.ax.draw_artist(self.current_point)
+        self.ax.draw_artist(self.simplex_line)
+
+    def disconnect(self):
+        """Отключает обработчик отрисовки (оси уже удалены вместе с элементами)."""
+        self.canvas.mpl_disconnect(self._draw_cid)
+
+    def remove(self):
+        """Удаляет элементы анимации с графика."""
+        self.disconnect()
+        self.path_line.remove()
+        self.current_point.remove()
+        self.simplex_line.remove()
@@ -5,22 +5,49 @@ from GUI.SpinBox import SpinBox
 
 
 class ControlPanel(QWidget):
+    """
+    Панель управления главного окна.
+
+    Поля ввода, кнопки и комбобоксы передаются окну атрибутами (lr_edit,
+    iter_spin, start_btn, func_combo и т.д.) и подключаются к его
+    обработчикам, а панель только размещает их.
+    """
 
     def __init__(self):
         super().__init__()
         self.control_layout = QVBoxLayout(self)
         self.control_layout.setSpacing(10)
 
-    def _update_control_panel(self, optimization_strategy):
+    def _update_control_panel(self, window):
+        """
+        Создает элементы управления окна.
+
+        Args:
+            window: Главное окно (MainWindow)
+        """
         # Поля ввода параметров (без вертикальных отступов)
-        self.control_layout.addLayout(InputField("Шаг обучения (lr):", 'lr', '1e-3'))
-        self.control_layout.addLayout(InputField("Точность (tolerance):", 'tolerance', '1e-4'))
-        self.control_layout.addLayout(InputField("Нач. точка X:", 'x0', '3.5'))
-        self.control_layout.addLayout(InputField("Нач. точка Y:", 'y0', '2.0'))
+        self._add_row(window, InputField("Шаг обучения (lr):", 'lr', '1e-3'), 'lr_edit')
+        self._add_row(window, InputField("Точность (tolerance):", 'tolerance', '1e-4'), 'tolerance_edit')
+        self._add_row(window, InputField("Нач. точка X:", 'x0', '3.5'), 'x0_edit')
+        self._add_row(window, InputField("Нач. точка Y:", 'y0', '2.0'), 'y0_edit')
 
         # Спинбоксы для числовых параметров
-        self.control_layout.addLayout(SpinBox("Макс. итераций:", 1, 10000, 100))
-        self.control_layout.addLayout(SpinBox("Интервал анимации (мс):", 10, 1000, 50))
+        self._add_row(window, SpinBox("Макс. итераций:", 'iter', 1, 10000, 100), 'iter_spin')
+        # Размерность функций, определенных для любого числа переменных
+        self._add_row(window, SpinBox("Размерность:", 'dim', 2, 1000, 2), 'dim_spin')
+        # Срез многомерной функции зависит от размерности начальной точки
+        window.dim_spin.valueChanged.connect(lambda _: window.update_visualization())
+        self._add_row(window, SpinBox("Интервал анимации (мс):", 'speed', 10, 1000, 50), 'speed_spin')
+        # 0 - воспроизводить каждую итерацию без прореживания
+        self._add_row(window, SpinBox("Длительность анимации (с):", 'duration', 0, 600, 10), 'duration_spin')
+
+        # Диапазоны подбора параметров (значения берутся в логарифмической шкале)
+        self._add_row(window, InputField("Подбор lr: от", 'sweep_lr_min', '1e-5'), 'sweep_lr_min_edit')
+        self._add_row(window, InputField("Подбор lr: до", 'sweep_lr_max', '1e-1'), 'sweep_lr_max_edit')
+        self._add_row(window, InputField("Подбор tolerance: от", 'sweep_tol_min', '1e-6'), 'sweep_tol_min_edit')
+        self._add_row(window, InputField("Подбор tolerance: до", 'sweep_tol_max', '1e-2'), 'sweep_tol_max_edit')
+        self._add_row(window, SpinBox("Подбор макс. итераций: до", 'sweep_iters', 1, 100000, 1000),
+                      'sweep_iters_spin')
 
         # Горизонтальный контейнер для кнопки и выбора метода
         hbox = QHBoxLayout()
@@ -28,27 +55,69 @@ class ControlPanel(QWidget):
         hbox.setContentsMargins(0, 0, 0, 0)
 
         # Кнопка запуска оптимизации
-        self.start_btn = QPushButton("Запустить оптимизацию")
-        self.start_btn.clicked.connect(self.start_optimization)
-        hbox.addWidget(self.start_btn)
+        window.start_btn = QPushButton("Запустить оптимизацию")
+        window.start_btn.clicked.connect(window.start_optimization)
+        hbox.addWidget(window.start_btn)
+
+        # Продолжение последнего запуска еще на "Макс. итераций" итераций
+        window.continue_btn = QPushButton("Продолжить")
+        window.continue_btn.setEnabled(False)
+        window.continue_btn.clicked.connect(window.continue_optimization)
+        hbox.addWidget(window.continue_btn)
+
+        # Кнопки параллельной серии запусков из сетки начальных точек
+        window.batch_btn = QPushButton("Серия запусков")
+        window.batch_btn.clicked.connect(window.start_batch)
+        hbox.addWidget(window.batch_btn)
+        window.cancel_btn = QPushButton("Отмена")
+        window.cancel_btn.setEnabled(False)
+        window.cancel_btn.clicked.connect(window.cancel_calculations)
+        hbox.addWidget(window.cancel_btn)
+
+        # Кнопка подбора гиперпараметров с отсевом неудачных конфигураций
+        window.sweep_btn = QPushButton("Подбор параметров")
+        window.sweep_btn.clicked.connect(window.start_sweep)
+        hbox.addWidget(window.sweep_btn)
 
         # Метка и комбобокс выбора метода оптимизации
         hbox.addWidget(QLabel("Метод:"))
-        self.optimization_combo = QComboBox()
-        self.optimization_combo.addItems(self.optimization_strategies.keys())
-        self.optimization_combo.currentTextChanged.connect(self._on_optimization_method_changed)
-        hbox.addWidget(self.optimization_combo)
+        window.optimization_combo = QComboBox()
+        window.optimization_combo.addItems(window.optimization_strategies.keys())
+        window.optimization_combo.currentTextChanged.connect(window._on_optimization_method_changed)
+        hbox.addWidget(window.optimization_combo)
 
         self.control_layout.addLayout(hbox)
 
         func_layout = QHBoxLayout()
         func_layout.addWidget(QLabel("Функция:"))
-        self.func_combo = QComboBox()
-        self.func_combo.addItems(self.functions.keys())
-        self.func_combo.currentTextChanged.connect(self._on_func_changed)
-        func_layout.addWidget(self.func_combo)
+        window.func_combo = QComboBox()
+        window.func_combo.addItems(window.functions.keys())
+        window.func_combo.currentTextChanged.connect(window._on_func_changed)
+        func_layout.addWidget(window.func_combo)
 
         self.control_layout.addLayout(func_layout)
 
+        # Выбор стратегии визуализации (поверхность или карта бассейнов)
+        vis_layout = QHBoxLayout()
+        vis_layout.addWidget(QLabel("Визуализация:"))
+        window.visualization_combo = QComboBox()
+        window.visualization_combo.addItems(window.visualization_strategies.keys())
+        window.visualization_combo.currentTextChanged.connect(window._on_visualization_changed)
+        vis_layout.addWidget(window.visualization_combo)
+
+        self.control_layout.addLayout(vis_layout)
+
         # Добавляем растягивающий элемент внизу, чтобы прижать все вверх
         self.control_layout.addStretch()
+
+    def _add_row(self, window, row, name):
+        """
+        Размещает строку ввода и передает окну ее виджет.
+
+        Args:
+            window: Главное окно
+            row: Строка ввода (InputField или SpinBox)
+            name: Имя атрибута виджета строки и окна
+        """
+        self.control_layout.addLayout(row)
+        setattr(window, name, getattr(row, name))
@@ -0,0 +1,41 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    Модель истории оптимизации поверх массивов траектории.
+
+    Строки не хранятся, а форматируются по запросу представления, поэтому
+    стоимость отображения зависит только от числа видимых строк.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._trajectory = None
+
+    def set_trajectory(self, trajectory):
+        """
+        Задает траекторию, отображаемую в модели.
+
+        Args:
+            trajectory: Траектория оптимизации (Trajectory) или None
+        """
+        self.beginResetModel()
+        self._trajectory = trajectory
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self._trajectory is None:
+            return 0
+        return len(self._trajectory)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        point = self._trajectory.points[row]
+        z = self._trajectory.values[row]
+        if len(point) == 2:
+            return f"Iter {row}: X={point[0]:.4f}, Y={point[1]:.4f}, Z={z:.2f}"
+        # Для многомерного пути показываются первые две координаты
+        return f"Iter {row}: X0={point[0]:.4f}, X1={point[1]:.4f}, ..., Z={z:.2f}"
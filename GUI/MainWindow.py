@@ -1,24 +1,27 @@
-import matplotlib
+import os
+
 import numpy as np
-from PyQt5.QtCore import QThreadPool, QTimer, Qt
+from PyQt5.QtCore import QThreadPool, QTimer, Qt, pyqtSignal
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QLabel,
                              QSpinBox, QPushButton, QHBoxLayout, QDockWidget,
-                             QListWidget, QListWidgetItem, QComboBox)
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
+                             QListView, QComboBox)
 
-# Локальные импорты
+# Локальные импорты. Matplotlib, стратегии, тестовые функции, фоновые
+# вычисления и архив запусков загружаются при первом использовании, чтобы
+# окно появлялось как можно раньше
 from GUI.ScientificLineEdit import ScientificLineEdit
+from GUI.BlitAnimator import BlitAnimator
 from GUI.ControlPanel import ControlPanel
-from OptimizationStrategy.GradientDescentStrategy import GradientDescentStrategy
-from OptimizationStrategy.SimplexStrategy import SimplexStrategy
-from TestFunctions.BealeFunction import BealeFunction
-from TestFunctions.SimplexFunction1 import SimplexFunction1
+from GUI.HistoryModel import HistoryModel
+from GUI.RunStoreModel import RunStoreModel
+from OptimizationStrategy.StrategyRegistry import StrategyRegistry
+from TestFunctions.FunctionRegistry import FunctionRegistry
+from TestFunctions.VectorFunction import VectorFunction
+from VisualizationStrategy.BasinCache import BasinCache
+from VisualizationStrategy.BasinVisualization import BasinVisualization
+from VisualizationStrategy.ContourVisualization import ContourVisualization
+from VisualizationStrategy.SurfaceCache import SurfaceCache
 from VisualizationStrategy.SurfaceVisualization import SurfaceVisualization
-from WorkerCalculations.CalculationWorker import CalculationWorker
-
-matplotlib.use('Qt5Agg')
 
 
 class MainWindow(QMainWindow):
@@ -26,8 +29,46 @@ class MainWindow(QMainWindow):
     Главное окно приложения для визуализации методов оптимизации.
     Позволяет выбирать метод оптимизации, тип визуализации и параметры,
     а также отображает процесс оптимизации в 3D и историю точек.
+
+    Многомерные функции показываются срезом по первым двум координатам
+    через начальную точку, путь - проекцией на эти координаты.
+
+    Окно показывается до построения графика: холст matplotlib создается и
+    первая поверхность рисуется в первой итерации цикла событий, после чего
+    испускается сигнал plotReady.
     """
 
+    plotReady = pyqtSignal()
+
+    # Границы области построения поверхности (x_min, x_max, y_min, y_max)
+    SURFACE_BOUNDS = (-4, 4, -4, 4)
+    # Разрешение сетки: грубое рисуется сразу, точное - в простое
+    SURFACE_COARSE_RESOLUTION = 40
+    SURFACE_FINE_RESOLUTION = 160
+    # Разрешение сетки видимой области двумерной карты при увеличении
+    CONTOUR_RESOLUTION = 300
+    # Число начальных точек карты бассейнов притяжения по каждой оси
+    BASIN_RESOLUTION = 40
+    # Число начальных точек серии запусков по каждой оси
+    BATCH_GRID_SIZE = 6
+    # Размер сетки подбора параметров: значения lr, tolerance и max_iters
+    SWEEP_GRID_SHAPE = (8, 5, 3)
+    # Каталог архива завершенных запусков
+    RUN_STORE_DIR = os.path.join(os.path.expanduser('~'), '.optimization', 'runs')
+    # Подписи причин остановки (Trajectory.termination_reason)
+    STOP_REASONS = {
+        'gradient': "норма градиента",
+        'simplex': "сходимость симплекса",
+        'f_change': "изменение функции",
+        'step_stall': "застревание шага",
+        'plateau': "плато",
+        'diverged': "расхождение",
+        'time_budget': "лимит времени",
+        'eval_budget': "лимит вычислений",
+        'max_iters': "лимит итераций",
+        'cancelled': "отмена",
+    }
+
     def __init__(self):
         """
         Инициализация главного окна приложения.
@@ -51,33 +92,61 @@ class MainWindow(QMainWindow):
         self._setup_parameters()
 
     def _init_strategies(self):
-        """Инициализация доступных стратегий оптимизации и визуализации."""
+        """
+        Инициализация доступных стратегий оптимизации и визуализации.
+
+        Стратегии берутся из StrategyRegistry по отображаемым именам, а
+        экземпляры создаются при первом выборе метода.
+        """
         self.optimization_strategies = {
-            "Градиентный спуск": GradientDescentStrategy(),
-            "Симплекс-метод": SimplexStrategy()
+            StrategyRegistry.display_name(name): name for name in StrategyRegistry.names()
         }
+        self._strategy_instances = {}
 
         # Текущая стратегия по умолчанию
-        self.optimization_strategy = GradientDescentStrategy()
+        self._select_strategy(next(iter(self.optimization_strategies)))
+
+        # Стратегии визуализации по отображаемым именам
+        self.visualization_strategies = {
+            "Поверхность": SurfaceVisualization(),
+            "Бассейны притяжения": BasinVisualization('basins'),
+            "Итерации до сходимости": BasinVisualization('iterations'),
+            "Линии уровня": ContourVisualization(self._viewport_surface, self.CONTOUR_RESOLUTION),
+        }
+        self.visualization_strategy = self.visualization_strategies["Поверхность"]
+
+    def _get_strategy(self, method_name):
+        """
+        Возвращает экземпляр стратегии по отображаемому имени, создавая его
+        при первом обращении.
 
-        self.visualization_strategy = SurfaceVisualization()
+        Args:
+            method_name: Отображаемое имя метода
+        """
+        if method_name not in self._strategy_instances:
+            strategy = StrategyRegistry.create(self.optimization_strategies[method_name])
+            # В GUI измеряется время фаз и длительность каждой десятой итерации
+            strategy.metrics.timing = True
+            strategy.metrics.sample_every = 10
+            self._strategy_instances[method_name] = strategy
+        return self._strategy_instances[method_name]
+
+    def _select_strategy(self, method_name):
+        """Делает текущей стратегию с отображаемым именем method_name."""
+        self.strategy_name = self.optimization_strategies[method_name]
+        self.optimization_strategy = self._get_strategy(method_name)
 
     def _update_functions(self):
         """Инициализация доступных функций в зависимости от выбранной стратегии оптимизации."""
-        if isinstance(self.optimization_strategy, GradientDescentStrategy):
-            self.functions = {
-                "Функция Била": BealeFunction()
-            }
-        elif isinstance(self.optimization_strategy, SimplexStrategy):
-            self.functions = {
-                "Тест": SimplexFunction1(),
-                "Функция Била": BealeFunction()
-            }
-        # else:
-        #     # На случай, если добавится новая стратегия
-        #     self.functions = {
-        #
-        #     }
+        # Класс стратегии определяется по реестру, чтобы не импортировать его модуль
+        if StrategyRegistry.class_name(self.strategy_name) == 'GradientDescentStrategy':
+            names = ['beale']
+        else:
+            names = ['simplex1', 'beale']
+        # Многомерные функции доступны всем стратегиям
+        names += ['rosenbrock', 'rastrigin', 'ackley']
+        # Отображаемое имя -> имя в FunctionRegistry; класс загружается при выборе
+        self.functions = {FunctionRegistry.display_name(name): name for name in names}
 
         # Текущая функция по умолчанию
         self.function = None
@@ -100,41 +169,120 @@ class MainWindow(QMainWindow):
         # Настройка док-панели с историей точек
         self._setup_history_dock()
 
-        # Инициализация текущей стратегии
-        self.optimization_strategy = self.optimization_strategies[
-            self.optimization_combo.currentText()
-        ]
+        # Настройка док-панели с архивом запусков
+        self._setup_run_store_dock()
+
+        # Причина остановки последнего запуска
+        self.stop_reason_label = QLabel()
+        self.statusBar().addPermanentWidget(self.stop_reason_label)
+
+        # Инициализация текущей стратегии и ее функции по выбору в комбобоксах
+        self._select_strategy(self.optimization_combo.currentText())
+        self._apply_function()
 
     def _setup_control_panel(self):
         """Настройка панели управления с элементами ввода, прижатыми к верху."""
         control_panel = ControlPanel()
-        control_panel._update_control_panel(self.optimization_strategy)
+        control_panel._update_control_panel(self)
         self.main_layout.addWidget(control_panel, 1)
 
 
     def _setup_history_dock(self):
         """Настройка док-панели для отображения истории оптимизации."""
         self.dock = QDockWidget("История оптимизации", self)
-        self.points_list = QListWidget()
-        self.points_list.itemClicked.connect(self.focus_on_point)
+        self.history_model = HistoryModel(self)
+        self.points_list = QListView()
+        # Одинаковая высота строк позволяет не измерять невидимые строки
+        self.points_list.setUniformItemSizes(True)
+        self.points_list.setModel(self.history_model)
+        self.points_list.clicked.connect(self.focus_on_point)
         self.dock.setWidget(self.points_list)
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock)
 
+    def _setup_run_store_dock(self):
+        """
+        Настройка док-панели архива запусков (двойной щелчок - воспроизведение).
+        Архив открывается после появления окна.
+        """
+        self.run_store = None
+        self.run_store_model = None
+        self.run_store_dock = QDockWidget("Архив запусков", self)
+        self.runs_list = QListView()
+        self.runs_list.setUniformItemSizes(True)
+        self.runs_list.doubleClicked.connect(self.replay_run)
+        self.run_store_dock.setWidget(self.runs_list)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.run_store_dock)
+        QTimer.singleShot(0, self._open_run_store)
+
+    def _open_run_store(self):
+        """Открывает архив запусков и показывает его записи в док-панели."""
+        from RunStore.RunStore import RunStore
+
+        self.run_store = RunStore(self.RUN_STORE_DIR)
+        self.run_store_model = RunStoreModel(self.run_store, self)
+        self.runs_list.setModel(self.run_store_model)
+
     def _setup_plot(self):
-        """Настройка области для отображения графиков."""
-        self.figure = Figure(figsize=(10, 6))
-        self.canvas = FigureCanvas(self.figure)
-        self.toolbar = NavigationToolbar(self.canvas, self)
+        """
+        Настройка области для отображения графиков.
 
+        Здесь создается только контейнер: холст и первая поверхность
+        строятся в _create_plot после первой отрисовки окна (paintEvent),
+        чтобы окно появлялось до импорта matplotlib и расчета сетки.
+        """
         plot_widget = QWidget()
-        plot_layout = QVBoxLayout(plot_widget)
-        plot_layout.addWidget(self.canvas)
-        plot_layout.addWidget(self.toolbar)
-
+        self.plot_layout = QVBoxLayout(plot_widget)
         self.main_layout.addWidget(plot_widget, 3)
 
+        # Элементы графика
+        self.figure = None
+        self.canvas = None
+        self.animator = None
+        self.selected_marker = None
+        self.final_marker = None
+
+        # Кэш сеток поверхности и таймер прогрессивного уточнения
+        self.surface_cache = SurfaceCache()
+        # Сетки видимой области двумерной карты хранятся отдельно, чтобы не
+        # вытеснять из кэша сетки всей области
+        self.viewport_cache = SurfaceCache(max_entries=4)
+        self.progressive_surface = True
+        self.refine_timer = QTimer()
+        self.refine_timer.setSingleShot(True)
+        self.refine_timer.timeout.connect(self._refine_visualization)
+
+        # Кэш карт бассейнов притяжения и фоновое вычисление текущей карты
+        self.basin_cache = BasinCache()
+        self.basin_worker = None
+        self.basin_key = None
+
+        self._plot_pending = True
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._plot_pending:
+            # Холст строится в следующей итерации цикла событий, когда
+            # первый кадр окна уже выведен на экран
+            self._plot_pending = False
+            QTimer.singleShot(0, self._create_plot)
+
+    def _create_plot(self):
+        """Создает холст matplotlib и рисует первую поверхность."""
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=(10, 6))
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        self.plot_layout.addWidget(self.canvas)
+        self.plot_layout.addWidget(self.toolbar)
+
         # Инициализация графика
         self.update_visualization()
+        self.plotReady.emit()
 
     def _setup_parameters(self):
         """Настройка параметров приложения и таймеров."""
@@ -144,12 +292,29 @@ class MainWindow(QMainWindow):
         # Переменные для хранения данных оптимизации
         self.optimization_path = []
         self.z_values = []
+        self.frame_indices = []
         self.current_frame = 0
-
-        # Элементы графика
-        self.path_line = None
-        self.last_point = None
-        self.selected_marker = None
+        self.worker = None
+
+        # Буферы пути, получаемого по частям во время вычисления
+        self.streaming = False
+        self.stream_points = None
+        self.stream_values = None
+        self.stream_size = 0
+        self.stream_stride = 1
+        self.shown_index = -1
+
+        # Метод, функция и размерность показанного пути и его запись в
+        # архиве: продолжить можно только путь текущих метода и функции
+        self.path_key = None
+        self.run_id = None
+
+        # Пул процессов для серий независимых запусков, создается при первой серии
+        self.parallel_runner = None
+        self.scheduler = None
+        self.batch_artists = []
+        self.sweep_worker = None
+        self.sweep_window = None
 
     def _add_input_field(self, layout, label, field, default):
         """
@@ -187,13 +352,28 @@ class MainWindow(QMainWindow):
         Args:
             method_name: Название выбранного метода
         """
-        self.optimization_strategy = self.optimization_strategies[method_name]
+        self._select_strategy(method_name)
         self._update_functions()
+        current = self.func_combo.currentText()
         self.func_combo.blockSignals(True)
         self.func_combo.clear()        # Очищаем комбобокс
         self.func_combo.addItems(self.functions.keys()) # Добавляем новые элементы из словаря функций
+        # Выбранная функция сохраняется, если она доступна новому методу
+        if current in self.functions:
+            self.func_combo.setCurrentText(current)
         self.func_combo.blockSignals(False)
-        self.func_combo.currentTextChanged.connect(self._on_func_changed)
+        # Стратегии задается функция, показанная в комбобоксе
+        self._apply_function()
+        self.update_visualization()
+
+    def _on_visualization_changed(self, name):
+        """
+        Обработчик изменения типа визуализации.
+
+        Args:
+            name: Отображаемое имя стратегии визуализации
+        """
+        self.visualization_strategy = self.visualization_strategies[name]
         self.update_visualization()
 
     def _on_func_changed(self, func_name):
@@ -203,31 +383,187 @@ class MainWindow(QMainWindow):
         Args:
             func_name: Название выбранной функции
         """
-        self.function = self.functions[func_name]
-        self.optimization_strategy.set_func(self.function)
+        self._apply_function()
         self.update_visualization()
 
+    def _apply_function(self):
+        """Задает текущей стратегии функцию, выбранную в комбобоксе."""
+        self.function = FunctionRegistry.get(self.functions[self.func_combo.currentText()])
+        self.optimization_strategy.set_func(self.function)
+
     def update_visualization(self):
-        """Обновляет график в соответствии с текущими настройками."""
+        """
+        Обновляет график в соответствии с текущими настройками.
+
+        Если точная сетка уже есть в кэше, она рисуется сразу. Иначе в
+        прогрессивном режиме рисуется грубая сетка, а точная строится
+        после того, как цикл событий освободится.
+        """
+        if self.figure is None:
+            # Холст еще не создан - поверхность нарисует _create_plot
+            return
+        self.refine_timer.stop()
+        self._prepare_basin()
+        func = self._surface_function()
+        fine_key = (func, self.SURFACE_BOUNDS, self.SURFACE_FINE_RESOLUTION)
+
+        if not self.progressive_surface or fine_key in self.surface_cache:
+            self._draw_surface(self.SURFACE_FINE_RESOLUTION)
+        else:
+            self._draw_surface(self.SURFACE_COARSE_RESOLUTION)
+            self.refine_timer.start(0)
+
+    def _refine_visualization(self):
+        """Перерисовывает поверхность на точной сетке, если на ней нет пути."""
+        if self.timer.isActive() or self.animator is not None or self.batch_artists:
+            return
+        self._draw_surface(self.SURFACE_FINE_RESOLUTION)
+
+    def _draw_surface(self, resolution):
+        """
+        Рисует поверхность текущей функции на сетке заданного разрешения.
+
+        Args:
+            resolution: Число узлов сетки по каждой оси
+        """
         self.figure.clear()
 
-        # Создаем соответствующие оси
-        self.ax = self.figure.add_subplot(111, projection='3d')
+        # Элементы пути удалены вместе с осями: воспроизведение прерывается,
+        # а путь, который еще вычисляется, следующий фрагмент нарисует заново
+        self.timer.stop()
+        if self.animator is not None:
+            self.animator.disconnect()
+        self.animator = None
+        self.frame_indices = []
+        self.current_frame = 0
+        self.shown_index = -1
+        self.selected_marker = None
+        self.final_marker = None
+        self.batch_artists = []
+
+        # Создаем оси в проекции выбранной стратегии визуализации
+        self.ax = self.figure.add_subplot(111, projection=self.visualization_strategy.projection)
 
-        # Генерация данных для графика
-        x = np.linspace(-4, 4, 40)
-        y = np.linspace(-4, 4, 40)
-        x, y = np.meshgrid(x, y)
-        z = self.optimization_strategy.calculate_func(x, y)
+        # Данные для графика берутся из кэша сеток
+        x, y, z = self.surface_cache.get(self._surface_function(), self.SURFACE_BOUNDS, resolution)
 
         # Применение выбранной стратегии визуализации
         self.visualization_strategy.plot(self.ax, x, y, z)
-        self.ax.view_init(elev=35, azim=-45)
-        self.ax.dist = 8.5
-
+        if self._is_3d():
+            self.ax.view_init(elev=35, azim=-45)
+            self.ax.dist = 8.5
 
         self.canvas.draw()
 
+    def _is_3d(self):
+        return self.ax.name == '3d'
+
+    def _viewport_surface(self, bounds, resolution):
+        """Сетка текущей функции для видимой области двумерной карты."""
+        return self.viewport_cache.get(self._surface_function(), bounds, resolution)
+
+    def _basin_key_for(self, params):
+        """Ключ кэша карты бассейнов для текущих метода, функции и параметров."""
+        func = self._surface_function()
+        func_key = func.surface_key() if hasattr(func, 'surface_key') else func
+        return (self.optimization_combo.currentText(), func_key, self.SURFACE_BOUNDS,
+                self.BASIN_RESOLUTION, params['lr'], params['tolerance'], params['max_iters'])
+
+    def _prepare_basin(self):
+        """
+        Передает визуализации карту бассейнов из кэша. При промахе кэша
+        карта вычисляется в фоне, а до ее готовности рисуется только
+        поверхность.
+        """
+        if not isinstance(self.visualization_strategy, BasinVisualization):
+            return
+        params = self.get_params()
+        key = self._basin_key_for(params)
+        basin = self.basin_cache.get(key)
+        self.visualization_strategy.basin = basin
+        if basin is None and key != self.basin_key:
+            self._start_basin(key, params)
+
+    def _start_basin(self, key, params):
+        """
+        Запускает фоновое вычисление карты бассейнов, прерывая предыдущее.
+
+        Вычисление использует отдельный экземпляр стратегии, чтобы не
+        пересекаться с оптимизацией, запущенной из окна.
+
+        Args:
+            key: Ключ кэша карты
+            params: Параметры оптимизации (get_params)
+        """
+        from VisualizationStrategy.BasinMap import BasinMap
+        from WorkerCalculations.BasinWorker import BasinWorker
+
+        if self.basin_worker is not None:
+            self.basin_worker.cancel()
+        strategy = StrategyRegistry.create(self.optimization_strategies[key[0]])
+        strategy.set_func(self.optimization_strategy.get_func())
+        basin = BasinMap(self.SURFACE_BOUNDS, self.BASIN_RESOLUTION, params['initial_point'])
+
+        worker = BasinWorker(basin, strategy, params)
+        worker.signals.basinProgress.connect(
+            lambda done, total: self.statusBar().showMessage(f"Карта бассейнов: {done} из {total} точек")
+        )
+        worker.signals.resultReady.connect(lambda basin: self._on_basin_ready(key, basin))
+        worker.signals.failed.connect(
+            lambda error: self.statusBar().showMessage(f"Карта бассейнов не построена: {error}")
+        )
+        worker.signals.finished.connect(lambda: self._on_basin_finished(worker))
+        self.basin_worker = worker
+        self.basin_key = key
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_basin_ready(self, key, basin):
+        """
+        Сохраняет вычисленную карту и перерисовывает график, если карта
+        относится к текущим настройкам и на графике нет пути.
+
+        Args:
+            key: Ключ кэша карты
+            basin: Завершенная карта BasinMap
+        """
+        self.basin_cache.put(key, basin)
+        if key != self.basin_key or not isinstance(self.visualization_strategy, BasinVisualization):
+            return
+        if self.timer.isActive() or self.animator is not None or self.batch_artists:
+            self.statusBar().showMessage("Карта бассейнов готова и будет показана при следующей перерисовке")
+            return
+        self.update_visualization()
+
+    def _on_basin_finished(self, worker):
+        """
+        Сбрасывает текущее вычисление карты, в том числе после ошибки, чтобы
+        _prepare_basin запустило его заново при следующей перерисовке.
+        """
+        if worker is self.basin_worker:
+            self.basin_worker = None
+            self.basin_key = None
+
+    def _surface_function(self):
+        """
+        Функция, поверхность которой рисуется: сама функция для двумерной,
+        срез через начальную точку для многомерной.
+        """
+        from TestFunctions.SliceFunction import SliceFunction
+
+        func = self.optimization_strategy.get_func()
+        if func.dimension == 2:
+            return func
+        return SliceFunction(func, self._initial_point(func))
+
+    def _initial_point(self, func):
+        """
+        Начальная точка из полей ввода. Для функций произвольной размерности
+        координаты (x0, y0) повторяются до выбранной размерности.
+        """
+        point = [float(self.x0_edit.text().replace(',', '.')),
+                 float(self.y0_edit.text().replace(',', '.'))]
+        return VectorFunction.expand_point(point, func.dimension or self.dim_spin.value())
+
     def get_params(self):
         """
         Собирает параметры оптимизации из полей ввода.
@@ -238,123 +574,478 @@ class MainWindow(QMainWindow):
         return {
             'lr': self.lr_edit.value(),
             'tolerance': self.tolerance_edit.value(),
-            'initial_point': np.array([
-                float(self.x0_edit.text().replace(',', '.')),
-                float(self.y0_edit.text().replace(',', '.'))
-            ]),
+            'initial_point': self._initial_point(self.optimization_strategy.get_func()),
             'max_iters': self.iter_spin.value()
         }
 
     def start_optimization(self):
-        """Запускает процесс оптимизации в отдельном потоке."""
-        self.start_btn.setEnabled(False)
+        """
+        Запускает процесс оптимизации в отдельном потоке.
+
+        Анимация начинается с первым полученным фрагментом пути, не
+        дожидаясь окончания вычислений.
+        """
         self.clear_plot()
+        if self.optimization_strategy.get_func().dimension != 2:
+            # Срез многомерной функции проходит через начальную точку
+            self.update_visualization()
 
-        worker = CalculationWorker(self.get_params(), self.optimization_strategy)
-        worker.signals.resultReady.connect(self._handle_optimization_results)
-        worker.signals.finished.connect(lambda: self.start_btn.setEnabled(True))
-        QThreadPool.globalInstance().start(worker)
+        params = self.get_params()
+        dimension = len(params['initial_point'])
+        self._run_worker(params, np.empty((0, dimension)), np.empty(0))
+
+    def continue_optimization(self):
+        """
+        Продолжает показанный запуск еще на "Макс. итераций" итераций.
 
-    def _handle_optimization_results(self, path):
+        Путь дописывается к уже показанному без пересчета: стратегия
+        продолжает с сохраненным внутренним состоянием (Trajectory.state),
+        анимация - с текущего кадра.
+        """
+        params = self.get_params()
+        if self.path_key is None or self.path_key != self._path_key(params):
+            self.statusBar().showMessage(
+                "Продолжить можно только показанный запуск с теми же методом и функцией")
+            return
+        previous = self.optimization_path
+        params['resume'] = previous
+        params['resumed_from'] = self.run_id
+        if self.final_marker is not None:
+            self.final_marker.remove()
+            self.final_marker = None
+
+        self._run_worker(params, previous.points, previous.values)
+        if self.animator is not None:
+            self.animator.set_path(self.stream_points, self.stream_values)
+
+    def _path_key(self, params):
+        return (self.optimization_combo.currentText(), self.func_combo.currentText(),
+                len(params['initial_point']))
+
+    def _run_worker(self, params, points, values):
+        """
+        Запускает вычисление пути в отдельном потоке.
+
+        Args:
+            params: Параметры запуска из get_params (с resume - продолжение)
+            points: Уже показанная часть пути формы (k, d)
+            values: Значения функции в ее точках формы (k,)
+        """
+        from WorkerCalculations.CalculationWorker import CalculationWorker
+
+        size = max(len(points), 1) + params['max_iters']
+        self.streaming = True
+        self.stream_points = np.empty((size, points.shape[1]))
+        self.stream_values = np.empty(size)
+        self.stream_points[:len(points)] = points
+        self.stream_values[:len(points)] = values
+        self.stream_size = len(points)
+        self.stream_stride = self._stream_stride(params['max_iters'] + 1)
+        self.path_key = self._path_key(params)
+
+        # Траектория продолжаемого запуска в архив не записывается. Размерность
+        # и точка, через которую построен срез поверхности, нужны для
+        # воспроизведения многомерного запуска
+        archived = {key: value for key, value in params.items() if key != 'resume'}
+        archived['dimension'] = len(params['initial_point'])
+        archived['slice_base'] = params['initial_point']
+        # Метод и функция фиксируются при запуске: к приходу результата
+        # выбор в комбобоксах может измениться
+        method, function = self.path_key[:2]
+        strategy = self.optimization_strategy
+        self.worker = CalculationWorker(params, strategy)
+        self.worker.signals.chunkReady.connect(self._handle_chunk)
+        self.worker.signals.resultReady.connect(self._handle_optimization_results)
+        self.worker.signals.resultReady.connect(
+            lambda trajectory: self._archive_run(trajectory, archived, method, function,
+                                                 strategy.metrics.snapshot())
+        )
+        self.worker.signals.metricsReady.connect(self._show_metrics)
+        self.worker.signals.failed.connect(self._on_optimization_failed)
+        self.worker.signals.finished.connect(self._on_optimization_finished)
+        self._update_buttons()
+        QThreadPool.globalInstance().start(self.worker)
+
+    def _archive_run(self, trajectory, params, method, function, metrics):
+        """
+        Сохраняет завершенный запуск в архив.
+
+        Args:
+            trajectory: Траектория оптимизации (Trajectory)
+            params: Параметры запуска из get_params
+            method: Отображаемое имя метода запуска
+            function: Отображаемое имя функции запуска
+            metrics: Метрики стратегии запуска (StrategyMetrics.snapshot)
+        """
+        self.run_id = self.run_store.save(trajectory, params, method, function, metrics)
+        self.run_store_model.refresh()
+
+    def replay_run(self, model_index):
+        """
+        Воспроизводит запуск из архива с его методом и функцией.
+
+        Args:
+            model_index: QModelIndex выбранной строки списка запусков
+        """
+        if self.worker is not None:
+            return
+        record = self.run_store_model.record(model_index.row())
+        if record['strategy'] in self.optimization_strategies:
+            self.optimization_combo.setCurrentText(record['strategy'])
+        if record['function'] in self.functions:
+            self.func_combo.setCurrentText(record['function'])
+        # Размерность и срез поверхности запуска (в записях до их
+        # сохранения остаются текущие)
+        run_params = record['params']
+        if 'dimension' in run_params:
+            self.dim_spin.blockSignals(True)
+            self.dim_spin.setValue(run_params['dimension'])
+            self.dim_spin.blockSignals(False)
+        if 'slice_base' in run_params:
+            self.x0_edit.setText(str(run_params['slice_base'][0]))
+            self.y0_edit.setText(str(run_params['slice_base'][1]))
+        self.update_visualization()
+
+        self.clear_plot()
+        self.streaming = False
+        trajectory = self.run_store.load(record['id'])
+        self._handle_optimization_results(trajectory)
+        self.path_key = (record['strategy'], record['function'], trajectory.points.shape[1])
+        self.run_id = record['id']
+        self._update_buttons()
+
+    def _on_optimization_failed(self, message):
+        """
+        Сообщает об ошибке оптимизации. Путь без итоговой траектории
+        продолжить нельзя.
+
+        Args:
+            message: Текст ошибки
+        """
+        self.streaming = False
+        self.path_key = None
+        self.statusBar().showMessage(f"Ошибка оптимизации: {message}")
+
+    def _on_optimization_finished(self):
+        self.worker = None
+        self._update_buttons()
+
+    def _update_buttons(self):
+        """
+        Доступность кнопок по выполняемым вычислениям. Одиночный запуск
+        может идти одновременно с серией запусков или подбором параметров,
+        а серия и подбор используют общий пул процессов и идут по одному.
+        """
+        single = self.worker is not None
+        pool = self.scheduler is not None or self.sweep_worker is not None
+        self.start_btn.setEnabled(not single)
+        self.continue_btn.setEnabled(not single and self.path_key is not None)
+        self.batch_btn.setEnabled(not pool)
+        self.sweep_btn.setEnabled(not pool)
+        self.cancel_btn.setEnabled(single or pool)
+
+    def _handle_chunk(self, start, points, values):
+        """
+        Принимает очередной фрагмент пути и запускает анимацию при первом.
+
+        Args:
+            start: Индекс первой точки фрагмента в пути
+            points: Точки фрагмента формы (k, 2)
+            values: Значения функции в точках фрагмента формы (k,)
+        """
+        end = start + len(points)
+        self.stream_points[start:end] = points
+        self.stream_values[start:end] = values
+        self.stream_size = end
+        if self.animator is None:
+            self.animator = BlitAnimator(self.canvas, self.ax)
+            self.animator.set_path(self.stream_points, self.stream_values)
+        if not self.timer.isActive():
+            self.timer.start(self.speed_spin.value())
+
+    def _stream_stride(self, max_points):
+        """Шаг по точкам пути при воспроизведении во время вычисления."""
+        duration_ms = self.duration_spin.value() * 1000
+        if duration_ms == 0:
+            return 1
+        max_frames = max(2, duration_ms // self.speed_spin.value())
+        return max(1, -(-max_points // max_frames))
+
+    def start_batch(self):
+        """
+        Запускает серию независимых оптимизаций из сетки начальных точек
+        в пуле процессов. Пути отображаются по мере готовности.
+        """
+        from WorkerCalculations.RunScheduler import RunScheduler
+
+        self.clear_plot()
+
+        params = self.get_params()
+        x_min, x_max, y_min, y_max = self.SURFACE_BOUNDS
+        x, y = np.meshgrid(np.linspace(x_min, x_max, self.BATCH_GRID_SIZE),
+                           np.linspace(y_min, y_max, self.BATCH_GRID_SIZE))
+        # Сетка задает первые две координаты, остальные берутся из начальной точки
+        runs = []
+        for point in zip(x.ravel(), y.ravel()):
+            initial_point = params['initial_point'].copy()
+            initial_point[:2] = point
+            runs.append(dict(params, initial_point=initial_point))
+
+        self.scheduler = RunScheduler(self._get_parallel_runner(), self._detached_strategy(), runs)
+        self.scheduler.signals.runFinished.connect(self._handle_batch_result)
+        self.scheduler.signals.runFailed.connect(
+            lambda index, error: self.statusBar().showMessage(f"Запуск {index}: {error}")
+        )
+        self.scheduler.signals.failed.connect(
+            lambda error: self.statusBar().showMessage(f"Серия запусков прервана: {error}")
+        )
+        self.scheduler.signals.finished.connect(self._on_batch_finished)
+        self._update_buttons()
+        QThreadPool.globalInstance().start(self.scheduler)
+
+    def _detached_strategy(self):
+        """
+        Новый экземпляр текущей стратегии с ее функцией для пула процессов.
+        Экземпляр окна может выполнять CalculationWorker, который подключает
+        к нему поток точек и обработчик метрик, и такой экземпляр не
+        передается в другой процесс.
+        """
+        strategy = StrategyRegistry.create(self.strategy_name)
+        strategy.set_func(self.optimization_strategy.get_func())
+        return strategy
+
+    def cancel_calculations(self):
+        """Прерывает текущую оптимизацию, серию запусков или подбор параметров."""
+        if self.worker is not None:
+            self.worker.cancel()
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        if self.sweep_worker is not None:
+            self.sweep_worker.cancel()
+
+    def _handle_batch_result(self, index, trajectory):
+        """
+        Отображает путь одного запуска серии.
+
+        Args:
+            index: Номер запуска в серии
+            trajectory: Траектория оптимизации (Trajectory)
+        """
+        points = trajectory.points
+        coords = ((points[:, 0], points[:, 1], trajectory.values) if self._is_3d()
+                  else (points[:, 0], points[:, 1]))
+        line, = self.ax.plot(*coords, '-', color='orangered', linewidth=0.8, alpha=0.7)
+        self.batch_artists.append(line)
+        self.canvas.draw_idle()
+
+    def _on_batch_finished(self):
+        self.scheduler = None
+        self._update_buttons()
+
+    def start_sweep(self):
+        """
+        Запускает подбор lr, tolerance и max_iters по логарифмической сетке
+        из заданных диапазонов. Заведомо расходящиеся и отстающие конфигурации
+        отсеиваются на ранних ступенях, результат показывается тепловой картой.
+        """
+        from WorkerCalculations.HyperparameterSweep import HyperparameterSweep
+        from WorkerCalculations.SweepWorker import SweepWorker
+
+        lr_count, tol_count, iters_count = self.SWEEP_GRID_SHAPE
+        max_iters = self.sweep_iters_spin.value()
+        sweep = HyperparameterSweep(
+            lrs=np.geomspace(self.sweep_lr_min_edit.value(), self.sweep_lr_max_edit.value(), lr_count),
+            tolerances=np.geomspace(self.sweep_tol_min_edit.value(),
+                                    self.sweep_tol_max_edit.value(), tol_count),
+            max_iters=np.unique(np.geomspace(max(1, max_iters // 9), max_iters, iters_count).astype(int)),
+        )
+
+        self.sweep_worker = SweepWorker(sweep, self._get_parallel_runner(), self._detached_strategy(),
+                                        self.get_params()['initial_point'])
+        self.sweep_worker.signals.sweepProgress.connect(
+            lambda rung, alive: self.statusBar().showMessage(
+                f"Подбор параметров: ступень {rung + 1}, конфигураций: {alive}")
+        )
+        self.sweep_worker.signals.resultReady.connect(
+            lambda result: self._show_sweep_result(sweep, result)
+        )
+        self.sweep_worker.signals.failed.connect(
+            lambda error: self.statusBar().showMessage(f"Подбор параметров прерван: {error}")
+        )
+        self.sweep_worker.signals.finished.connect(self._on_sweep_finished)
+        self._update_buttons()
+        QThreadPool.globalInstance().start(self.sweep_worker)
+
+    def _get_parallel_runner(self):
+        """
+        Пул процессов для серии запусков или подбора параметров, создается
+        при первом обращении. Флаг отмены предыдущих вычислений сбрасывается.
+        """
+        from WorkerCalculations.ParallelRunner import ParallelRunner
+
+        if self.parallel_runner is None:
+            self.parallel_runner = ParallelRunner()
+        self.parallel_runner.reset()
+        return self.parallel_runner
+
+    def _show_sweep_result(self, sweep, result):
+        """
+        Открывает окно с тепловой картой результатов подбора.
+
+        Args:
+            sweep: Выполненный HyperparameterSweep
+            result: Словарь результатов HyperparameterSweep.run
+        """
+        from GUI.SweepHeatmapWindow import SweepHeatmapWindow
+
+        self.sweep_window = SweepHeatmapWindow(sweep, result)
+        self.sweep_window.show()
+
+    def _on_sweep_finished(self):
+        self.sweep_worker = None
+        self._update_buttons()
+
+    def closeEvent(self, event):
+        """Останавливает пул процессов при закрытии окна."""
+        self.cancel_calculations()
+        if self.basin_worker is not None:
+            self.basin_worker.cancel()
+        if self.parallel_runner is not None:
+            self.parallel_runner.shutdown()
+        super().closeEvent(event)
+
+    def _show_metrics(self, metrics):
+        """
+        Отображает метрики выполнения оптимизации в строке состояния.
+
+        Args:
+            metrics: Словарь метрик StrategyMetrics.snapshot()
+        """
+        phases = ', '.join(
+            f"{name}={1000 * seconds:.1f} мс" for name, seconds in metrics['phase_times'].items()
+        )
+        message = (f"Итераций: {metrics['iterations']}, "
+                   f"f: {metrics['func_evals']}, grad: {metrics['grad_evals']}, "
+                   f"hess: {metrics['hessian_evals']}; {phases}")
+        if 'latency' in metrics:
+            message += f"; итерация p50={1e6 * metrics['latency']['p50']:.1f} мкс"
+        self.statusBar().showMessage(message)
+
+    def _handle_optimization_results(self, trajectory):
         """
         Обрабатывает результаты оптимизации.
 
         Args:
-            path: Список точек пути оптимизации
+            trajectory: Траектория оптимизации (Trajectory)
         """
-        self.optimization_path = path
-        self.z_values = [self.optimization_strategy.calculate_func(p[0], p[1]) for p in path]
+        self.optimization_path = trajectory
+        self.z_values = trajectory.values
+        self.streaming = False
         self._update_points_list()
+        reason = trajectory.termination_reason
+        self.stop_reason_label.setText(f"Остановка: {self.STOP_REASONS.get(reason, reason)}")
+        if self.animator is None:
+            self.animator = BlitAnimator(self.canvas, self.ax)
+        self.animator.set_path(trajectory.points, trajectory.values,
+                               trajectory.simplices, trajectory.simplex_values)
+        # Кадры, показанные во время вычисления, не повторяются
+        frames = self._playback_frames(trajectory)
+        self.frame_indices = frames[frames > self.shown_index]
         self.current_frame = 0
-        self.timer.start(self.speed_spin.value())
+        if not self.timer.isActive():
+            self.timer.start(self.speed_spin.value())
+
+    def _playback_frames(self, trajectory):
+        """
+        Определяет индексы точек пути, показываемых при воспроизведении.
+
+        Если задана длительность анимации, путь прореживается до числа кадров,
+        укладывающегося в эту длительность при текущем интервале таймера.
+
+        Args:
+            trajectory: Траектория оптимизации (Trajectory)
+
+        Returns:
+            ndarray: Индексы точек пути для каждого кадра
+        """
+        duration_ms = self.duration_spin.value() * 1000
+        if duration_ms == 0:
+            return np.arange(len(trajectory))
+        max_frames = max(2, duration_ms // self.speed_spin.value())
+        return trajectory.keyframes(max_frames)
 
     def _update_points_list(self):
         """Обновляет список точек в док-панели истории."""
-        self.points_list.clear()
-        for i, (point, z) in enumerate(zip(self.optimization_path, self.z_values)):
-            item = QListWidgetItem(
-                f"Iter {i}: X={point[0]:.4f}, Y={point[1]:.4f}, Z={z:.2f}"
-            )
-            self.points_list.addItem(item)
+        self.history_model.set_trajectory(self.optimization_path)
 
-    def focus_on_point(self, item):
+    def focus_on_point(self, model_index):
         """
         Центрирует график на выбранной точке из истории.
 
         Args:
-            item: Выбранный элемент списка точек
+            model_index: QModelIndex выбранной строки списка точек
         """
-        index = self.points_list.row(item)
+        index = model_index.row()
         point = self.optimization_path[index]
-        x, y = point
+        x, y = point[:2]
         z = self.z_values[index]
 
         if self.selected_marker:
             self.selected_marker.remove()
 
+        coords = ([x], [y], [z]) if self._is_3d() else ([x], [y])
         self.selected_marker = self.ax.scatter(
-            [x], [y], [z],
+            *coords,
             color='gold',
             s=120,
             edgecolor='black',
             zorder=20
         )
 
-        # Настройка угла обзора
-        self.ax.dist = 6
-        self.ax.elev = 30
-        self.ax.azim = -45 + (x + y) * 10
+        if self._is_3d():
+            # Настройка угла обзора
+            self.ax.dist = 6
+            self.ax.elev = 30
+            self.ax.azim = -45 + (x + y) * 10
+        else:
+            # Двумерная карта сдвигается так, чтобы точка была в центре
+            half_width = np.ptp(self.ax.get_xlim()) / 2
+            half_height = np.ptp(self.ax.get_ylim()) / 2
+            self.ax.set_xlim(x - half_width, x + half_width)
+            self.ax.set_ylim(y - half_height, y + half_height)
         self.canvas.draw()
 
     def update_animation(self):
         """Обновляет анимацию процесса оптимизации."""
-        if self.current_frame >= len(self.optimization_path):
+        if self.animator is None:
+            # Путь удален перерисовкой поверхности
             self.timer.stop()
-            self._highlight_final_point()
+            return
+        if self.streaming:
+            # Путь еще вычисляется - показываются уже полученные точки
+            index = min(self.shown_index + self.stream_stride, self.stream_size - 1)
+            if index > self.shown_index:
+                self.animator.show_frame(index)
+                self.shown_index = index
             return
 
-        # Получаем данные для текущего кадра
-        x = [p[0] for p in self.optimization_path[:self.current_frame + 1]]
-        y = [p[1] for p in self.optimization_path[:self.current_frame + 1]]
-        z = self.z_values[:self.current_frame + 1]
-
-        # Обновляем линию пути
-        if self.path_line is None:
-            self.path_line, = self.ax.plot(x, y, z, 'r-', linewidth=1.5)
-        else:
-            self.path_line.set_data(x, y)
-            self.path_line.set_3d_properties(z)
+        if self.current_frame >= len(self.frame_indices):
+            self.timer.stop()
+            self._highlight_final_point()
+            return
 
-        # Обновляем текущую точку
-        self._update_current_point(x[-1], y[-1], z[-1])
-        self.canvas.draw()
+        # Перерисовываются только линия пути и текущая точка
+        self.shown_index = self.frame_indices[self.current_frame]
+        self.animator.show_frame(self.shown_index)
         self.current_frame += 1
 
-    def _update_current_point(self, x, y, z):
-        """
-        Обновляет отображение текущей точки на графике.
-
-        Args:
-            x: X-координата точки
-            y: Y-координата точки
-            z: Z-координата точки
-        """
-        if self.last_point:
-            self.last_point.remove()
-
-        self.last_point = self.ax.scatter(
-            [x], [y], [z],
-            color='lime',
-            s=60,
-            edgecolor='black',
-            zorder=10
-        )
-
     def _highlight_final_point(self):
         """Подсвечивает конечную точку оптимизации."""
-        final_point = self.optimization_path[-1]
-        self.ax.scatter(
-            [final_point[0]], [final_point[1]], [self.z_values[-1]],
+        final_point = self.optimization_path.final_point
+        coords = (([final_point[0]], [final_point[1]], [self.z_values[-1]]) if self._is_3d()
+                  else ([final_point[0]], [final_point[1]]))
+        self.final_marker = self.ax.scatter(
+            *coords,
             color='magenta',
             s=150,
             marker='*',
@@ -365,13 +1056,21 @@ class MainWindow(QMainWindow):
 
     def clear_plot(self):
         """Очищает график от предыдущих элементов."""
-        for artist in [self.path_line, self.last_point, self.selected_marker]:
-            if artist:
-                artist.remove()
+        self.timer.stop()
+        if self.animator:
+            self.animator.remove()
+        if self.selected_marker:
+            self.selected_marker.remove()
+        if self.final_marker:
+            self.final_marker.remove()
+        for artist in self.batch_artists:
+            artist.remove()
 
-        self.path_line = None
-        self.last_point = None
+        self.animator = None
         self.selected_marker = None
+        self.final_marker = None
+        self.batch_artists = []
+        self.shown_index = -1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,40 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class RunStoreModel(QAbstractListModel):
+    """
+    Модель списка запусков архива RunStore.
+
+    Строки форматируются по запросу представления из записей индекса,
+    траектории при этом не загружаются.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._records = store.runs()
+
+    def refresh(self):
+        """Перечитывает индекс архива после сохранения новых запусков."""
+        self.beginResetModel()
+        self._records = self._store.runs()
+        self.endResetModel()
+
+    def record(self, row):
+        return self._records[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        record = self._records[index.row()]
+        summary = record['summary']
+        # Нечисловое значение (расходимость) записано в индексе как null
+        final_value = summary['final_value']
+        final_value = float('nan') if final_value is None else final_value
+        return (f"#{record['id']} {record['strategy']}, {record['function']}: "
+                f"{summary['iterations']} итер., f={final_value:.4g}")
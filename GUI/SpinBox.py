@@ -3,10 +3,11 @@ from PyQt5.QtWidgets import QHBoxLayout, QLabel, QSpinBox
 
 class SpinBox(QHBoxLayout):
 
-    def __init__(self, label, min_val, max_val, default):
+    def __init__(self, label, field, min_val, max_val, default):
         super().__init__()
         self.addWidget(QLabel(label))
         spin = QSpinBox()
         spin.setRange(min_val, max_val)
         spin.setValue(default)
+        setattr(self, f'{field}_spin', spin)
         self.addWidget(spin)
\ No newline at end of file
@@ -0,0 +1,65 @@
+import matplotlib
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from WorkerCalculations.HyperparameterSweep import HyperparameterSweep
+
+
+class SweepHeatmapWindow(QWidget):
+    """
+    Окно с тепловой картой числа итераций до сходимости по результатам
+    подбора гиперпараметров.
+
+    По осям отложены lr и tolerance; при нескольких значениях max_iters
+    в клетке показан лучший результат. Несошедшиеся конфигурации закрашены
+    серым и помечены: x - расходимость, o - отсеяна на ранней ступени.
+    """
+
+    def __init__(self, sweep, result, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Подбор параметров")
+        self.resize(800, 600)
+
+        layout = QVBoxLayout(self)
+        self.figure = Figure(figsize=(8, 6))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+        layout.addWidget(QLabel(
+            f"Вычислено итераций: {result['iterations_spent']}, выделено: "
+            f"{result['iterations_budget']} из {result['full_grid_iterations']} при полном переборе"
+        ))
+
+        self._plot(sweep, result)
+
+    def _plot(self, sweep, result):
+        ax = self.figure.add_subplot(111)
+        iterations = np.fmin.reduce(result['iterations'], axis=2)
+        status = result['status']
+
+        # Строки - tolerance, столбцы - lr
+        image = np.ma.masked_invalid(iterations.T)
+        cmap = matplotlib.colormaps['viridis_r'].copy()
+        cmap.set_bad('lightgray')
+        mesh = ax.imshow(image, origin='lower', aspect='auto', cmap=cmap)
+        self.figure.colorbar(mesh, ax=ax, label='Итераций до сходимости')
+
+        for i in range(len(sweep.lrs)):
+            for j in range(len(sweep.tolerances)):
+                if np.isfinite(iterations[i, j]):
+                    ax.text(i, j, f"{iterations[i, j]:.0f}", ha='center', va='center',
+                            color='white', fontsize=8)
+                elif (status[i, j] == HyperparameterSweep.DIVERGED).all():
+                    ax.text(i, j, 'x', ha='center', va='center', color='firebrick')
+                elif (status[i, j] == HyperparameterSweep.PRUNED).any():
+                    ax.text(i, j, 'o', ha='center', va='center', color='dimgray')
+
+        ax.set_xticks(range(len(sweep.lrs)))
+        ax.set_xticklabels([f"{lr:.0e}" for lr in sweep.lrs], rotation=45)
+        ax.set_yticks(range(len(sweep.tolerances)))
+        ax.set_yticklabels([f"{tol:.0e}" for tol in sweep.tolerances])
+        ax.set_xlabel('lr')
+        ax.set_ylabel('tolerance')
+        self.figure.tight_layout()
+        self.canvas.draw()
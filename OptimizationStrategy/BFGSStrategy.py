@@ -0,0 +1,52 @@
+import numpy as np
+
+from OptimizationStrategy.NewtonTypeStrategy import NewtonTypeStrategy
+
+
+class BFGSStrategy(NewtonTypeStrategy):
+    """
+    Квазиньютоновский метод BFGS с обновлением обратной матрицы Гессе.
+
+    Если функция предоставляет аналитический гессиан, начальное приближение
+    берется из него (с исправлением до положительной определенности), иначе
+    начальная матрица - единичная, масштабированная после первого шага.
+    """
+
+    def _reset(self, point, **kwargs):
+        self._inverse_hessian = None
+        if self.has_hessian():
+            self._inverse_hessian = np.linalg.inv(
+                self._positive_definite(self.calculate_hessian(point))
+            )
+
+    def _model(self):
+        return self._inverse_hessian
+
+    def _restore_model(self, model):
+        self._inverse_hessian = model
+
+    def _direction(self, point, gradient):
+        if self._inverse_hessian is None:
+            return -gradient
+        return -self._inverse_hessian @ gradient
+
+    def _update(self, s, y):
+        curvature = s @ y
+        if not curvature > 1e-12:
+            # Условие кривизны нарушено - приближение не обновляется
+            return
+        if self._inverse_hessian is None:
+            self._inverse_hessian = curvature / (y @ y) * np.eye(len(s))
+        rho = 1.0 / curvature
+        # (I - rho s y^T) H (I - rho y s^T) + rho s s^T, раскрытое в
+        # симметричное обновление ранга 2: O(d^2) вместо умножения матриц O(d^3)
+        hy = self._inverse_hessian @ y
+        self._inverse_hessian += ((rho ** 2 * (y @ hy) + rho) * np.outer(s, s)
+                                  - rho * (np.outer(hy, s) + np.outer(s, hy)))
+
+    @staticmethod
+    def _positive_definite(hessian, min_eigenvalue=1e-8):
+        """Заменяет собственные значения гессиана их модулями (не меньше min_eigenvalue)."""
+        eigenvalues, eigenvectors = np.linalg.eigh(hessian)
+        eigenvalues = np.maximum(np.abs(eigenvalues), min_eigenvalue)
+        return (eigenvectors * eigenvalues) @ eigenvectors.T
\ No newline at end of file
@@ -1,23 +1,139 @@
 import numpy as np
 
+from OptimizationStrategy.MinibatchSampler import MinibatchSampler
+from OptimizationStrategy.OptimizationState import OptimizationState
 from OptimizationStrategy.OptimizationStrategy import OptimizationStrategy
 from TestFunctions.BealeFunction import BealeFunction
+from UpdateRule.AdamRule import AdamRule
+from UpdateRule.ArmijoRule import ArmijoRule
+from UpdateRule.BarzilaiBorweinRule import BarzilaiBorweinRule
+from UpdateRule.FixedStepRule import FixedStepRule
+from UpdateRule.MomentumRule import MomentumRule
+from UpdateRule.UpdateRule import UpdateRule
+from UpdateRule.WolfeRule import WolfeRule
 
 
 class GradientDescentStrategy(OptimizationStrategy):
-    def __init__(self):
+    """
+    Градиентный спуск с выбираемым правилом обновления.
+
+    Правило задается в конструкторе или аргументом update_rule метода
+    optimize: имя из UPDATE_RULES или экземпляр UpdateRule.
+
+    Если задан batch_size, выполняется стохастический спуск: значение и
+    градиент на каждой итерации вычисляются по новому мини-батчу строк
+    функции над набором данных (DatasetFunction), так что стоимость
+    итерации не зависит от размера данных. Параметры стохастического
+    режима задаются в конструкторе или аргументами optimize:
+        batch_size: Число строк в мини-батче (None - полный градиент)
+        svrg: Оценка градиента с уменьшенной дисперсией (SVRG)
+        epoch_length: Число итераций между опорными точками SVRG
+            (по умолчанию N / batch_size)
+        seed: Зерно генератора перемешивания строк
+    """
+
+    UPDATE_RULES = {
+        'fixed': FixedStepRule,
+        'armijo': ArmijoRule,
+        'wolfe': WolfeRule,
+        'heavy_ball': MomentumRule,
+        'nesterov': lambda: MomentumRule(nesterov=True),
+        'adam': AdamRule,
+        'bb': BarzilaiBorweinRule,
+    }
+
+    def __init__(self, update_rule='fixed', batch_size=None, svrg=False, epoch_length=None):
         super().__init__(BealeFunction)
+        self.update_rule = update_rule
+        self.batch_size = batch_size
+        self.svrg = svrg
+        self.epoch_length = epoch_length
+
+    def _make_rule(self, update_rule):
+        rule = update_rule if isinstance(update_rule, UpdateRule) else self.UPDATE_RULES[update_rule]()
+        rule.reset()
+        return rule
+
+    def supports_batch(self, **kwargs):
+        # Пакетный шаг базового класса совпадает только с постоянным шагом
+        # по полному градиенту
+        return (kwargs.get('update_rule', self.update_rule) == 'fixed'
+                and kwargs.get('batch_size', self.batch_size) is None
+                and super().supports_batch(**kwargs))
+
+    def _make_sampler(self, kwargs):
+        """Сэмплер мини-батчей для стохастического режима или None."""
+        batch_size = kwargs.get('batch_size', self.batch_size)
+        if batch_size is None:
+            return None
+        return MinibatchSampler(self._current_func, batch_size, kwargs.get('svrg', self.svrg),
+                                kwargs.get('epoch_length', self.epoch_length), kwargs.get('seed'))
+
+    def _state_owner(self, kwargs):
+        update_rule = kwargs.get('update_rule', self.update_rule)
+        return super()._state_owner(kwargs) + (
+            update_rule if isinstance(update_rule, str) else type(update_rule).__name__,
+            kwargs.get('batch_size', self.batch_size),
+            kwargs.get('svrg', self.svrg),
+        )
 
     def optimize(self, initial_point, lr, max_iters, tolerance, **kwargs):
-        path = [initial_point.copy()]
-        current_point = initial_point.copy()
-        for _ in range(max_iters):
-            gradient = self.calculate_gradient(*current_point)
-            current_point -= lr * gradient
-            path.append(current_point.copy())
-            if np.linalg.norm(gradient) < tolerance:
-                break
-        return path
-
-    def calculate_gradient(self, x, y):
-        return self._current_func.calculate_gradient(x, y)
\ No newline at end of file
+        metrics = self.metrics
+        metrics.reset()
+        owner = self._state_owner(kwargs)
+        trajectory, state = self._start_trajectory(initial_point, max_iters, kwargs)
+        self._start_stopping(tolerance, kwargs)
+        self._stream_started(trajectory)
+        current_point = np.array(trajectory.final_point, dtype=float)
+
+        # В стохастическом режиме функция на время оптимизации заменяется
+        # сэмплером: все вычисления идут по текущему мини-батчу
+        func = self._current_func
+        if state is None:
+            rule = self._make_rule(kwargs.get('update_rule', self.update_rule))
+            sampler = self._make_sampler(kwargs)
+        else:
+            # Продолжение: моменты правила и порядок батчей сохраняются
+            rule, sampler = state.data['rule'], state.data['sampler']
+            if sampler is not None:
+                # Сэмплер из архива или пула процессов хранится без функции
+                sampler.bind(func)
+        if sampler is not None:
+            self.set_func(sampler)
+        try:
+            if state is not None:
+                value, gradient = state.value, state.gradient
+            else:
+                if sampler is not None:
+                    sampler.next_batch(current_point)
+                value, gradient = self.value_and_grad(current_point)
+            for _ in range(max_iters):
+                if self._check_stopping(trajectory, current_point, value, np.linalg.norm(gradient)):
+                    break
+                with metrics.phase('step'):
+                    current_point, value, gradient = rule.step(self, current_point, value, gradient, lr)
+                    if sampler is not None:
+                        # Новая точка оценивается уже по следующему батчу
+                        sampler.next_batch(current_point)
+                        value = gradient = None
+                    value, gradient = self._complete_evaluation(current_point, value, gradient)
+                with metrics.phase('record'):
+                    trajectory.append(current_point)
+                metrics.iteration_done()
+                if self._stream_cancelled():
+                    break
+            self._finish_stopping(trajectory, current_point, value, np.linalg.norm(gradient))
+        finally:
+            self.set_func(func)
+        trajectory.state = OptimizationState(owner, value, gradient, rule=rule, sampler=sampler)
+        metrics.report()
+        self._stream_finished()
+        return trajectory.trim()
+
+    def _complete_evaluation(self, point, value, gradient):
+        """Довычисляет значение и градиент, не найденные правилом обновления."""
+        if gradient is None:
+            if value is None:
+                return self.value_and_grad(point)
+            return value, self.calculate_gradient(point)
+        return value, gradient
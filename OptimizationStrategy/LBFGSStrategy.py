@@ -0,0 +1,44 @@
+from collections import deque
+
+from OptimizationStrategy.NewtonTypeStrategy import NewtonTypeStrategy
+
+
+class LBFGSStrategy(NewtonTypeStrategy):
+    """
+    Квазиньютоновский метод L-BFGS с ограниченной памятью.
+
+    Направление вычисляется двухпроходной рекурсией по последним memory
+    парам (s, y) без построения матрицы, поэтому гессиан не используется.
+
+    Дополнительные аргументы optimize:
+        memory: Число хранимых пар (s, y) (по умолчанию 10)
+    """
+
+    def _reset(self, point, memory=10, **kwargs):
+        self._pairs = deque(maxlen=memory)
+
+    def _model(self):
+        return self._pairs
+
+    def _restore_model(self, model):
+        self._pairs = model
+
+    def _direction(self, point, gradient):
+        q = gradient.copy()
+        alphas = []
+        for s, y, rho in reversed(self._pairs):
+            alpha = rho * (s @ q)
+            q -= alpha * y
+            alphas.append(alpha)
+        if self._pairs:
+            s, y, _ = self._pairs[-1]
+            q *= (s @ y) / (y @ y)
+        for (s, y, rho), alpha in zip(self._pairs, reversed(alphas)):
+            beta = rho * (y @ q)
+            q += (alpha - beta) * s
+        return -q
+
+    def _update(self, s, y):
+        curvature = s @ y
+        if curvature > 1e-12:
+            self._pairs.append((s, y, 1.0 / curvature))
\ No newline at end of file
@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+
+
+class MinibatchSampler:
+    """
+    Мини-батчи строк набора данных для стохастического градиентного спуска.
+
+    Строки перемешиваются в начале каждой эпохи и берутся подряд по
+    batch_size, так что за эпоху каждая строка используется один раз.
+    Номера строк батча сортируются, чтобы отображенный в память массив
+    читался по возрастанию адресов.
+
+    В режиме SVRG каждые epoch_length итераций запоминается опорная точка
+    w~ и полный градиент в ней (проход по всем данным), а градиент батча B
+    заменяется оценкой с уменьшенной дисперсией
+    g_B(w) - g_B(w~) + grad f(w~).
+
+    Интерфейс - методы VectorFunction по текущему батчу, поэтому сэмплер
+    подставляется вместо функции: strategy.set_func(sampler).
+
+    При сериализации (состояние запуска в архиве, передача в пул процессов)
+    сохраняется только порядок батчей и опорная точка SVRG, без функции:
+    продолжение запуска привязывает сэмплер к функции стратегии (bind).
+
+    Attributes:
+        func: Функция с методами batch_* (DatasetFunction)
+        batch_size: Число строк в батче
+        svrg: Режим SVRG
+        epoch_length: Число итераций между опорными точками SVRG
+        rows: Номера строк текущего батча
+        full_passes: Число полных проходов по данным (опорные точки SVRG)
+    """
+
+    def __init__(self, func, batch_size, svrg=False, epoch_length=None, seed=None):
+        if not hasattr(func, 'batch_value_and_gradient'):
+            raise ValueError("Стохастический режим требует функцию над набором данных")
+        self.func = func
+        self.dimension = func.dimension
+        self.batch_size = min(batch_size, func.n_samples)
+        self.svrg = svrg
+        self.epoch_length = epoch_length or math.ceil(func.n_samples / self.batch_size)
+        self.rows = None
+        self.full_passes = 0
+        self._rng = np.random.default_rng(seed)
+        self._order = None
+        self._position = 0
+        self._step = 0
+        self._snapshot = None
+        self._full_gradient = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['func'] = None
+        return state
+
+    def bind(self, func):
+        """Привязывает сэмплер к функции над набором данных."""
+        self.func = func
+
+    def next_batch(self, point):
+        """
+        Выбирает батч следующей итерации.
+
+        Args:
+            point: Текущая точка (опорная точка SVRG в начале эпохи)
+        """
+        if self.svrg and self._step % self.epoch_length == 0:
+            self._snapshot = np.array(point, dtype=float)
+            self._full_gradient = self.func.gradient(self._snapshot)
+            self.full_passes += 1
+        self._step += 1
+
+        n_samples = self.func.n_samples
+        if self._order is None or self._position + self.batch_size > n_samples:
+            self._order = self._rng.permutation(n_samples)
+            self._position = 0
+        self.rows = np.sort(self._order[self._position:self._position + self.batch_size])
+        self._position += self.batch_size
+
+    def value(self, X):
+        return self.func.batch_value(X, self.rows)
+
+    def gradient(self, X):
+        return self.value_and_gradient(X)[1]
+
+    def value_and_gradient(self, X):
+        value, gradient = self.func.batch_value_and_gradient(X, self.rows)
+        if self.svrg:
+            gradient = gradient - self.func.batch_gradient(self._snapshot, self.rows) + self._full_gradient
+        return value, gradient
@@ -0,0 +1,35 @@
+import numpy as np
+
+from OptimizationStrategy.BFGSStrategy import BFGSStrategy
+
+
+class NewtonStrategy(BFGSStrategy):
+    """
+    Метод Ньютона с аналитическим гессианом.
+
+    Гессиан исправляется до положительно определенного заменой собственных
+    значений их модулями. Если функция не предоставляет гессиан, метод
+    переходит на квазиньютоновские обновления BFGS.
+    """
+
+    def _reset(self, point, **kwargs):
+        if not self.has_hessian():
+            super()._reset(point, **kwargs)
+
+    def _model(self):
+        # С аналитическим гессианом модель кривизны не накапливается
+        return None if self.has_hessian() else super()._model()
+
+    def _restore_model(self, model):
+        if not self.has_hessian():
+            super()._restore_model(model)
+
+    def _direction(self, point, gradient):
+        if not self.has_hessian():
+            return super()._direction(point, gradient)
+        hessian = self._positive_definite(self.calculate_hessian(point))
+        return -np.linalg.solve(hessian, gradient)
+
+    def _update(self, s, y):
+        if not self.has_hessian():
+            super()._update(s, y)
\ No newline at end of file
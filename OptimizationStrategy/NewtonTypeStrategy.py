@@ -0,0 +1,116 @@
+from abc import abstractmethod
+
+import numpy as np
+
+from OptimizationStrategy.OptimizationState import OptimizationState
+from OptimizationStrategy.OptimizationStrategy import OptimizationStrategy
+from TestFunctions.BealeFunction import BealeFunction
+
+
+class NewtonTypeStrategy(OptimizationStrategy):
+    """
+    Общий цикл методов ньютоновского типа.
+
+    Подкласс задает направление спуска и обновление модели кривизны, а
+    длина шага выбирается дроблением от единичного шага до выполнения
+    условия Армихо. Параметр lr не используется: в методах ньютоновского
+    типа естественная длина шага равна 1.
+
+    Дополнительные аргументы optimize:
+        c1: Константа условия Армихо (по умолчанию 1e-4)
+        max_backtracks: Максимальное число дроблений шага (по умолчанию 50)
+    """
+
+    def __init__(self):
+        super().__init__(BealeFunction)
+
+    def supports_batch(self, **kwargs):
+        # Модель кривизны и дробление шага у каждой точки свои
+        return False
+
+    def optimize(self, initial_point, lr, max_iters, tolerance, c1=1e-4, max_backtracks=50, **kwargs):
+        metrics = self.metrics
+        metrics.reset()
+        owner = self._state_owner(kwargs)
+        trajectory, state = self._start_trajectory(initial_point, max_iters, kwargs)
+        self._start_stopping(tolerance, kwargs)
+        self._stream_started(trajectory)
+        current_point = np.array(trajectory.final_point, dtype=float)
+        if state is None:
+            value, gradient = self.value_and_grad(current_point)
+            self._reset(current_point, **kwargs)
+        else:
+            # Продолжение: модель кривизны накоплена предыдущим запуском
+            value, gradient = state.value, state.gradient
+            self._restore_model(state.data['model'])
+        for _ in range(max_iters):
+            grad_norm = np.linalg.norm(gradient)
+            if self._check_stopping(trajectory, current_point, value, grad_norm):
+                break
+            with metrics.phase('step'):
+                current_point, value, gradient = self._newton_step(
+                    current_point, value, gradient, grad_norm, c1, max_backtracks, **kwargs
+                )
+            with metrics.phase('record'):
+                trajectory.append(current_point)
+            metrics.iteration_done()
+            if self._stream_cancelled():
+                break
+        self._finish_stopping(trajectory, current_point, value, np.linalg.norm(gradient))
+        trajectory.state = OptimizationState(owner, value, gradient, model=self._model())
+        metrics.report()
+        self._stream_finished()
+        return trajectory.trim()
+
+    def _newton_step(self, current_point, value, gradient, grad_norm, c1, max_backtracks, **kwargs):
+        """Шаг по направлению модели с дроблением до условия Армихо и обновление модели."""
+        direction = self._direction(current_point, gradient)
+        slope = gradient @ direction
+        if not slope < 0:
+            # Модель кривизны не дает направления спуска - шаг по антиградиенту
+            self._reset(current_point, **kwargs)
+            direction = -gradient
+            slope = -grad_norm ** 2
+
+        step_size = 1.0
+        for _ in range(max_backtracks):
+            new_point = current_point + step_size * direction
+            new_value = self.calculate_func(new_point)
+            if new_value <= value + c1 * step_size * slope:
+                break
+            step_size *= 0.5
+        new_gradient = self.calculate_gradient(new_point)
+
+        self._update(new_point - current_point, new_gradient - gradient)
+        return new_point, new_value, new_gradient
+
+    @abstractmethod
+    def _reset(self, point, **kwargs):
+        """Сбрасывает модель кривизны в точке point."""
+        pass
+
+    @abstractmethod
+    def _model(self):
+        """Возвращает модель кривизны для продолжения запуска."""
+        pass
+
+    @abstractmethod
+    def _restore_model(self, model):
+        """Восстанавливает модель кривизны, возвращенную _model."""
+        pass
+
+    @abstractmethod
+    def _direction(self, point, gradient):
+        """Возвращает направление шага в точке point."""
+        pass
+
+    @abstractmethod
+    def _update(self, s, y):
+        """
+        Обновляет модель кривизны по сделанному шагу.
+
+        Args:
+            s: Разность точек x_{k+1} - x_k
+            y: Разность градиентов g_{k+1} - g_k
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,24 @@
+class OptimizationState:
+    """
+    Внутреннее состояние стратегии в конце запуска, достаточное для его
+    продолжения без повторных вычислений.
+
+    Состояние записывается в траекторию (Trajectory.state) и передается
+    продолжению запуска (OptimizationStrategy.resume), которое изменяет
+    его объекты на месте, поэтому состояние используется один раз.
+
+    Attributes:
+        owner: Описание стратегии и функции, создавших состояние:
+            продолжить запуск с этим состоянием может только стратегия
+            с таким же описанием
+        value: Значение функции в последней точке пути
+        gradient: Градиент в последней точке пути или None (симплекс-метод)
+        data: Словарь внутреннего состояния стратегии (правило обновления,
+            модель кривизны, симплекс, сэмплер мини-батчей)
+    """
+
+    def __init__(self, owner, value, gradient=None, **data):
+        self.owner = owner
+        self.value = value
+        self.gradient = gradient
+        self.data = data
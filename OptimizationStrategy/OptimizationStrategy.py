@@ -1,17 +1,293 @@
 from abc import abstractmethod, ABC
 
+import numpy as np
+
+from OptimizationStrategy.StrategyMetrics import StrategyMetrics
+from OptimizationStrategy.Trajectory import Trajectory
+from StoppingCriterion.GradientNormCriterion import GradientNormCriterion
+from StoppingCriterion.NonFiniteCriterion import NonFiniteCriterion
+
 
 class OptimizationStrategy(ABC):
+    """
+    Базовый класс стратегии оптимизации.
+
+    Функция вызывается через методы calculate_func, calculate_gradient,
+    value_and_grad и calculate_hessian от массива точек X формы (..., d),
+    поэтому стратегии не зависят от размерности задачи.
+
+    Остановка определяется списком критериев stopping_criteria
+    (StoppingCriterion), которые проверяются перед каждым шагом; по
+    умолчанию - норма градиента и расхождение. Дополнительные критерии
+    для одного запуска передаются аргументом optimize stopping_criteria.
+    Причина остановки записывается в траекторию.
+
+    Вместе с траекторией optimize сохраняет внутреннее состояние стратегии
+    (OptimizationState), и resume продолжает запуск с места остановки:
+    моменты, приближение гессиана, симплекс и значения в последней точке
+    не вычисляются заново. Продолжение передается optimize аргументом
+    resume - траекторией, к которой дописывается путь.
+    """
+
+    # Точность используется только критерием нормы градиента: пути с разной
+    # точностью совпадают до остановки
+    GRADIENT_TOLERANCE = True
 
     def __init__(self, func_class):
         self._current_func = func_class
+        self.metrics = StrategyMetrics()
+        # Передача точек по мере вычисления и отмена (TrajectoryStream)
+        self.stream = None
+        self.stopping_criteria = self.default_criteria()
+        self._criteria = []
+
+    def default_criteria(self):
+        """Критерии остановки, проверяемые во всех запусках стратегии."""
+        return [GradientNormCriterion(), NonFiniteCriterion()]
 
     def set_func(self, func_class):
         self._current_func = func_class
 
-    def calculate_func(self, x, y):
-        return self._current_func.calculate_func(x, y)
+    def get_func(self):
+        return self._current_func
+
+    @staticmethod
+    def _count(X):
+        """Число точек в массиве формы (..., d)."""
+        return np.size(X) // np.shape(X)[-1]
+
+    def calculate_func(self, X):
+        self.metrics.func_evals += self._count(X)
+        with self.metrics.phase('evaluate'):
+            return self._current_func.value(X)
+
+    def calculate_gradient(self, X):
+        self.metrics.grad_evals += self._count(X)
+        with self.metrics.phase('evaluate'):
+            return self._current_func.gradient(X)
+
+    def value_and_grad(self, X):
+        self.metrics.func_evals += self._count(X)
+        self.metrics.grad_evals += self._count(X)
+        with self.metrics.phase('evaluate'):
+            return self._current_func.value_and_gradient(X)
+
+    def calculate_hessian(self, X):
+        self.metrics.hessian_evals += self._count(X)
+        with self.metrics.phase('evaluate'):
+            return self._current_func.hessian(X)
+
+    def has_hessian(self):
+        return hasattr(self._current_func, 'hessian')
+
+    def _stream_started(self, trajectory):
+        if self.stream is not None:
+            self.stream.start(trajectory)
+
+    def _stream_cancelled(self):
+        """Передает новые точки траектории и проверяет флаг отмены."""
+        return self.stream is not None and self.stream.update()
+
+    def _stream_finished(self):
+        if self.stream is not None:
+            self.stream.finish()
+
+    def _start_stopping(self, tolerance, kwargs):
+        """Сбрасывает критерии остановки перед новой оптимизацией."""
+        self._criteria = list(self.stopping_criteria) + list(kwargs.get('stopping_criteria', ()))
+        for criterion in self._criteria:
+            criterion.reset(self, tolerance)
+
+    def _check_stopping(self, trajectory, point, value, grad_norm):
+        """
+        Записывает значение и норму градиента в последней точке пути и
+        проверяет критерии остановки.
+
+        Returns:
+            bool: True, если сработал критерий (причина записана в траекторию)
+        """
+        with self.metrics.phase('stopping'):
+            fired = next((criterion for criterion in self._criteria
+                          if criterion.check(self, point, value, grad_norm)), None)
+        with self.metrics.phase('record'):
+            trajectory.record(value, grad_norm)
+        if fired is None:
+            return False
+        trajectory.stop(fired.reason, fired.converged)
+        return True
+
+    def _finish_stopping(self, trajectory, point, value, grad_norm):
+        """
+        Завершает путь, прерванный по max_iters или отмене: последняя точка
+        проверяется критериями, иначе записывается причина прерывания.
+        """
+        if trajectory.termination_reason is not None:
+            return
+        if not self._check_stopping(trajectory, point, value, grad_norm):
+            cancelled = self.stream is not None and self.stream.cancelled
+            trajectory.stop(Trajectory.CANCELLED if cancelled else Trajectory.MAX_ITERS)
+
+    def _state_owner(self, kwargs):
+        """Описание стратегии и функции, которым подходит сохраненное состояние."""
+        # Тестовые функции передаются классами, функции над данными - экземплярами
+        func = self._current_func
+        return type(self).__name__, (func if isinstance(func, type) else type(func)).__name__
+
+    def _start_trajectory(self, initial_point, max_iters, kwargs):
+        """
+        Создает траекторию запуска: новую из initial_point или продолжение
+        траектории kwargs['resume'].
+
+        Состояние продолжаемой траектории забирается из нее; если его нет
+        или его создала другая стратегия, запуск продолжается из последней
+        точки с новым внутренним состоянием.
+
+        Returns:
+            tuple: (траектория, OptimizationState для продолжения или None)
+        """
+        previous = kwargs.get('resume')
+        if previous is None:
+            return Trajectory(initial_point, max_iters), None
+        state, previous.state = previous.state, None
+        if state is not None and state.owner != self._state_owner(kwargs):
+            state = None
+        return previous.continued(max_iters), state
 
     @abstractmethod
     def optimize(self, initial_point, lr, max_iters, tolerance, **kwargs):
         pass
+
+    def resume(self, trajectory, lr, max_iters, tolerance, **kwargs):
+        """
+        Продолжает запуск, закончившийся траекторией trajectory, еще на
+        max_iters итераций.
+
+        Args:
+            trajectory: Траектория предыдущего запуска этой стратегии
+            lr: Шаг обучения
+            max_iters: Число итераций продолжения
+            tolerance: Точность остановки
+
+        Returns:
+            Trajectory: Новая траектория: пройденный путь и его продолжение
+        """
+        return self.optimize(trajectory.final_point, lr, max_iters, tolerance,
+                             resume=trajectory, **kwargs)
+
+    def optimize_many(self, initial_points, lr, max_iters, tolerance, **kwargs):
+        """
+        Пакетная оптимизация из множества начальных точек.
+
+        Все активные точки делают шаг одним векторизованным вызовом,
+        сошедшиеся точки исключаются из рабочего набора. Если пакетный шаг
+        не совпадает с шагом optimize (supports_batch), запуски выполняются
+        по одному.
+
+        Args:
+            initial_points: Массив начальных точек формы (N, d)
+            lr: Шаг обучения
+            max_iters: Максимальное число итераций для каждой точки
+            tolerance: Точность остановки
+
+        Returns:
+            tuple: (final_points (N, d), iterations (N,), converged (N,))
+        """
+        initial_points = np.asarray(initial_points, dtype=float)
+        if not self.supports_batch(**kwargs):
+            return self._optimize_each(initial_points, lr, max_iters, tolerance, **kwargs)
+        self._start_stopping(tolerance, kwargs)
+        final_points = initial_points.reshape(-1, initial_points.shape[-1]).copy()
+        iterations = np.zeros(len(final_points), dtype=np.int64)
+        converged = np.zeros(len(final_points), dtype=bool)
+
+        # Рабочий набор: индексы активных точек и их текущие координаты
+        active = np.arange(len(final_points))
+        work = final_points.copy()
+
+        self.metrics.reset()
+        gradient = self.calculate_gradient(work)
+        for iteration in range(max_iters + 1):
+            # Остановка проверяется до шага: точка остается там, где
+            # сработал критерий
+            with self.metrics.phase('stopping'):
+                done, failed = self._batch_stopping(work, gradient, tolerance)
+            stopped = done | failed
+            if stopped.any():
+                final_points[active[stopped]] = work[stopped]
+                converged[active[done]] = True
+                active, work, gradient = active[~stopped], work[~stopped], gradient[~stopped]
+            if active.size == 0 or iteration == max_iters:
+                break
+            with self.metrics.phase('step'):
+                work, gradient = self._batch_step(work, gradient, lr, **kwargs)
+            iterations[active] += 1
+            self.metrics.iteration_done()
+
+        final_points[active] = work
+        return final_points, iterations, converged
+
+    def supports_batch(self, **kwargs):
+        """
+        Совпадает ли пакетный шаг _batch_step с шагом optimize при данных
+        аргументах. Базовый пакетный шаг - градиентный шаг постоянной длины.
+
+        Пакетная проверка остановки _batch_stopping повторяет только
+        критерии по умолчанию, поэтому с другим набором критериев
+        (stopping_criteria стратегии или запуска) запуски выполняются по одному.
+        """
+        criteria = list(self.stopping_criteria) + list(kwargs.get('stopping_criteria', ()))
+        return ([type(criterion) for criterion in criteria]
+                == [type(criterion) for criterion in self.default_criteria()])
+
+    def _optimize_each(self, initial_points, lr, max_iters, tolerance, **kwargs):
+        """Пакетная оптимизация последовательными вызовами optimize."""
+        initial_points = initial_points.reshape(-1, initial_points.shape[-1])
+        final_points = np.empty_like(initial_points)
+        iterations = np.zeros(len(initial_points), dtype=np.int64)
+        converged = np.zeros(len(initial_points), dtype=bool)
+        for i, point in enumerate(initial_points):
+            trajectory = self.optimize(point, lr, max_iters, tolerance, **kwargs)
+            final_points[i] = trajectory.final_point
+            iterations[i] = len(trajectory) - 1
+            converged[i] = trajectory.converged
+        return final_points, iterations, converged
+
+    def _batch_step(self, points, gradient, lr, **kwargs):
+        """
+        Один шаг градиентного спуска для набора точек.
+
+        Args:
+            points: Текущие точки формы (M, d)
+            gradient: Градиенты в точках формы (M, d)
+            lr: Шаг обучения
+
+        Returns:
+            tuple: (новые точки (M, d), градиенты в них (M, d))
+        """
+        points = points - lr * gradient
+        return points, self.calculate_gradient(points)
+
+    def _batch_stopping(self, points, gradient, tolerance):
+        """
+        Критерии остановки по умолчанию (GradientNormCriterion и
+        NonFiniteCriterion) с их параметрами для набора точек. Точки с
+        нечисловыми координатами или градиентом считаются расходящимися.
+
+        Args:
+            points: Точки формы (M, d)
+            gradient: Градиенты в точках формы (M, d)
+            tolerance: Точность остановки
+
+        Returns:
+            tuple: (маска сошедшихся точек (M,), маска расходящихся точек (M,))
+        """
+        grad_norm = np.linalg.norm(gradient, axis=1)
+        done = np.zeros(len(points), dtype=bool)
+        failed = ~(np.isfinite(points).all(axis=1) & np.isfinite(gradient).all(axis=1))
+        for criterion in self._criteria:
+            if isinstance(criterion, GradientNormCriterion):
+                done |= grad_norm < (tolerance if criterion.tolerance is None else criterion.tolerance)
+            else:
+                failed |= ((np.abs(points).max(axis=1) > criterion.max_value)
+                           | (grad_norm > criterion.max_value))
+        return done & ~failed, failed
@@ -1,23 +1,273 @@
 import numpy as np
 
+from OptimizationStrategy.OptimizationState import OptimizationState
 from OptimizationStrategy.OptimizationStrategy import OptimizationStrategy
+from StoppingCriterion.NonFiniteCriterion import NonFiniteCriterion
 from TestFunctions.SimplexFunction1 import SimplexFunction1
 
 
 class SimplexStrategy(OptimizationStrategy):
+    """
+    Симплекс-метод Нелдера-Мида (без производных).
+
+    Кандидаты отражения, растяжения и двух сжатий для всех симплексов
+    вычисляются одним векторизованным вызовом calculate_func на шаг, поэтому
+    optimize_many ведет все симплексы вместе, если среди критериев остановки
+    только критерии по умолчанию (supports_batch).
+    Параметр lr не используется: размер начального симплекса задается
+    аргументом initial_step.
+
+    Сходимость определяется сжатием симплекса (причина остановки
+    SIMPLEX_REASON), поэтому среди критериев по умолчанию нет нормы
+    градиента.
+
+    Дополнительные аргументы optimize:
+        initial_step: Длина ребра начального симплекса (по умолчанию 0.5)
+        adaptive: Адаптивные коэффициенты Гао-Хана, зависящие от размерности
+        stall_iters: Число итераций без улучшения лучшей вершины до рестарта
+        max_restarts: Максимальное число рестартов
+    """
+
+    SIMPLEX_REASON = 'simplex'
+    # Точность задает сходимость и рестарты симплекса
+    GRADIENT_TOLERANCE = False
+
     def __init__(self):
         super().__init__(SimplexFunction1)
 
+    def default_criteria(self):
+        return [NonFiniteCriterion()]
+
     def optimize(self, initial_point, lr, max_iters, tolerance, **kwargs):
-        path = [initial_point.copy()]
-        current_point = initial_point.copy()
-        for _ in range(max_iters):
-            gradient = self.calculate_gradient(*current_point)
-            current_point -= lr * gradient
-            path.append(current_point.copy())
-            if np.linalg.norm(gradient) < tolerance:
+        metrics = self.metrics
+        metrics.reset()
+        owner = self._state_owner(kwargs)
+        trajectory, state = self._start_trajectory(initial_point, max_iters, kwargs)
+        self._start_stopping(tolerance, kwargs)
+        self._stream_started(trajectory)
+        point = np.array(trajectory.final_point, dtype=float)
+        if state is None:
+            simplex, values = self._initial_simplex(point[None], kwargs.get('initial_step', 0.5))
+            restart_state = self._restart_state(values)
+            value = self.calculate_func(point)
+        else:
+            # Продолжение: симплекс и счетчики рестартов сохраняются
+            simplex, values = state.data['simplex'], state.data['values']
+            restart_state, value = state.data['restart_state'], state.value
+
+        # Симплексы продолжаемого пути копируются, недостающие остаются NaN
+        offset = len(trajectory) - 1
+        simplices = np.full((offset + max_iters + 1,) + simplex.shape[1:], np.nan)
+        simplex_values = np.full((offset + max_iters + 1,) + values.shape[1:], np.nan)
+        previous = kwargs.get('resume')
+        if previous is not None and previous.simplices is not None \
+                and previous.simplices.shape[1:] == simplices.shape[1:]:
+            simplices[:offset + 1] = previous.simplices
+            simplex_values[:offset + 1] = previous.simplex_values
+        simplices[offset], simplex_values[offset] = simplex[0], values[0]
+
+        for i in range(offset, offset + max_iters):
+            if self._check_stopping(trajectory, point, value, np.nan):
+                break
+            with metrics.phase('step'):
+                simplex, values = self._step(simplex, values, **kwargs)
+            point, value = simplex[0, 0], values[0, 0]
+            with metrics.phase('record'):
+                trajectory.append(point)
+                simplices[i + 1], simplex_values[i + 1] = simplex[0], values[0]
+            with metrics.phase('stopping'):
+                converged = self._converged(simplex, values, tolerance)[0]
+            metrics.iteration_done()
+            if converged:
+                trajectory.record(value, np.nan)
+                trajectory.stop(self.SIMPLEX_REASON, True)
                 break
-        return path
+            if self._stream_cancelled():
+                break
+            with metrics.phase('step'):
+                simplex, values = self._restart_stalled(simplex, values, restart_state, tolerance, **kwargs)
+        self._finish_stopping(trajectory, point, value, np.nan)
+        trajectory.state = OptimizationState(owner, value, simplex=simplex, values=values,
+                                             restart_state=restart_state)
+
+        metrics.report()
+        self._stream_finished()
+        trajectory.trim()
+        trajectory.simplices = simplices[:len(trajectory)].copy()
+        trajectory.simplex_values = simplex_values[:len(trajectory)].copy()
+        return trajectory
+
+    def optimize_many(self, initial_points, lr, max_iters, tolerance, **kwargs):
+        initial_points = np.asarray(initial_points, dtype=float)
+        if not self.supports_batch(**kwargs):
+            return self._optimize_each(initial_points, lr, max_iters, tolerance, **kwargs)
+        self._start_stopping(tolerance, kwargs)
+        final_points = initial_points.copy()
+        iterations = np.zeros(len(initial_points), dtype=np.int64)
+        converged = np.zeros(len(initial_points), dtype=bool)
+
+        self.metrics.reset()
+        # Рабочий набор: индексы несошедшихся симплексов и их состояние
+        active = np.arange(len(initial_points))
+        simplex, values = self._initial_simplex(initial_points, kwargs.get('initial_step', 0.5))
+        restart_state = self._restart_state(values)
+
+        for iteration in range(max_iters + 1):
+            # Как в optimize: расхождение проверяется до шага, сжатие - после
+            with self.metrics.phase('stopping'):
+                failed = self._batch_failed(simplex[:, 0], values[:, 0])
+            if failed.any():
+                final_points[active[failed]] = simplex[failed, 0]
+                active, simplex, values = active[~failed], simplex[~failed], values[~failed]
+                restart_state = {key: counter[~failed] for key, counter in restart_state.items()}
+            if active.size == 0 or iteration == max_iters:
+                break
+            with self.metrics.phase('step'):
+                simplex, values = self._step(simplex, values, **kwargs)
+            iterations[active] += 1
+            self.metrics.iteration_done()
+            with self.metrics.phase('stopping'):
+                done = self._converged(simplex, values, tolerance)
+            if done.any():
+                final_points[active[done]] = simplex[done, 0]
+                converged[active[done]] = True
+                active, simplex, values = active[~done], simplex[~done], values[~done]
+                restart_state = {key: counter[~done] for key, counter in restart_state.items()}
+            with self.metrics.phase('step'):
+                simplex, values = self._restart_stalled(simplex, values, restart_state, tolerance, **kwargs)
+
+        final_points[active] = simplex[:, 0]
+        return final_points, iterations, converged
+
+    def _batch_failed(self, points, values):
+        """
+        Критерии NonFiniteCriterion запуска для лучших вершин набора
+        симплексов (supports_batch допускает только их).
+
+        Args:
+            points: Лучшие вершины формы (M, n)
+            values: Значения в них формы (M,)
+
+        Returns:
+            ndarray: Маска расходящихся симплексов (M,)
+        """
+        failed = ~(np.isfinite(values) & np.isfinite(points).all(axis=1))
+        for criterion in self._criteria:
+            failed |= ((np.abs(values) > criterion.max_value)
+                       | (np.abs(points).max(axis=1) > criterion.max_value))
+        return failed
+
+    def _evaluate(self, points):
+        """Вычисляет функцию в точках формы (..., n) одним вызовом."""
+        return self.calculate_func(points)
+
+    def _initial_simplex(self, points, initial_step):
+        """
+        Строит начальные симплексы вокруг точек.
+
+        Args:
+            points: Начальные точки формы (M, n)
+            initial_step: Длина ребра симплекса вдоль осей координат
+
+        Returns:
+            tuple: Симплексы (M, n + 1, n) и значения в вершинах (M, n + 1),
+                упорядоченные по возрастанию значения
+        """
+        n = points.shape[-1]
+        offsets = np.vstack([np.zeros(n), initial_step * np.eye(n)])
+        simplex = points[:, None, :] + offsets[None]
+        return self._sort(simplex, self._evaluate(simplex))
+
+    @staticmethod
+    def _sort(simplex, values):
+        order = np.argsort(values, axis=1)
+        return (np.take_along_axis(simplex, order[:, :, None], axis=1),
+                np.take_along_axis(values, order, axis=1))
+
+    @staticmethod
+    def _coefficients(n, adaptive=False):
+        """Коэффициенты отражения, растяжения, сжатия и редукции."""
+        if adaptive:
+            return 1.0, 1.0 + 2.0 / n, 0.75 - 0.5 / n, 1.0 - 1.0 / n
+        return 1.0, 2.0, 0.5, 0.5
+
+    def _step(self, simplex, values, adaptive=False, **kwargs):
+        """
+        Одна итерация Нелдера-Мида для набора упорядоченных симплексов.
+
+        Args:
+            simplex: Симплексы формы (M, n + 1, n)
+            values: Значения в вершинах формы (M, n + 1)
+            adaptive: Использовать адаптивные коэффициенты
+
+        Returns:
+            tuple: Новые упорядоченные симплексы и значения в вершинах
+        """
+        rho, chi, gamma, sigma = self._coefficients(simplex.shape[-1], adaptive)
+        centroid = simplex[:, :-1].mean(axis=1)
+        direction = centroid - simplex[:, -1]
+
+        # Отражение, растяжение, внешнее и внутреннее сжатие - одним вызовом
+        scales = np.array([rho, rho * chi, rho * gamma, -gamma])
+        candidates = centroid[:, None, :] + scales[None, :, None] * direction[:, None, :]
+        f = self._evaluate(candidates)
+        f_reflect, f_expand, f_outside, f_inside = f.T
+
+        best, second_worst, worst = values[:, 0], values[:, -2], values[:, -1]
+        expand = (f_reflect < best) & (f_expand < f_reflect)
+        reflect = ~expand & (f_reflect < second_worst)
+        outside = (f_reflect >= second_worst) & (f_reflect < worst) & (f_outside <= f_reflect)
+        inside = (f_reflect >= worst) & (f_inside < worst)
+        shrink = ~(expand | reflect | outside | inside)
+
+        # Худшая вершина заменяется кандидатом только без редукции: при
+        # редукции к лучшей вершине стягиваются исходные вершины
+        rows = np.flatnonzero(~shrink)
+        choice = np.select([expand, outside, inside], [1, 2, 3], default=0)[rows]
+        simplex = simplex.copy()
+        values = values.copy()
+        simplex[rows, -1] = candidates[rows, choice]
+        values[rows, -1] = f[rows, choice]
+
+        if shrink.any():
+            best_vertex = simplex[shrink, :1]
+            simplex[shrink, 1:] = best_vertex + sigma * (simplex[shrink, 1:] - best_vertex)
+            values[shrink, 1:] = self._evaluate(simplex[shrink, 1:])
+
+        return self._sort(simplex, values)
+
+    @staticmethod
+    def _converged(simplex, values, tolerance):
+        """Маска симплексов, сжавшихся по значениям и по координатам."""
+        f_spread = np.max(np.abs(values[:, 1:] - values[:, :1]), axis=1)
+        x_spread = np.max(np.abs(simplex[:, 1:] - simplex[:, :1]), axis=(1, 2))
+        return (f_spread <= tolerance) & (x_spread <= tolerance)
+
+    @staticmethod
+    def _restart_state(values):
+        """Счетчики для рестартов: лучшее значение, итерации без улучшения, число рестартов."""
+        return {
+            'best': values[:, 0].copy(),
+            'stall': np.zeros(len(values), dtype=np.int64),
+            'restarts': np.zeros(len(values), dtype=np.int64),
+        }
+
+    def _restart_stalled(self, simplex, values, state, tolerance,
+                         initial_step=0.5, stall_iters=50, max_restarts=5, **kwargs):
+        """
+        Перезапускает симплексы, лучшая вершина которых не улучшилась более
+        чем на tolerance за stall_iters итераций: новый симплекс строится
+        вокруг лучшей вершины. Счетчики state обновляются на месте.
+        """
+        improved = values[:, 0] < state['best'] - tolerance
+        state['best'][improved] = values[improved, 0]
+        state['stall'][:] = np.where(improved, 0, state['stall'] + 1)
+        stalled = (state['stall'] >= stall_iters) & (state['restarts'] < max_restarts)
+        if not stalled.any():
+            return simplex, values
 
-    def calculate_gradient(self, x, y):
-        return self._current_func.calculate_gradient(x, y)
\ No newline at end of file
+        simplex, values = simplex.copy(), values.copy()
+        simplex[stalled], values[stalled] = self._initial_simplex(simplex[stalled, 0], initial_step)
+        state['stall'][stalled] = 0
+        state['restarts'][stalled] += 1
+        return simplex, values
@@ -0,0 +1,122 @@
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+
+class _PhaseTimer:
+    """Контекстный менеджер, добавляющий время блока к фазе."""
+
+    def __init__(self, phase_times, name):
+        self._phase_times = phase_times
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self._phase_times[self._name] += time.perf_counter() - self._start
+
+
+class StrategyMetrics:
+    """
+    Инструментирование стратегии оптимизации.
+
+    Счетчики вычислений ведутся всегда. Таймеры фаз и выборка длительности
+    итераций включаются флагами, в выключенном состоянии phase() возвращает
+    пустой контекстный менеджер.
+
+    Фазы: 'evaluate' - вычисление функции, градиента и гессиана;
+    'step' - выбор новой точки (включая вычисления внутри линейного поиска);
+    'stopping' - проверка критерия остановки; 'record' - запись траектории.
+    Время фаз включающее: 'evaluate' входит и в 'step'.
+
+    Attributes:
+        timing: Включены ли таймеры фаз
+        sample_every: Период выборки длительности итераций (0 - выключено)
+        report_every: Период вызова обработчиков в итерациях
+        func_evals: Число вычисленных значений функции (по точкам)
+        grad_evals: Число вычисленных градиентов (по точкам)
+        hessian_evals: Число вычисленных гессианов (по точкам)
+        iterations: Число выполненных итераций
+        phase_times: Суммарное время фаз в секундах
+        latency_samples: Выборка длительностей итераций в секундах
+    """
+
+    PHASES = ('evaluate', 'step', 'stopping', 'record')
+
+    def __init__(self, timing=False, sample_every=0, report_every=100):
+        self.timing = timing
+        self.sample_every = sample_every
+        self.report_every = report_every
+        self._callbacks = []
+        self._null_phase = nullcontext()
+        self.reset()
+
+    def reset(self):
+        """Сбрасывает счетчики перед новым запуском (обработчики сохраняются)."""
+        self.func_evals = 0
+        self.grad_evals = 0
+        self.hessian_evals = 0
+        self.iterations = 0
+        self.phase_times = dict.fromkeys(self.PHASES, 0.0)
+        self._timers = {name: _PhaseTimer(self.phase_times, name) for name in self.PHASES}
+        self.latency_samples = []
+        self._last_iteration = time.perf_counter()
+
+    def phase(self, name):
+        return self._timers[name] if self.timing else self._null_phase
+
+    def add_callback(self, callback):
+        """
+        Добавляет обработчик, получающий snapshot() каждые report_every итераций.
+
+        Args:
+            callback: Функция от словаря метрик
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self._callbacks.remove(callback)
+
+    def iteration_done(self):
+        """Отмечает конец итерации: выборка длительности и вызов обработчиков."""
+        self.iterations += 1
+        if self.sample_every:
+            now = time.perf_counter()
+            if self.iterations % self.sample_every == 0:
+                self.latency_samples.append(now - self._last_iteration)
+            self._last_iteration = now
+        if self._callbacks and self.iterations % self.report_every == 0:
+            self.report()
+
+    def report(self):
+        """Передает текущие метрики всем обработчикам."""
+        snapshot = self.snapshot()
+        for callback in self._callbacks:
+            callback(snapshot)
+
+    def snapshot(self):
+        """
+        Возвращает текущие метрики.
+
+        Returns:
+            dict: Счетчики, время фаз и статистика выборки длительностей
+        """
+        snapshot = {
+            'iterations': self.iterations,
+            'func_evals': self.func_evals,
+            'grad_evals': self.grad_evals,
+            'hessian_evals': self.hessian_evals,
+            'phase_times': dict(self.phase_times),
+        }
+        if self.latency_samples:
+            samples = np.array(self.latency_samples)
+            snapshot['latency'] = {
+                'mean': float(samples.mean()),
+                'p50': float(np.percentile(samples, 50)),
+                'p95': float(np.percentile(samples, 95)),
+                'max': float(samples.max()),
+            }
+        return snapshot
@@ -0,0 +1,66 @@
+import importlib
+
+
+class StrategyRegistry:
+    """
+    Реестр стратегий оптимизации по коротким именам.
+
+    Модуль стратегии импортируется только при создании экземпляра, поэтому
+    обращение к реестру не загружает неиспользуемые стратегии.
+
+    Запись: имя -> (отображаемое имя, модуль, класс, аргументы конструктора).
+    """
+
+    STRATEGIES = {
+        'gd': ("Градиентный спуск",
+               'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy', {}),
+        'gd-armijo': ("Градиентный спуск (Армихо)",
+                      'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+                      {'update_rule': 'armijo'}),
+        'gd-wolfe': ("Градиентный спуск (Вулф)",
+                     'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+                     {'update_rule': 'wolfe'}),
+        'heavy-ball': ("Тяжелый шарик",
+                       'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+                       {'update_rule': 'heavy_ball'}),
+        'nesterov': ("Метод Нестерова",
+                     'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+                     {'update_rule': 'nesterov'}),
+        'adam': ("Adam",
+                 'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+                 {'update_rule': 'adam'}),
+        'bb': ("Барзилай-Борвейн",
+               'OptimizationStrategy.GradientDescentStrategy', 'GradientDescentStrategy',
+               {'update_rule': 'bb'}),
+        'nelder-mead': ("Симплекс-метод", 'OptimizationStrategy.SimplexStrategy', 'SimplexStrategy', {}),
+        'newton': ("Метод Ньютона", 'OptimizationStrategy.NewtonStrategy', 'NewtonStrategy', {}),
+        'bfgs': ("BFGS", 'OptimizationStrategy.BFGSStrategy', 'BFGSStrategy', {}),
+        'lbfgs': ("L-BFGS", 'OptimizationStrategy.LBFGSStrategy', 'LBFGSStrategy', {}),
+    }
+
+    @classmethod
+    def names(cls):
+        return list(cls.STRATEGIES)
+
+    @classmethod
+    def display_name(cls, name):
+        return cls.STRATEGIES[name][0]
+
+    @classmethod
+    def class_name(cls, name):
+        """Имя класса стратегии без импорта ее модуля."""
+        return cls.STRATEGIES[name][2]
+
+    @classmethod
+    def create(cls, name):
+        """
+        Создает стратегию по имени.
+
+        Args:
+            name: Короткое имя из STRATEGIES
+
+        Returns:
+            OptimizationStrategy: Новый экземпляр стратегии
+        """
+        _, module, class_name, kwargs = cls.STRATEGIES[name]
+        return getattr(importlib.import_module(module), class_name)(**kwargs)
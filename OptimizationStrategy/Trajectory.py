@@ -0,0 +1,183 @@
+import heapq
+
+import numpy as np
+
+
+class Trajectory:
+    """
+    Траектория оптимизации в предвыделенном буфере.
+
+    Хранит точки пути, значения функции и нормы градиента в массивах
+    размера (max_iters + 1), которые обрезаются по завершении оптимизации.
+
+    Attributes:
+        points: Точки пути формы (n, d)
+        values: Значения функции в точках пути формы (n,)
+        grad_norms: Нормы градиента в точках пути формы (n,)
+        simplices: Симплексы на каждой итерации формы (n, d + 1, d)
+            для симплекс-метода, иначе None
+        simplex_values: Значения функции в вершинах симплексов формы
+            (n, d + 1), иначе None
+        termination_reason: Причина остановки (reason критерия остановки,
+            MAX_ITERS или CANCELLED) или None, пока оптимизация не завершена
+        converged: Закончилась ли оптимизация сходимостью
+        state: Внутреннее состояние стратегии для продолжения запуска
+            (OptimizationState) или None
+    """
+
+    MAX_ITERS = 'max_iters'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, initial_point, max_iters):
+        initial_point = np.asarray(initial_point, dtype=float)
+        self._points = np.empty((max_iters + 1, initial_point.shape[-1]))
+        self._values = np.full(max_iters + 1, np.nan)
+        self._grad_norms = np.full(max_iters + 1, np.nan)
+        self._points[0] = initial_point
+        self._size = 1
+        self.simplices = None
+        self.simplex_values = None
+        self.termination_reason = None
+        self.converged = False
+        self.state = None
+
+    @classmethod
+    def from_arrays(cls, points, values, grad_norms, simplices=None, simplex_values=None):
+        """
+        Создает завершенную траекторию из готовых массивов без копирования.
+
+        Массивы могут быть отображены в память (np.load(..., mmap_mode='r')):
+        данные читаются с диска только при обращении.
+
+        Args:
+            points: Точки пути формы (n, d)
+            values: Значения функции формы (n,)
+            grad_norms: Нормы градиента формы (n,)
+            simplices: Симплексы формы (n, d + 1, d) или None
+            simplex_values: Значения в вершинах симплексов формы (n, d + 1) или None
+
+        Returns:
+            Trajectory: Траектория длины n
+        """
+        trajectory = cls.__new__(cls)
+        trajectory._points = points
+        trajectory._values = values
+        trajectory._grad_norms = grad_norms
+        trajectory._size = len(points)
+        trajectory.simplices = simplices
+        trajectory.simplex_values = simplex_values
+        trajectory.termination_reason = None
+        trajectory.converged = False
+        trajectory.state = None
+        return trajectory
+
+    def continued(self, max_iters):
+        """
+        Создает траекторию продолжения запуска: копию пройденного пути с
+        местом для max_iters новых точек. Исходная траектория не меняется.
+
+        Args:
+            max_iters: Число итераций продолжения
+
+        Returns:
+            Trajectory: Незавершенная траектория длины len(self)
+        """
+        size = self._size
+        trajectory = Trajectory(self._points[0], size - 1 + max_iters)
+        trajectory._points[:size] = self.points
+        trajectory._values[:size] = self.values
+        trajectory._grad_norms[:size] = self.grad_norms
+        trajectory._size = size
+        return trajectory
+
+    def append(self, point):
+        """Добавляет следующую точку пути."""
+        self._points[self._size] = point
+        self._size += 1
+
+    def record(self, value, grad_norm):
+        """Записывает значение функции и норму градиента для последней точки."""
+        self._values[self._size - 1] = value
+        self._grad_norms[self._size - 1] = grad_norm
+
+    def stop(self, reason, converged=False):
+        """Записывает причину остановки оптимизации."""
+        self.termination_reason = reason
+        self.converged = converged
+
+    def trim(self):
+        """Освобождает неиспользованную часть буфера."""
+        self._points = self._points[:self._size].copy()
+        self._values = self._values[:self._size].copy()
+        self._grad_norms = self._grad_norms[:self._size].copy()
+        return self
+
+    def keyframes(self, max_frames):
+        """
+        Выбирает не более max_frames ключевых точек пути для воспроизведения.
+
+        Используется упрощение ломаной Рамера-Дугласа-Пекера в пространстве
+        (x, y, t), где t - нормированный номер итерации: сохраняются точки,
+        в которых меняется направление или длина шага. Первая и последняя
+        точки сохраняются всегда.
+
+        Args:
+            max_frames: Максимальное число кадров (не меньше 2)
+
+        Returns:
+            ndarray: Отсортированные индексы ключевых точек
+        """
+        if self._size <= max_frames:
+            return np.arange(self._size)
+
+        points = self.points
+        finite = np.isfinite(points).all(axis=1)
+        extent = np.ptp(points[finite], axis=0).max() if finite.any() else 1.0
+        curve = np.column_stack([points, np.linspace(0.0, extent or 1.0, self._size)])
+
+        heap = []
+
+        def split(start, end):
+            # Самая удаленная от хорды точка внутри отрезка [start, end]
+            if end - start < 2:
+                return
+            chord = curve[end] - curve[start]
+            offsets = curve[start + 1:end] - curve[start]
+            length = np.linalg.norm(chord)
+            if length > 0:
+                offsets = offsets - np.outer(offsets @ chord / length ** 2, chord)
+            distances = np.linalg.norm(offsets, axis=1)
+            distances[~np.isfinite(distances)] = np.inf
+            index = int(np.argmax(distances))
+            heapq.heappush(heap, (-distances[index], start, end, start + 1 + index))
+
+        keep = [0, self._size - 1]
+        split(0, self._size - 1)
+        while heap and len(keep) < max_frames:
+            _, start, end, index = heapq.heappop(heap)
+            keep.append(index)
+            split(start, index)
+            split(index, end)
+        return np.sort(keep)
+
+    @property
+    def points(self):
+        return self._points[:self._size]
+
+    @property
+    def values(self):
+        return self._values[:self._size]
+
+    @property
+    def grad_norms(self):
+        return self._grad_norms[:self._size]
+
+    @property
+    def final_point(self):
+        return self._points[self._size - 1]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        return self.points[index]
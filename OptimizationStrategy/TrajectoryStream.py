@@ -0,0 +1,77 @@
+import time
+
+
+class TrajectoryStream:
+    """
+    Передача новых точек траектории по мере вычисления и отмена оптимизации.
+
+    Стратегия вызывает update() после каждой итерации. Раз в check_every
+    итераций проверяется флаг отмены и, если с прошлой передачи прошло не
+    меньше min_interval секунд, новые точки передаются обработчику одним
+    фрагментом. Так частота сигналов в GUI ограничена независимо от
+    скорости итераций.
+
+    Передаются только точки с уже записанным значением функции: значение
+    последней точки становится известно на следующей итерации, остаток
+    передается в finish(). Продолжение запуска передает только новые
+    точки: пройденный путь, кроме последней точки, уже у получателя.
+
+    Attributes:
+        callback: Функция (индекс первой точки, точки (k, d), значения (k,))
+        token: Флаг отмены (threading.Event) или None
+        check_every: Период проверки отмены и таймера в итерациях
+        min_interval: Минимальный интервал между фрагментами в секундах
+        cancelled: Была ли оптимизация прервана по флагу отмены
+    """
+
+    def __init__(self, callback, token=None, check_every=10, min_interval=0.05):
+        self.callback = callback
+        self.token = token
+        self.check_every = check_every
+        self.min_interval = min_interval
+        self.cancelled = False
+        self._trajectory = None
+        self._sent = 0
+        self._iterations = 0
+        self._last_emit = 0.0
+
+    def start(self, trajectory):
+        """Начинает передачу новой или продолженной траектории."""
+        self._trajectory = trajectory
+        self._sent = len(trajectory) - 1
+        self._iterations = 0
+        self._last_emit = time.perf_counter()
+        self.cancelled = False
+
+    def update(self):
+        """
+        Отмечает конец итерации.
+
+        Returns:
+            bool: True, если оптимизацию нужно прервать
+        """
+        self._iterations += 1
+        if self._iterations % self.check_every:
+            return False
+        if self.token is not None and self.token.is_set():
+            self.cancelled = True
+            return True
+        now = time.perf_counter()
+        if now - self._last_emit >= self.min_interval:
+            self._emit(len(self._trajectory) - 1)
+            self._last_emit = now
+        return False
+
+    def finish(self):
+        """Передает оставшиеся точки завершенной траектории."""
+        self._emit(len(self._trajectory))
+        self._trajectory = None
+
+    def _emit(self, end):
+        if end <= self._sent:
+            return
+        # Копии: буфер траектории продолжает заполняться в другом потоке
+        points = self._trajectory.points[self._sent:end].copy()
+        values = self._trajectory.values[self._sent:end].copy()
+        self.callback(self._sent, points, values)
+        self._sent = end
@@ -0,0 +1,226 @@
+import json
+import os
+import pickle
+import time
+
+import numpy as np
+
+from OptimizationStrategy.Trajectory import Trajectory
+
+
+def _to_json(value):
+    """
+    Преобразует числа и массивы numpy в типы, сериализуемые в JSON.
+    NaN и бесконечности заменяются на None (null в JSON).
+    """
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+class RunStore:
+    """
+    Архив запусков оптимизации на диске.
+
+    Каждый запуск хранится в отдельном каталоге runs/<id> как набор файлов
+    .npy по одному на столбец траектории (точки, значения, нормы градиента,
+    симплексы). Параметры запуска и итоговая статистика дописываются
+    строкой в index.jsonl, поэтому просмотр архива читает только индекс,
+    а траектории открываются отображением в память по требованию.
+
+    Строка индекса записывается после файлов траектории: запуск, прерванный
+    на середине записи, в архиве не появляется. Идентификатор запуска
+    занимается созданием его каталога, поэтому несколько процессов могут
+    писать в один архив, а порядок строк индекса может не совпадать с
+    порядком идентификаторов.
+
+    Внутреннее состояние стратегии (Trajectory.state) сохраняется в
+    state.pkl, чтобы запуск из архива можно было продолжить. В файл
+    попадает только состояние оптимизатора (правило обновления, модель
+    кривизны, симплекс, порядок мини-батчей), но не функция и не набор
+    данных: продолжение использует функцию стратегии. Файл читается
+    через pickle, поэтому архив должен быть получен из доверенного источника.
+
+    Attributes:
+        root: Каталог архива
+    """
+
+    ARRAYS = ('points', 'values', 'grad_norms', 'simplices', 'simplex_values')
+    STATE_FILE = 'state.pkl'
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, 'runs'), exist_ok=True)
+        self._index_path = os.path.join(root, 'index.jsonl')
+        self._records = []
+        self._by_id = {}
+        self._index_offset = 0
+
+    def save(self, trajectory, params, strategy, function, metrics=None):
+        """
+        Сохраняет траекторию и параметры запуска.
+
+        Args:
+            trajectory: Траектория оптимизации (Trajectory)
+            params: Параметры optimize (lr, tolerance, max_iters, initial_point)
+            strategy: Имя стратегии оптимизации
+            function: Имя тестовой функции
+            metrics: Словарь StrategyMetrics.snapshot() или None
+
+        Returns:
+            str: Идентификатор запуска
+        """
+        run_id, run_dir = self._allocate()
+        for name in self.ARRAYS:
+            array = getattr(trajectory, name)
+            if array is not None:
+                np.save(os.path.join(run_dir, f'{name}.npy'), np.asarray(array))
+        if trajectory.state is not None:
+            with open(os.path.join(run_dir, self.STATE_FILE), 'wb') as file:
+                pickle.dump(trajectory.state, file)
+
+        record = {
+            'id': run_id,
+            'created': time.time(),
+            'strategy': strategy,
+            'function': function,
+            'params': params,
+            'summary': self.summarize(trajectory, params),
+            'metrics': metrics,
+        }
+        with open(self._index_path, 'a', encoding='utf-8') as file:
+            file.write(self.dumps(record) + '\n')
+        return run_id
+
+    def _allocate(self):
+        """
+        Занимает идентификатор нового запуска, создавая его каталог.
+
+        Каталог создается с exist_ok=False: если идентификатор уже занят
+        другим процессом, берется следующий.
+
+        Returns:
+            tuple: (идентификатор, каталог запуска)
+        """
+        number = len(os.listdir(os.path.join(self.root, 'runs')))
+        while True:
+            run_id = f"{number:06d}"
+            run_dir = os.path.join(self.root, 'runs', run_id)
+            try:
+                os.makedirs(run_dir, exist_ok=False)
+                return run_id, run_dir
+            except FileExistsError:
+                number += 1
+
+    @staticmethod
+    def dumps(value):
+        """
+        Строка JSON для записи индекса и вывода CLI: массивы numpy
+        записываются списками, NaN и бесконечности - как null.
+        """
+        return json.dumps(_to_json(value), allow_nan=False)
+
+    @staticmethod
+    def summarize(trajectory, params):
+        """
+        Итоговая статистика запуска.
+
+        Returns:
+            dict: Число итераций, признак сходимости, причина остановки,
+                конечная точка, значение функции и норма градиента в ней
+        """
+        return _to_json({
+            'iterations': len(trajectory) - 1,
+            'converged': trajectory.converged,
+            'termination_reason': trajectory.termination_reason,
+            'final_point': trajectory.final_point,
+            'final_value': trajectory.values[-1],
+            'final_grad_norm': trajectory.grad_norms[-1],
+        })
+
+    def runs(self):
+        """
+        Возвращает записи индекса всех запусков в порядке сохранения.
+
+        Индекс дочитывается с места последнего чтения, так что повторные
+        вызовы не перечитывают весь файл.
+        """
+        if not os.path.exists(self._index_path):
+            return self._records
+        with open(self._index_path, encoding='utf-8') as file:
+            file.seek(self._index_offset)
+            for line in iter(file.readline, ''):
+                if not line.endswith('\n'):
+                    # Строка еще дописывается другим процессом
+                    break
+                record = json.loads(line)
+                self._records.append(record)
+                self._by_id[record['id']] = record
+                self._index_offset = file.tell()
+        return self._records
+
+    def __len__(self):
+        return len(self.runs())
+
+    def record(self, run_id):
+        """Запись индекса запуска по идентификатору."""
+        self.runs()
+        return self._by_id[run_id]
+
+    def column(self, field):
+        """
+        Значения поля по всем запускам без загрузки траекторий.
+
+        Поле ищется в итоговой статистике, затем в параметрах запуска,
+        затем в самой записи индекса.
+
+        Returns:
+            ndarray: Значения поля в порядке запусков
+        """
+        values = []
+        for record in self.runs():
+            for source in (record['summary'], record['params'], record):
+                if field in source:
+                    values.append(source[field])
+                    break
+            else:
+                values.append(None)
+        return np.array(values)
+
+    def load(self, run_id, mmap=True):
+        """
+        Открывает траекторию запуска.
+
+        Args:
+            run_id: Идентификатор запуска
+            mmap: Отобразить массивы в память вместо чтения целиком
+
+        Returns:
+            Trajectory: Траектория запуска
+        """
+        run_dir = os.path.join(self.root, 'runs', run_id)
+        arrays = {}
+        for name in self.ARRAYS:
+            path = os.path.join(run_dir, f'{name}.npy')
+            arrays[name] = np.load(path, mmap_mode='r' if mmap else None) if os.path.exists(path) else None
+        trajectory = Trajectory.from_arrays(**arrays)
+        summary = self.record(run_id)['summary']
+        trajectory.stop(summary.get('termination_reason'), summary['converged'])
+        state_path = os.path.join(run_dir, self.STATE_FILE)
+        if os.path.exists(state_path):
+            with open(state_path, 'rb') as file:
+                trajectory.state = pickle.load(file)
+        return trajectory
+
+    def trajectories(self, run_ids=None):
+        """Поочередно открывает траектории запусков (по умолчанию всех)."""
+        if run_ids is None:
+            run_ids = [record['id'] for record in self.runs()]
+        for run_id in run_ids:
+            yield run_id, self.load(run_id)
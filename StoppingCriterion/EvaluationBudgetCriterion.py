@@ -0,0 +1,19 @@
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class EvaluationBudgetCriterion(StoppingCriterion):
+    """
+    Остановка по числу вычислений: сумма счетчиков kinds метрик стратегии
+    (значения, градиенты, гессианы) достигла max_evals.
+    """
+
+    reason = 'eval_budget'
+    converged = False
+
+    def __init__(self, max_evals, kinds=('func_evals', 'grad_evals', 'hessian_evals')):
+        self.max_evals = max_evals
+        self.kinds = tuple(kinds)
+
+    def check(self, strategy, point, value, grad_norm):
+        # Счетчики метрик сбрасываются в начале каждой оптимизации
+        return sum(getattr(strategy.metrics, kind) for kind in self.kinds) >= self.max_evals
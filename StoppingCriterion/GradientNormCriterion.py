@@ -0,0 +1,22 @@
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class GradientNormCriterion(StoppingCriterion):
+    """
+    Остановка по норме градиента: ||grad f|| < tolerance.
+
+    Если tolerance не задан, используется точность, переданная в optimize.
+    """
+
+    reason = 'gradient'
+    converged = True
+
+    def __init__(self, tolerance=None):
+        self.tolerance = tolerance
+        self._tolerance = tolerance
+
+    def reset(self, strategy, tolerance):
+        self._tolerance = tolerance if self.tolerance is None else self.tolerance
+
+    def check(self, strategy, point, value, grad_norm):
+        return grad_norm < self._tolerance
@@ -0,0 +1,27 @@
+import numpy as np
+
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class NonFiniteCriterion(StoppingCriterion):
+    """
+    Остановка расходящегося запуска: точка или значение функции не
+    конечны, либо значение, норма градиента или координата по модулю
+    превысили max_value (переполнение наступит через несколько итераций).
+
+    Норма градиента NaN не считается расхождением: так ее записывают
+    методы без производных.
+    """
+
+    reason = 'diverged'
+    converged = False
+    MAX_VALUE = 1e100
+
+    def __init__(self, max_value=MAX_VALUE):
+        self.max_value = max_value
+
+    def check(self, strategy, point, value, grad_norm):
+        if not (np.isfinite(value) and np.isfinite(point).all()):
+            return True
+        return bool(abs(value) > self.max_value or grad_norm > self.max_value
+                    or np.abs(point).max() > self.max_value)
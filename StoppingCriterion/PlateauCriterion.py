@@ -0,0 +1,33 @@
+from collections import deque
+
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class PlateauCriterion(StoppingCriterion):
+    """
+    Остановка на плато: лучшее найденное значение функции за последние
+    window итераций улучшилось не более чем на rtol * |f_best| + atol.
+    В отличие от RelativeChangeCriterion срабатывает и при колебаниях
+    значения без общего улучшения.
+    """
+
+    reason = 'plateau'
+    converged = False
+
+    def __init__(self, window=50, rtol=1e-6, atol=0.0):
+        self.window = window
+        self.rtol = rtol
+        self.atol = atol
+        self._best = deque(maxlen=window + 1)
+
+    def reset(self, strategy, tolerance):
+        self._best = deque(maxlen=self.window + 1)
+
+    def check(self, strategy, point, value, grad_norm):
+        # Последовательность лучших значений на каждой итерации
+        best = min(value, self._best[-1]) if self._best else value
+        self._best.append(best)
+        if len(self._best) <= self.window:
+            return False
+        before = self._best[0]
+        return before - best <= self.rtol * abs(before) + self.atol
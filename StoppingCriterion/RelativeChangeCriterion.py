@@ -0,0 +1,31 @@
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class RelativeChangeCriterion(StoppingCriterion):
+    """
+    Остановка по относительному изменению функции:
+    |f_k - f_(k-1)| <= rtol * max(|f_k|, |f_(k-1)|) + atol
+    на patience итерациях подряд.
+    """
+
+    reason = 'f_change'
+    converged = True
+
+    def __init__(self, rtol=1e-9, atol=0.0, patience=5):
+        self.rtol = rtol
+        self.atol = atol
+        self.patience = patience
+        self._previous = None
+        self._count = 0
+
+    def reset(self, strategy, tolerance):
+        self._previous = None
+        self._count = 0
+
+    def check(self, strategy, point, value, grad_norm):
+        previous, self._previous = self._previous, value
+        if previous is None:
+            return False
+        small = abs(value - previous) <= self.rtol * max(abs(value), abs(previous)) + self.atol
+        self._count = self._count + 1 if small else 0
+        return self._count >= self.patience
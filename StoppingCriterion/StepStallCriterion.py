@@ -0,0 +1,32 @@
+import numpy as np
+
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class StepStallCriterion(StoppingCriterion):
+    """
+    Остановка при застревании: длина шага ||x_k - x_(k-1)|| не больше
+    rtol * max(||x_k||, 1) на patience итерациях подряд. Так заканчиваются
+    запуски, у которых дробление шага уже не продвигает точку.
+    """
+
+    reason = 'step_stall'
+    converged = False
+
+    def __init__(self, rtol=1e-12, patience=5):
+        self.rtol = rtol
+        self.patience = patience
+        self._previous = None
+        self._count = 0
+
+    def reset(self, strategy, tolerance):
+        self._previous = None
+        self._count = 0
+
+    def check(self, strategy, point, value, grad_norm):
+        previous, self._previous = self._previous, np.array(point, dtype=float)
+        if previous is None:
+            return False
+        stalled = np.linalg.norm(point - previous) <= self.rtol * max(np.linalg.norm(point), 1.0)
+        self._count = self._count + 1 if stalled else 0
+        return self._count >= self.patience
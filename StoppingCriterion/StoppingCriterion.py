@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+
+
+class StoppingCriterion(ABC):
+    """
+    Критерий остановки оптимизации.
+
+    Стратегия вызывает check перед каждым шагом, в том числе в конечной
+    точке пути. Если критерий срабатывает, путь заканчивается в этой точке,
+    а траектория получает его причину остановки reason. Состояние между
+    итерациями (предыдущие значения, время начала) хранится в критерии и
+    сбрасывается reset() в начале каждой оптимизации.
+
+    Attributes:
+        reason: Причина остановки, записываемая в траекторию
+        converged: Считается ли остановка по критерию сходимостью
+    """
+
+    reason = None
+    converged = True
+
+    def reset(self, strategy, tolerance):
+        """
+        Сбрасывает состояние перед новой оптимизацией.
+
+        Args:
+            strategy: Стратегия оптимизации
+            tolerance: Точность остановки, переданная в optimize
+        """
+
+    @abstractmethod
+    def check(self, strategy, point, value, grad_norm):
+        """
+        Проверяет критерий в текущей точке.
+
+        Args:
+            strategy: Стратегия оптимизации
+            point: Текущая точка формы (d,)
+            value: Значение функции в точке
+            grad_norm: Норма градиента в точке (NaN для методов без производных)
+
+        Returns:
+            bool: True, если оптимизацию нужно остановить
+        """
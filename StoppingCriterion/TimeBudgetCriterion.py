@@ -0,0 +1,20 @@
+import time
+
+from StoppingCriterion.StoppingCriterion import StoppingCriterion
+
+
+class TimeBudgetCriterion(StoppingCriterion):
+    """Остановка по времени: с начала оптимизации прошло не меньше seconds секунд."""
+
+    reason = 'time_budget'
+    converged = False
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self._start = time.perf_counter()
+
+    def reset(self, strategy, tolerance):
+        self._start = time.perf_counter()
+
+    def check(self, strategy, point, value, grad_norm):
+        return time.perf_counter() - self._start >= self.seconds
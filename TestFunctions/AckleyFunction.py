@@ -0,0 +1,43 @@
+import numpy as np
+
+from TestFunctions.VectorFunction import VectorFunction
+
+
+class AckleyFunction(VectorFunction):
+    """
+    Функция Экли произвольной размерности:
+    f(X) = -a exp(-b sqrt(mean(x^2))) - exp(mean(cos(c x))) + a + e.
+    Почти плоская внешняя область с множеством локальных минимумов и
+    глубокий глобальный минимум f = 0 в начале координат.
+
+    Гессиан не предоставляется: метод Ньютона использует обновления BFGS.
+    """
+
+    A = 20.0
+    B = 0.2
+    C = 2.0 * np.pi
+
+    @classmethod
+    def value(cls, X):
+        X = np.asarray(X, dtype=float)
+        radius = np.sqrt(np.mean(X ** 2, axis=-1))
+        waves = np.mean(np.cos(cls.C * X), axis=-1)
+        return -cls.A * np.exp(-cls.B * radius) - np.exp(waves) + cls.A + np.e
+
+    @classmethod
+    def gradient(cls, X):
+        return cls.value_and_gradient(X)[1]
+
+    @classmethod
+    def value_and_gradient(cls, X):
+        X = np.asarray(X, dtype=float)
+        d = X.shape[-1]
+        radius = np.sqrt(np.mean(X ** 2, axis=-1))
+        waves = np.mean(np.cos(cls.C * X), axis=-1)
+        envelope = cls.A * np.exp(-cls.B * radius)
+        ripple = np.exp(waves)
+        # В начале координат радиальная составляющая градиента равна нулю
+        safe_radius = np.where(radius > 0, radius, 1.0)
+        radial = np.where(radius > 0, cls.B * envelope / (d * safe_radius), 0.0)
+        gradient = radial[..., None] * X + (ripple * cls.C / d)[..., None] * np.sin(cls.C * X)
+        return -envelope - ripple + cls.A + np.e, gradient
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CachedFunction:
+    """
+    Запоминающая обертка над тестовой функцией.
+
+    Значение, градиент и гессиан хранятся для каждой точки в общем
+    LRU-кэше. Ключ точки - точные координаты или, если задан quantum,
+    номера ячеек сетки с шагом quantum (соседние точки одной ячейки
+    получают один результат). При векторизованном вызове исходная функция
+    вычисляется одним вызовом только для точек, которых нет в кэше.
+    Интерфейс - методы VectorFunction от массива точек формы (..., d).
+
+    Обертка подставляется вместо функции: strategy.set_func(CachedFunction(...)).
+
+    Attributes:
+        wrapped: Исходный класс или экземпляр тестовой функции
+        max_entries: Максимальное число хранимых точек
+        quantum: Шаг квантования ключей или None для точных ключей
+        hits: Число точек, найденных в кэше
+        misses: Число вычисленных точек
+    """
+
+    def __init__(self, func, max_entries=100_000, quantum=None):
+        self.wrapped = func
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dimension = getattr(func, 'dimension', None)
+        # Гессиан доступен, только если его умеет вычислять исходная функция
+        if hasattr(func, 'hessian'):
+            self.hessian = self._hessian
+
+    def value(self, X):
+        return self._evaluate(('value',), self.wrapped.value, X)[0]
+
+    def gradient(self, X):
+        return self._evaluate(('gradient',), self.wrapped.gradient, X)[0]
+
+    def value_and_gradient(self, X):
+        return self._evaluate(('value', 'gradient'), self.wrapped.value_and_gradient, X)
+
+    def _hessian(self, X):
+        return self._evaluate(('hessian',), self.wrapped.hessian, X)[0]
+
+    def _keys(self, points):
+        if self.quantum is not None:
+            points = np.round(points / self.quantum).astype(np.int64)
+        return map(tuple, points.tolist())
+
+    def _evaluate(self, kinds, kernel, X):
+        """
+        Возвращает результаты kinds в точках X, вычисляя промахи kernel.
+
+        Args:
+            kinds: Имена результатов kernel ('value', 'gradient', 'hessian')
+            kernel: Метод исходной функции, возвращающий результаты kinds
+            X: Точки формы (..., d)
+
+        Returns:
+            tuple: Результаты в порядке kinds, оси точек перед компонентами
+        """
+        X = np.asarray(X, dtype=float)
+        points = X.reshape(-1, X.shape[-1])
+
+        entries = []
+        missing = []
+        for i, key in enumerate(self._keys(points)):
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {}
+            else:
+                self._entries.move_to_end(key)
+            entries.append(entry)
+            if not all(kind in entry for kind in kinds):
+                missing.append(i)
+        self.misses += len(missing)
+        self.hits += len(entries) - len(missing)
+
+        if missing:
+            results = kernel(points[missing])
+            if len(kinds) == 1:
+                results = (results,)
+            for kind, result in zip(kinds, results):
+                for i, item in zip(missing, np.asarray(result)):
+                    entries[i][kind] = item
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        outputs = []
+        for kind in kinds:
+            stacked = np.array([entry[kind] for entry in entries])
+            outputs.append(stacked.reshape(X.shape[:-1] + stacked.shape[1:])[()])
+        return tuple(outputs)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Статистика кэша: попадания, промахи, доля попаданий и размер."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'entries': len(self._entries),
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
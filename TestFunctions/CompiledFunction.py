@@ -0,0 +1,135 @@
+import inspect
+from abc import abstractmethod
+
+import numpy as np
+
+from TestFunctions.Expression import Expression
+from TestFunctions.VectorFunction import VectorFunction
+
+
+_OPERATORS = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/'}
+_FUNCTIONS = {'exp': 'np.exp', 'log': 'np.log', 'sqrt': 'np.sqrt', 'sin': 'np.sin', 'cos': 'np.cos'}
+
+
+def _stack(items, variables, dims):
+    # Приводит константные и частично зависящие компоненты к общей форме входов
+    arrays = np.broadcast_arrays(*items, *variables)[:len(items)]
+    return np.array(arrays).reshape(dims + arrays[0].shape)
+
+
+class _KernelBuilder:
+    """Генерирует исходный код ядра с общими подвыражениями."""
+
+    def __init__(self, variables):
+        self.variables = variables
+        self.names = {}
+        self.lines = []
+
+    def emit(self, node):
+        if node.op == 'const':
+            return repr(node.param)
+        if node.op == 'var':
+            return node.param
+        if node.index in self.names:
+            return self.names[node.index]
+
+        args = [self.emit(arg) for arg in node.args]
+        if node.op in _OPERATORS:
+            code = f"{args[0]} {_OPERATORS[node.op]} {args[1]}"
+        elif node.op in _FUNCTIONS:
+            code = f"{_FUNCTIONS[node.op]}({args[0]})"
+        elif node.op == 'neg':
+            code = f"-{args[0]}"
+        elif node.op == 'pow':
+            code = f"{args[0]} ** {node.param!r}"
+        elif node.op == 'clip':
+            code = f"np.clip({args[0]}, {node.param[0]!r}, {node.param[1]!r})"
+        else:
+            raise ValueError(f"Неизвестная операция: {node.op}")
+
+        name = f"t{len(self.names)}"
+        self.names[node.index] = name
+        self.lines.append(f"    {name} = {code}")
+        return name
+
+    def emit_array(self, nodes, dims):
+        codes = [self.emit(node) for node in nodes]
+        full = frozenset(self.variables)
+        if all(node.variables == full for node in nodes):
+            flat = ', '.join(codes)
+            if len(dims) == 1:
+                return f"np.array([{flat}])"
+            return f"np.array([{flat}]).reshape({dims!r} + np.shape({codes[0]}))"
+        return f"_stack(({', '.join(codes)},), ({', '.join(self.variables)},), {dims!r})"
+
+    def compile(self, name, result):
+        signature = ', '.join(self.variables)
+        source = '\n'.join([f"def {name}({signature}):", *self.lines, f"    return {result}"])
+        namespace = {'np': np, '_stack': _stack}
+        exec(compile(source, f"<{name}>", 'exec'), namespace)
+        kernel = namespace[name]
+        kernel.source = source
+        return kernel
+
+
+class CompiledFunction(VectorFunction):
+    """
+    Базовый класс тестовой функции, заданной одним выражением.
+
+    Подкласс определяет статический метод expression(x, y, ...), который
+    строит выражение из переменных. По нему при создании подкласса
+    генерируются ядра calculate_func, calculate_gradient, value_and_grad
+    и calculate_hessian. Ядра работают как со скалярами, так и с массивами
+    NumPy, а общие подвыражения функции и производных вычисляются один раз.
+
+    Ядра принимают координаты отдельными аргументами, а методы
+    VectorFunction (value, gradient, value_and_gradient, hessian) -
+    массив точек формы (..., d), где d - число переменных выражения.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def expression(x, y):
+        pass
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        variables = tuple(inspect.signature(cls.expression).parameters)
+        value = Expression.wrap(cls.expression(*map(Expression.variable, variables)))
+        gradient = [value.diff(name) for name in variables]
+        hessian = [g.diff(name) for g in gradient for name in variables]
+        n = len(variables)
+        cls.dimension = n
+
+        builder = _KernelBuilder(variables)
+        cls.calculate_func = staticmethod(builder.compile('calculate_func', builder.emit(value)))
+
+        builder = _KernelBuilder(variables)
+        result = builder.emit_array(gradient, (n,))
+        cls.calculate_gradient = staticmethod(builder.compile('calculate_gradient', result))
+
+        builder = _KernelBuilder(variables)
+        result = f"{builder.emit(value)}, {builder.emit_array(gradient, (n,))}"
+        cls.value_and_grad = staticmethod(builder.compile('value_and_grad', result))
+
+        builder = _KernelBuilder(variables)
+        result = builder.emit_array(hessian, (n, n))
+        cls.calculate_hessian = staticmethod(builder.compile('calculate_hessian', result))
+
+    @classmethod
+    def value(cls, X):
+        return cls.calculate_func(*np.moveaxis(X, -1, 0))
+
+    @classmethod
+    def gradient(cls, X):
+        return np.moveaxis(cls.calculate_gradient(*np.moveaxis(X, -1, 0)), 0, -1)
+
+    @classmethod
+    def value_and_gradient(cls, X):
+        value, gradient = cls.value_and_grad(*np.moveaxis(X, -1, 0))
+        return value, np.moveaxis(gradient, 0, -1)
+
+    @classmethod
+    def hessian(cls, X):
+        hessian = cls.calculate_hessian(*np.moveaxis(X, -1, 0))
+        return np.moveaxis(hessian, (0, 1), (-2, -1))
@@ -0,0 +1,191 @@
+import os
+
+import numpy as np
+
+from TestFunctions.VectorFunction import VectorFunction
+
+
+class DatasetFunction(VectorFunction):
+    """
+    Целевая функция - средняя потеря по строкам набора данных:
+    f(w) = 1/N sum_i loss(a_i w, b_i).
+
+    Признаки A формы (N, d) и ответы b формы (N,) обычно отображены в
+    память (load): значение, градиент и гессиан вычисляются проходом по
+    порциям из chunk_rows строк, поэтому в памяти находится только одна
+    порция данных. Методы batch_* вычисляют ту же потерю по подмножеству
+    строк (мини-батчу) для стохастических методов.
+
+    Потери:
+        'squared': 0.5 (a w - b)^2
+        'logistic': log(1 + exp(-b a w)), ответы b из {-1, 1}
+
+    Attributes:
+        features: Признаки формы (N, d)
+        targets: Ответы формы (N,)
+        loss: Имя функции потерь
+        chunk_rows: Число строк в порции при проходе по всем данным
+        root: Каталог набора данных, если он загружен через load, иначе None
+        dimension: Размерность аргумента (число признаков d)
+    """
+
+    LOSSES = ('squared', 'logistic')
+    FEATURES_FILE = 'features.npy'
+    TARGETS_FILE = 'targets.npy'
+
+    def __init__(self, features, targets, loss='squared', chunk_rows=65536):
+        if loss not in self.LOSSES:
+            raise ValueError(f"Неизвестная функция потерь: {loss}")
+        if len(features) != len(targets):
+            raise ValueError("Число строк признаков и ответов различается")
+        self.features = features
+        self.targets = targets
+        self.loss = loss
+        self.chunk_rows = chunk_rows
+        self.root = None
+        self.dimension = features.shape[1]
+
+    @classmethod
+    def load(cls, root, loss='squared', chunk_rows=65536):
+        """
+        Открывает набор данных из каталога root (features.npy, targets.npy)
+        с отображением файлов в память.
+        """
+        func = cls(np.load(os.path.join(root, cls.FEATURES_FILE), mmap_mode='r'),
+                   np.load(os.path.join(root, cls.TARGETS_FILE), mmap_mode='r'),
+                   loss, chunk_rows)
+        func.root = root
+        return func
+
+    @classmethod
+    def generate(cls, root, n_samples, dimension, loss='squared', noise=0.1, seed=0, chunk_rows=65536):
+        """
+        Записывает синтетический набор данных в каталог root порциями, не
+        размещая его в памяти целиком, и открывает его через load.
+
+        Признаки - стандартные нормальные, ответы - линейная модель со
+        случайными весами и нормальным шумом уровня noise (для логистической
+        потери - знак такой модели).
+
+        Returns:
+            DatasetFunction: Функция над записанным набором данных
+        """
+        os.makedirs(root, exist_ok=True)
+        rng = np.random.default_rng(seed)
+        weights = rng.standard_normal(dimension)
+        features = np.lib.format.open_memmap(os.path.join(root, cls.FEATURES_FILE), mode='w+',
+                                             shape=(n_samples, dimension))
+        targets = np.lib.format.open_memmap(os.path.join(root, cls.TARGETS_FILE), mode='w+',
+                                            shape=(n_samples,))
+        for start in range(0, n_samples, chunk_rows):
+            rows = slice(start, min(start + chunk_rows, n_samples))
+            chunk = rng.standard_normal((rows.stop - rows.start, dimension))
+            response = chunk @ weights + noise * rng.standard_normal(len(chunk))
+            features[rows] = chunk
+            targets[rows] = np.where(response >= 0, 1.0, -1.0) if loss == 'logistic' else response
+        features.flush()
+        targets.flush()
+        del features, targets
+        return cls.load(root, loss, chunk_rows)
+
+    def __getstate__(self):
+        # В другой процесс передается путь к данным, а не их содержимое
+        state = self.__dict__.copy()
+        if self.root is not None:
+            del state['features'], state['targets']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.root is not None:
+            self.features = np.load(os.path.join(self.root, self.FEATURES_FILE), mmap_mode='r')
+            self.targets = np.load(os.path.join(self.root, self.TARGETS_FILE), mmap_mode='r')
+
+    @property
+    def n_samples(self):
+        return len(self.targets)
+
+    def _loss(self, margins, targets):
+        """
+        Потери и их производные по линейному выходу a w.
+
+        Args:
+            margins: Выходы модели формы (r, m)
+            targets: Ответы формы (r, 1)
+
+        Returns:
+            tuple: (потери (r, m), первые производные (r, m), вторые производные (r, m))
+        """
+        if self.loss == 'squared':
+            residuals = margins - targets
+            return 0.5 * residuals ** 2, residuals, np.ones_like(residuals)
+        scaled = targets * margins
+        # sigmoid(-t) через tanh не переполняется при больших |t|
+        sigmoid = 0.5 * (1.0 - np.tanh(0.5 * scaled))
+        return np.logaddexp(0.0, -scaled), -targets * sigmoid, sigmoid * (1.0 - sigmoid)
+
+    def _chunks(self, rows):
+        """Порции (признаки, ответы): все строки по chunk_rows или строки rows."""
+        if rows is not None:
+            yield np.asarray(self.features[rows], dtype=float), np.asarray(self.targets[rows], dtype=float)
+            return
+        for start in range(0, self.n_samples, self.chunk_rows):
+            stop = start + self.chunk_rows
+            yield (np.asarray(self.features[start:stop], dtype=float),
+                   np.asarray(self.targets[start:stop], dtype=float))
+
+    def _evaluate(self, X, rows=None, gradient=True, hessian=False):
+        """
+        Средние по строкам потеря, градиент и гессиан в точках X.
+
+        Args:
+            X: Точки формы (..., d)
+            rows: Номера строк мини-батча или None для всех строк
+            gradient: Вычислять ли градиент
+            hessian: Вычислять ли гессиан
+
+        Returns:
+            tuple: (значения (...), градиенты (..., d) или None, гессианы (..., d, d) или None)
+        """
+        X = np.asarray(X, dtype=float)
+        W = X.reshape(-1, X.shape[-1])
+        values = np.zeros(len(W))
+        gradients = np.zeros_like(W) if gradient else None
+        hessians = np.zeros((len(W), W.shape[1], W.shape[1])) if hessian else None
+        count = 0
+        for features, targets in self._chunks(rows):
+            losses, slopes, curvatures = self._loss(features @ W.T, targets[:, None])
+            values += losses.sum(axis=0)
+            if gradient:
+                gradients += slopes.T @ features
+            if hessian:
+                hessians += np.einsum('rm,ri,rj->mij', curvatures, features, features)
+            count += len(targets)
+
+        values = (values / count).reshape(X.shape[:-1])
+        if gradient:
+            gradients = (gradients / count).reshape(X.shape)
+        if hessian:
+            hessians = (hessians / count).reshape(X.shape + (X.shape[-1],))
+        return values, gradients, hessians
+
+    def value(self, X):
+        return self._evaluate(X, gradient=False)[0]
+
+    def gradient(self, X):
+        return self._evaluate(X)[1]
+
+    def value_and_gradient(self, X):
+        return self._evaluate(X)[:2]
+
+    def hessian(self, X):
+        return self._evaluate(X, gradient=False, hessian=True)[2]
+
+    def batch_value(self, X, rows):
+        return self._evaluate(X, rows, gradient=False)[0]
+
+    def batch_gradient(self, X, rows):
+        return self._evaluate(X, rows)[1]
+
+    def batch_value_and_gradient(self, X, rows):
+        return self._evaluate(X, rows)[:2]
@@ -0,0 +1,213 @@
+import itertools
+
+
+class Expression:
+    """
+    Узел символьного выражения для описания тестовых функций.
+
+    Узлы интернируются: одинаковые подвыражения представлены одним объектом,
+    поэтому общие подвыражения функции, градиента и гессиана вычисляются
+    в сгенерированном коде только один раз.
+
+    Attributes:
+        op: Имя операции ('const', 'var', 'add', 'mul', ...)
+        args: Аргументы-подвыражения
+        param: Параметр операции (значение константы, имя переменной,
+            показатель степени, границы clip)
+        variables: Множество имен переменных, от которых зависит выражение
+    """
+
+    _interned = {}
+    _counter = itertools.count()
+
+    def __new__(cls, op, args=(), param=None):
+        key = (op, tuple(id(arg) for arg in args), param)
+        node = cls._interned.get(key)
+        if node is None:
+            node = super().__new__(cls)
+            node.op = op
+            node.args = tuple(args)
+            node.param = param
+            node.index = next(cls._counter)
+            if op == 'var':
+                node.variables = frozenset([param])
+            else:
+                node.variables = frozenset().union(*(arg.variables for arg in args))
+            node._derivatives = {}
+            cls._interned[key] = node
+        return node
+
+    # Конструирование с упрощением констант
+
+    @staticmethod
+    def constant(value):
+        return Expression('const', param=float(value))
+
+    @staticmethod
+    def variable(name):
+        return Expression('var', param=name)
+
+    @staticmethod
+    def wrap(value):
+        return value if isinstance(value, Expression) else Expression.constant(value)
+
+    def is_const(self, value=None):
+        return self.op == 'const' and (value is None or self.param == value)
+
+    @staticmethod
+    def _ordered(a, b):
+        # Коммутативные операции хранят аргументы в каноническом порядке
+        return (a, b) if a.index <= b.index else (b, a)
+
+    def __add__(self, other):
+        other = Expression.wrap(other)
+        if self.is_const() and other.is_const():
+            return Expression.constant(self.param + other.param)
+        if self.is_const(0.0):
+            return other
+        if other.is_const(0.0):
+            return self
+        return Expression('add', Expression._ordered(self, other))
+
+    def __radd__(self, other):
+        return Expression.wrap(other) + self
+
+    def __sub__(self, other):
+        other = Expression.wrap(other)
+        if self.is_const() and other.is_const():
+            return Expression.constant(self.param - other.param)
+        if other.is_const(0.0):
+            return self
+        if self.is_const(0.0):
+            return -other
+        return Expression('sub', (self, other))
+
+    def __rsub__(self, other):
+        return Expression.wrap(other) - self
+
+    def __mul__(self, other):
+        other = Expression.wrap(other)
+        if self.is_const() and other.is_const():
+            return Expression.constant(self.param * other.param)
+        if self.is_const(0.0) or other.is_const(0.0):
+            return Expression.constant(0.0)
+        if self.is_const(1.0):
+            return other
+        if other.is_const(1.0):
+            return self
+        return Expression('mul', Expression._ordered(self, other))
+
+    def __rmul__(self, other):
+        return Expression.wrap(other) * self
+
+    def __truediv__(self, other):
+        other = Expression.wrap(other)
+        if self.is_const() and other.is_const():
+            return Expression.constant(self.param / other.param)
+        if self.is_const(0.0):
+            return self
+        if other.is_const(1.0):
+            return self
+        return Expression('div', (self, other))
+
+    def __rtruediv__(self, other):
+        return Expression.wrap(other) / self
+
+    def __neg__(self):
+        if self.is_const():
+            return Expression.constant(-self.param)
+        if self.op == 'neg':
+            return self.args[0]
+        return Expression('neg', (self,))
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Expression):
+            if not exponent.is_const():
+                raise ValueError("Показатель степени должен быть константой")
+            exponent = exponent.param
+        exponent = float(exponent)
+        if exponent == 0.0:
+            return Expression.constant(1.0)
+        if exponent == 1.0:
+            return self
+        if self.is_const():
+            return Expression.constant(self.param ** exponent)
+        return Expression('pow', (self,), exponent)
+
+    # Символьное дифференцирование
+
+    def diff(self, name):
+        """
+        Возвращает производную выражения по переменной.
+
+        Args:
+            name: Имя переменной
+
+        Returns:
+            Expression: Производная (с упрощением нулей и единиц)
+        """
+        if name not in self.variables:
+            return Expression.constant(0.0)
+        derivative = self._derivatives.get(name)
+        if derivative is None:
+            derivative = self._diff(name)
+            self._derivatives[name] = derivative
+        return derivative
+
+    def _diff(self, name):
+        op, args = self.op, self.args
+        if op == 'var':
+            return Expression.constant(1.0)
+        if op == 'add':
+            return args[0].diff(name) + args[1].diff(name)
+        if op == 'sub':
+            return args[0].diff(name) - args[1].diff(name)
+        if op == 'mul':
+            a, b = args
+            return a.diff(name) * b + a * b.diff(name)
+        if op == 'div':
+            a, b = args
+            return a.diff(name) / b - a * b.diff(name) / b ** 2
+        if op == 'neg':
+            return -args[0].diff(name)
+        if op == 'pow':
+            a = args[0]
+            return self.param * a ** (self.param - 1.0) * a.diff(name)
+        if op == 'exp':
+            return self * args[0].diff(name)
+        if op == 'log':
+            return args[0].diff(name) / args[0]
+        if op == 'sqrt':
+            return args[0].diff(name) / (2.0 * self)
+        if op == 'sin':
+            return cos(args[0]) * args[0].diff(name)
+        if op == 'cos':
+            return -sin(args[0]) * args[0].diff(name)
+        if op == 'clip':
+            # Защита от переполнения: на градиент не влияет
+            return args[0].diff(name)
+        raise ValueError(f"Неизвестная операция: {op}")
+
+
+def exp(a):
+    return Expression('exp', (Expression.wrap(a),))
+
+
+def log(a):
+    return Expression('log', (Expression.wrap(a),))
+
+
+def sqrt(a):
+    return Expression('sqrt', (Expression.wrap(a),))
+
+
+def sin(a):
+    return Expression('sin', (Expression.wrap(a),))
+
+
+def cos(a):
+    return Expression('cos', (Expression.wrap(a),))
+
+
+def clip(a, lower, upper):
+    return Expression('clip', (Expression.wrap(a),), (float(lower), float(upper)))
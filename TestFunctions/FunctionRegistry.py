@@ -0,0 +1,42 @@
+import importlib
+
+
+class FunctionRegistry:
+    """
+    Реестр тестовых функций по коротким именам.
+
+    Модуль функции импортируется (и ее ядра компилируются) только при
+    первом обращении к классу.
+
+    Запись: имя -> (отображаемое имя, модуль, класс).
+    """
+
+    FUNCTIONS = {
+        'beale': ("Функция Била", 'TestFunctions.BealeFunction', 'BealeFunction'),
+        'simplex1': ("Тест", 'TestFunctions.SimplexFunction1', 'SimplexFunction1'),
+        'rosenbrock': ("Функция Розенброка", 'TestFunctions.RosenbrockFunction', 'RosenbrockFunction'),
+        'rastrigin': ("Функция Растригина", 'TestFunctions.RastriginFunction', 'RastriginFunction'),
+        'ackley': ("Функция Экли", 'TestFunctions.AckleyFunction', 'AckleyFunction'),
+    }
+
+    @classmethod
+    def names(cls):
+        return list(cls.FUNCTIONS)
+
+    @classmethod
+    def display_name(cls, name):
+        return cls.FUNCTIONS[name][0]
+
+    @classmethod
+    def get(cls, name):
+        """
+        Возвращает класс тестовой функции по имени.
+
+        Args:
+            name: Короткое имя из FUNCTIONS
+
+        Returns:
+            type: Класс тестовой функции
+        """
+        _, module, class_name = cls.FUNCTIONS[name]
+        return getattr(importlib.import_module(module), class_name)
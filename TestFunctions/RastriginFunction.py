@@ -0,0 +1,29 @@
+import numpy as np
+
+from TestFunctions.VectorFunction import VectorFunction
+
+
+class RastriginFunction(VectorFunction):
+    """
+    Функция Растригина произвольной размерности:
+    f(X) = 10 d + sum(x[i]^2 - 10 cos(2 pi x[i])).
+    Множество регулярно расположенных локальных минимумов, глобальный
+    минимум f = 0 в начале координат.
+    """
+
+    @staticmethod
+    def value(X):
+        X = np.asarray(X, dtype=float)
+        return 10.0 * X.shape[-1] + np.sum(X ** 2 - 10.0 * np.cos(2.0 * np.pi * X), axis=-1)
+
+    @staticmethod
+    def gradient(X):
+        X = np.asarray(X, dtype=float)
+        return 2.0 * X + 20.0 * np.pi * np.sin(2.0 * np.pi * X)
+
+    @staticmethod
+    def hessian(X):
+        X = np.asarray(X, dtype=float)
+        # Слагаемые независимы - гессиан диагональный
+        diagonal = 2.0 + 40.0 * np.pi ** 2 * np.cos(2.0 * np.pi * X)
+        return diagonal[..., :, None] * np.eye(X.shape[-1])
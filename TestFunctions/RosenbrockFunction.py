@@ -0,0 +1,43 @@
+import numpy as np
+
+from TestFunctions.VectorFunction import VectorFunction
+
+
+class RosenbrockFunction(VectorFunction):
+    """
+    Функция Розенброка произвольной размерности:
+    f(X) = sum(100 (x[i+1] - x[i]^2)^2 + (1 - x[i])^2), i = 0..d-2.
+    Глобальный минимум f = 0 в точке (1, ..., 1) в узком изогнутом овраге.
+    """
+
+    @staticmethod
+    def value(X):
+        X = np.asarray(X, dtype=float)
+        head, tail = X[..., :-1], X[..., 1:]
+        return np.sum(100.0 * (tail - head ** 2) ** 2 + (1.0 - head) ** 2, axis=-1)
+
+    @staticmethod
+    def gradient(X):
+        X = np.asarray(X, dtype=float)
+        head, tail = X[..., :-1], X[..., 1:]
+        valley = tail - head ** 2
+        gradient = np.zeros_like(X)
+        gradient[..., :-1] = -400.0 * head * valley - 2.0 * (1.0 - head)
+        gradient[..., 1:] += 200.0 * valley
+        return gradient
+
+    @staticmethod
+    def hessian(X):
+        X = np.asarray(X, dtype=float)
+        d = X.shape[-1]
+        head, tail = X[..., :-1], X[..., 1:]
+        diagonal = np.zeros_like(X)
+        diagonal[..., :-1] = 1200.0 * head ** 2 - 400.0 * tail + 2.0
+        diagonal[..., 1:] += 200.0
+        # Гессиан трехдиагональный: заполняются главная и соседние диагонали
+        hessian = np.zeros(X.shape + (d,))
+        index = np.arange(d)
+        hessian[..., index, index] = diagonal
+        hessian[..., index[:-1], index[1:]] = -400.0 * head
+        hessian[..., index[1:], index[:-1]] = -400.0 * head
+        return hessian
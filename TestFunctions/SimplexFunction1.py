@@ -1,7 +1,7 @@
-import numpy as np
+from TestFunctions.CompiledFunction import CompiledFunction
 
 
-class SimplexFunction1:
+class SimplexFunction1(CompiledFunction):
     """
     Класс, представляющий первую функцию для симплекс-метода.
 
@@ -10,9 +10,5 @@ class SimplexFunction1:
     """
 
     @staticmethod
-    def calculate_func(x, y):
-        return 2 * x ** 2 + 3 * y ** 2 + 4 * x * y - 6 * x - 3 * y
-
-    @staticmethod
-    def calculate_gradient(x, y):
-        return np.array([4*x + 4*y - 6, 4*x + 6*y - 3])
\ No newline at end of file
+    def expression(x, y):
+        return 2 * x ** 2 + 3 * y ** 2 + 4 * x * y - 6 * x - 3 * y
\ No newline at end of file
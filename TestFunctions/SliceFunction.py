@@ -0,0 +1,59 @@
+import numpy as np
+
+from TestFunctions.VectorFunction import VectorFunction
+
+
+class SliceFunction(VectorFunction):
+    """
+    Двумерный срез многомерной функции для визуализации.
+
+    Точка среза (u, v) задает координаты axes базовой точки, остальные
+    координаты не меняются. Сетка вычисляется порциями, чтобы массив точек
+    полной размерности не превышал MAX_ELEMENTS элементов.
+
+    Attributes:
+        wrapped: Исходная функция
+        base_point: Базовая точка формы (d,)
+        axes: Номера координат, отображаемых на оси среза
+    """
+
+    dimension = 2
+    MAX_ELEMENTS = 1 << 22
+
+    def __init__(self, func, base_point, axes=(0, 1)):
+        self.wrapped = func
+        self.base_point = np.asarray(base_point, dtype=float)
+        self.axes = tuple(axes)
+
+    def surface_key(self):
+        """Ключ кэша поверхностей: функция, базовая точка вне среза и оси."""
+        func = getattr(self.wrapped, 'wrapped', self.wrapped)
+        func_class = func if isinstance(func, type) else type(func)
+        rest = np.delete(self.base_point, self.axes)
+        return func_class, tuple(rest.tolist()), self.axes
+
+    def value(self, X):
+        return self._evaluate(X, self.wrapped.value, ())
+
+    def gradient(self, X):
+        """Градиент по координатам среза формы (..., 2)."""
+        return self._evaluate(X, lambda points: self.wrapped.gradient(points)[:, list(self.axes)], (2,))
+
+    def _evaluate(self, X, kernel, shape):
+        """
+        Вычисляет kernel в точках полной размерности порциями.
+
+        Args:
+            X: Точки среза формы (..., 2)
+            kernel: Функция массива точек формы (m, d)
+            shape: Форма результата kernel для одной точки
+        """
+        X = np.asarray(X, dtype=float)
+        uv = X.reshape(-1, 2)
+        result = np.empty((len(uv),) + shape)
+        chunk = max(1, self.MAX_ELEMENTS // len(self.base_point))
+        for start in range(0, len(uv), chunk):
+            points = np.tile(self.base_point, (len(uv[start:start + chunk]), 1))
+            points[:, list(self.axes)] = uv[start:start + chunk]
+            result[start:start + chunk] = kernel(points)
+        return result.reshape(X.shape[:-1] + shape)
@@ -0,0 +1,49 @@
+from abc import abstractmethod, ABC
+
+import numpy as np
+
+
+class VectorFunction(ABC):
+    """
+    Базовый класс тестовой функции векторного аргумента.
+
+    Методы принимают массив точек X формы (..., d) и возвращают значения
+    формы (...), градиенты формы (..., d) и гессианы формы (..., d, d).
+    Одна точка передается массивом формы (d,).
+
+    Attributes:
+        dimension: Фиксированная размерность аргумента или None, если
+            функция определена для любой размерности
+    """
+
+    dimension = None
+
+    @staticmethod
+    @abstractmethod
+    def value(X):
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def gradient(X):
+        pass
+
+    @classmethod
+    def value_and_gradient(cls, X):
+        return cls.value(X), cls.gradient(X)
+
+    @staticmethod
+    def expand_point(point, dimension):
+        """
+        Дополняет начальную точку до размерности dimension повторением ее
+        координат: (x, y) -> (x, y, x, y, ...).
+
+        Args:
+            point: Начальная точка
+            dimension: Требуемая размерность
+
+        Returns:
+            ndarray: Точка формы (dimension,)
+        """
+        point = np.asarray(point, dtype=float)
+        return np.resize(point, dimension)
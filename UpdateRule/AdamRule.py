@@ -0,0 +1,26 @@
+import numpy as np
+
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class AdamRule(UpdateRule):
+    """Adam: шаг по скользящим оценкам первого и второго моментов градиента."""
+
+    def __init__(self, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.reset()
+
+    def reset(self):
+        self._m = 0.0
+        self._v = 0.0
+        self._t = 0
+
+    def step(self, strategy, point, value, gradient, lr):
+        self._t += 1
+        self._m = self.beta1 * self._m + (1 - self.beta1) * gradient
+        self._v = self.beta2 * self._v + (1 - self.beta2) * gradient ** 2
+        m_hat = self._m / (1 - self.beta1 ** self._t)
+        v_hat = self._v / (1 - self.beta2 ** self._t)
+        return point - lr * m_hat / (np.sqrt(v_hat) + self.eps), None, None
\ No newline at end of file
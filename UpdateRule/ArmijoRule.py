@@ -0,0 +1,34 @@
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class ArmijoRule(UpdateRule):
+    """
+    Дробление шага (backtracking) до выполнения условия Армихо.
+
+    Пробный шаг начинается с принятого на прошлой итерации шага,
+    увеличенного в growth раз (на первой итерации - с lr), и уменьшается
+    в shrink раз, пока убывание функции недостаточно. Вычисляется только
+    значение функции.
+    """
+
+    def __init__(self, c1=1e-4, shrink=0.5, growth=2.0, max_backtracks=50):
+        self.c1 = c1
+        self.shrink = shrink
+        self.growth = growth
+        self.max_backtracks = max_backtracks
+        self._step_size = None
+
+    def reset(self):
+        self._step_size = None
+
+    def step(self, strategy, point, value, gradient, lr):
+        step_size = lr if self._step_size is None else self._step_size * self.growth
+        decrease = self.c1 * (gradient @ gradient)
+        for _ in range(self.max_backtracks):
+            candidate = point - step_size * gradient
+            candidate_value = strategy.calculate_func(candidate)
+            if candidate_value <= value - step_size * decrease:
+                break
+            step_size *= self.shrink
+        self._step_size = step_size
+        return candidate, candidate_value, None
\ No newline at end of file
@@ -0,0 +1,34 @@
+import numpy as np
+
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class BarzilaiBorweinRule(UpdateRule):
+    """
+    Шаг Барзилая-Борвейна по разностям двух последних точек и градиентов.
+
+    На первой итерации и при неположительной кривизне используется lr.
+    Вариант long: s·s / s·y, иначе short: s·y / y·y.
+    """
+
+    def __init__(self, long=True):
+        self.long = long
+        self.reset()
+
+    def reset(self):
+        self._point = None
+        self._gradient = None
+
+    def step(self, strategy, point, value, gradient, lr):
+        step_size = lr
+        if self._point is not None:
+            s = point - self._point
+            y = gradient - self._gradient
+            curvature = s @ y
+            if curvature > 0:
+                candidate = (s @ s) / curvature if self.long else curvature / (y @ y)
+                if np.isfinite(candidate):
+                    step_size = candidate
+        self._point = point.copy()
+        self._gradient = gradient.copy()
+        return point - step_size * gradient, None, None
\ No newline at end of file
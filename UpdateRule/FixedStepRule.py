@@ -0,0 +1,8 @@
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class FixedStepRule(UpdateRule):
+    """Шаг постоянной длины lr против градиента."""
+
+    def step(self, strategy, point, value, gradient, lr):
+        return point - lr * gradient, None, None
\ No newline at end of file
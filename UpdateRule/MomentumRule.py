@@ -0,0 +1,26 @@
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class MomentumRule(UpdateRule):
+    """
+    Метод тяжелого шарика (Поляка) или ускоренный градиент Нестерова.
+
+    Вариант Нестерова записан в форме, где градиент берется в текущей
+    точке цикла (она же точка "заглядывания вперед"), поэтому лишних
+    вычислений градиента не требуется.
+    """
+
+    def __init__(self, momentum=0.9, nesterov=False):
+        self.momentum = momentum
+        self.nesterov = nesterov
+        self._velocity = None
+
+    def reset(self):
+        self._velocity = None
+
+    def step(self, strategy, point, value, gradient, lr):
+        previous = 0.0 if self._velocity is None else self._velocity
+        self._velocity = self.momentum * previous - lr * gradient
+        if self.nesterov:
+            return point - self.momentum * previous + (1 + self.momentum) * self._velocity, None, None
+        return point + self._velocity, None, None
\ No newline at end of file
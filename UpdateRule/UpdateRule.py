@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+
+
+class UpdateRule(ABC):
+    """
+    Правило обновления точки для градиентного спуска.
+
+    Правило получает текущую точку, значение и градиент функции в ней и
+    возвращает новую точку. Если при выборе шага правило уже вычислило
+    значение и/или градиент в новой точке, оно возвращает их, чтобы цикл
+    оптимизации не вычислял их повторно.
+    """
+
+    def reset(self):
+        """Сбрасывает внутреннее состояние перед новым запуском."""
+        pass
+
+    @abstractmethod
+    def step(self, strategy, point, value, gradient, lr):
+        """
+        Выполняет один шаг.
+
+        Args:
+            strategy: Стратегия оптимизации (для вычисления функции)
+            point: Текущая точка
+            value: Значение функции в текущей точке
+            gradient: Градиент в текущей точке
+            lr: Шаг обучения
+
+        Returns:
+            tuple: (новая точка, значение или None, градиент или None)
+        """
+        pass
\ No newline at end of file
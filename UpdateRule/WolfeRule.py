@@ -0,0 +1,77 @@
+import numpy as np
+
+from UpdateRule.UpdateRule import UpdateRule
+
+
+class WolfeRule(UpdateRule):
+    """
+    Линейный поиск по направлению антиградиента с сильными условиями Вулфа
+    (алгоритм расширения интервала и zoom из Nocedal, Wright, 3.5-3.6).
+
+    Пробный шаг начинается с принятого на прошлой итерации шага
+    (на первой итерации, а также если прошлый шаг нулевой или не конечен,
+    например после неудачного zoom, - с lr). Значение и градиент в найденной точке
+    возвращаются в цикл оптимизации.
+    """
+
+    def __init__(self, c1=1e-4, c2=0.9, growth=2.0, max_evaluations=30):
+        self.c1 = c1
+        self.c2 = c2
+        self.growth = growth
+        self.max_evaluations = max_evaluations
+        self._step_size = None
+
+    def reset(self):
+        self._step_size = None
+
+    def step(self, strategy, point, value, gradient, lr):
+        direction = -gradient
+        slope0 = gradient @ direction
+
+        def phi(alpha):
+            candidate = point + alpha * direction
+            f, g = strategy.value_and_grad(candidate)
+            return candidate, f, g, g @ direction
+
+        alpha_prev, f_prev, slope_prev = 0.0, value, slope0
+        alpha = self._step_size
+        if alpha is None or not (np.isfinite(alpha) and alpha > 0):
+            alpha = lr
+        result = None
+        for i in range(self.max_evaluations):
+            trial = phi(alpha)
+            _, f, _, slope = trial
+            if not np.isfinite(f) or f > value + self.c1 * alpha * slope0 or (i > 0 and f >= f_prev):
+                result = self._zoom(phi, value, slope0, alpha_prev, f_prev, slope_prev, alpha, f)
+                break
+            if abs(slope) <= -self.c2 * slope0:
+                result = trial
+                break
+            if slope >= 0:
+                result = self._zoom(phi, value, slope0, alpha, f, slope, alpha_prev, f_prev)
+                break
+            alpha_prev, f_prev, slope_prev = alpha, f, slope
+            alpha *= self.growth
+            result = trial
+
+        candidate, f, g, _ = result
+        self._step_size = np.linalg.norm(candidate - point) / max(np.linalg.norm(direction), 1e-300)
+        return candidate, f, g
+
+    def _zoom(self, phi, value, slope0, alpha_lo, f_lo, slope_lo, alpha_hi, f_hi):
+        best = None
+        for _ in range(self.max_evaluations):
+            alpha = 0.5 * (alpha_lo + alpha_hi)
+            trial = phi(alpha)
+            _, f, _, slope = trial
+            if not np.isfinite(f) or f > value + self.c1 * alpha * slope0 or f >= f_lo:
+                alpha_hi, f_hi = alpha, f
+            else:
+                best = trial
+                if abs(slope) <= -self.c2 * slope0:
+                    return trial
+                if slope * (alpha_hi - alpha_lo) >= 0:
+                    alpha_hi, f_hi = alpha_lo, f_lo
+                alpha_lo, f_lo, slope_lo = alpha, f, slope
+        # Интервал выродился - возвращается лучшая точка с достаточным убыванием
+        return best if best is not None else phi(alpha_lo)
\ No newline at end of file
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+
+class BasinCache:
+    """
+    LRU-кэш вычисленных карт бассейнов притяжения.
+
+    Ключ составляет вызывающий код (метод, функция, границы, разрешение,
+    параметры оптимизации), значение - завершенная карта BasinMap.
+    Прерванные карты в кэш не попадают.
+
+    Attributes:
+        max_entries: Максимальное число хранимых карт
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Возвращает карту по ключу или None при промахе кэша."""
+        basin = self._entries.get(key)
+        if basin is not None:
+            self._entries.move_to_end(key)
+        return basin
+
+    def put(self, key, basin):
+        self._entries[key] = basin
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,120 @@
+import numpy as np
+
+
+class BasinMap:
+    """
+    Карта бассейнов притяжения на сетке начальных точек.
+
+    Для каждого узла сетки выполняется оптимизация из этого узла и
+    запоминаются найденная точка, число итераций и признак сходимости.
+    Узлы вычисляются порциями пакетной оптимизацией strategy.optimize_many,
+    поэтому вычисление можно прервать между порциями и отображать ход.
+
+    Сетка задает первые две координаты начальной точки, остальные берутся
+    из базовой точки (для многомерных функций - срез через начальную точку).
+
+    Attributes:
+        x: Первая координата узлов формы (resolution, resolution)
+        y: Вторая координата узлов формы (resolution, resolution)
+        initial_points: Начальные точки формы (resolution, resolution, d)
+        final_points: Найденные точки формы (resolution, resolution, d)
+        iterations: Число итераций формы (resolution, resolution)
+        converged: Признак сходимости формы (resolution, resolution)
+        done: Число вычисленных узлов (в порядке строк сетки)
+    """
+
+    # Размер порции для пакетного шага и для запусков по одному
+    BATCH_CHUNK = 256
+    SEQUENTIAL_CHUNK = 16
+
+    def __init__(self, bounds, resolution, base_point=(0.0, 0.0)):
+        x_min, x_max, y_min, y_max = bounds
+        self.bounds = tuple(bounds)
+        self.x, self.y = np.meshgrid(np.linspace(x_min, x_max, resolution),
+                                     np.linspace(y_min, y_max, resolution))
+        base_point = np.asarray(base_point, dtype=float)
+        self.initial_points = np.tile(base_point, self.x.shape + (1,))
+        self.initial_points[..., 0] = self.x
+        self.initial_points[..., 1] = self.y
+        self.final_points = np.full_like(self.initial_points, np.nan)
+        self.iterations = np.zeros(self.x.shape, dtype=np.int64)
+        self.converged = np.zeros(self.x.shape, dtype=bool)
+        self.done = 0
+
+    def __len__(self):
+        return self.x.size
+
+    @property
+    def complete(self):
+        return self.done == len(self)
+
+    def compute(self, strategy, lr, max_iters, tolerance, chunk_size=None, **kwargs):
+        """
+        Вычисляет оставшиеся узлы сетки порциями.
+
+        Генератор: после каждой порции возвращает (число вычисленных узлов,
+        общее число узлов). Прерванное вычисление продолжается повторным
+        вызовом compute.
+
+        Args:
+            strategy: Стратегия оптимизации с установленной функцией
+            lr: Шаг обучения
+            max_iters: Максимальное число итераций для каждого узла
+            tolerance: Точность остановки
+            chunk_size: Число узлов в порции; по умолчанию BATCH_CHUNK, если
+                стратегия поддерживает пакетный шаг, иначе SEQUENTIAL_CHUNK
+        """
+        if chunk_size is None:
+            chunk_size = self.BATCH_CHUNK if strategy.supports_batch(**kwargs) else self.SEQUENTIAL_CHUNK
+        dimension = self.initial_points.shape[-1]
+        # Плоские представления массивов сетки без копирования
+        initial_points = self.initial_points.reshape(-1, dimension)
+        final_points = self.final_points.reshape(-1, dimension)
+        iterations = self.iterations.reshape(-1)
+        converged = self.converged.reshape(-1)
+
+        while not self.complete:
+            chunk = slice(self.done, min(self.done + chunk_size, len(self)))
+            final_points[chunk], iterations[chunk], converged[chunk] = strategy.optimize_many(
+                initial_points[chunk], lr, max_iters, tolerance, **kwargs
+            )
+            self.done = chunk.stop
+            yield self.done, len(self)
+
+    def basins(self, merge_distance=None):
+        """
+        Разбивает узлы по найденным минимумам.
+
+        Найденные точки округляются до ячеек со стороной merge_distance
+        (по умолчанию 1% ширины области), точки одной ячейки считаются
+        одним минимумом. Минимумы нумеруются по убыванию площади бассейна.
+
+        Args:
+            merge_distance: Размер ячейки объединения минимумов
+
+        Returns:
+            tuple: (номера минимумов формы (resolution, resolution), -1 для
+                несошедшихся узлов; минимумы формы (k, d))
+        """
+        if merge_distance is None:
+            merge_distance = 0.01 * (self.bounds[1] - self.bounds[0])
+        labels = np.full(self.x.shape, -1, dtype=np.int64)
+        mask = self.converged & np.isfinite(self.final_points).all(axis=-1)
+        if not mask.any():
+            return labels, np.empty((0, self.final_points.shape[-1]))
+
+        points = self.final_points[mask]
+        # Ограничение не дает переполнить целые для ушедших далеко точек
+        cells = np.clip(np.round(points / merge_distance), -2 ** 62, 2 ** 62).astype(np.int64)
+        _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        # Номер 0 - минимум с наибольшим бассейном
+        order = np.argsort(-counts, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        labels[mask] = rank[inverse]
+
+        minima = np.zeros((len(counts), points.shape[-1]))
+        np.add.at(minima, labels[mask], points)
+        minima /= counts[order][:, None]
+        return labels, minima
@@ -0,0 +1,48 @@
+import numpy as np
+
+from VisualizationStrategy.SurfaceVisualization import SurfaceVisualization
+
+
+class BasinVisualization(SurfaceVisualization):
+    """
+    Поверхность с картой бассейнов притяжения на плоскости под ней.
+
+    В режиме 'basins' узлы окрашиваются по номеру найденного минимума,
+    в режиме 'iterations' - по числу итераций до сходимости (логарифмическая
+    шкала). Несошедшиеся узлы не закрашиваются. Пока карта не вычислена
+    (basin равен None), рисуется только поверхность.
+
+    Attributes:
+        mode: Режим окраски: 'basins' или 'iterations'
+        basin: Вычисленная карта BasinMap или None
+    """
+
+    MODES = ('basins', 'iterations')
+
+    def __init__(self, mode='basins'):
+        if mode not in self.MODES:
+            raise ValueError(f"Неизвестный режим карты бассейнов: {mode}")
+        self.mode = mode
+        self.basin = None
+
+    def plot(self, ax, x, y, z):
+        super().plot(ax, x, y, z)
+        if self.basin is None:
+            return
+
+        # Карта рисуется на плоскости ниже поверхности
+        z_min, z_max = np.nanmin(z), np.nanmax(z)
+        floor = z_min - 0.25 * (z_max - z_min)
+        if self.mode == 'basins':
+            labels, minima = self.basin.basins()
+            values = np.ma.masked_less(labels, 0)
+            levels = np.arange(len(minima) + 1) - 0.5
+            cmap = 'tab20'
+        else:
+            values = np.ma.masked_where(~self.basin.converged, np.log10(1 + self.basin.iterations))
+            levels = 20
+            cmap = 'viridis'
+        if values.count():
+            ax.contourf(self.basin.x, self.basin.y, values, levels=levels, zdir='z',
+                        offset=floor, cmap=cmap, alpha=0.8)
+        ax.set_zlim(floor, z_max)
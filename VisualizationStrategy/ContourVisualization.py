@@ -0,0 +1,102 @@
+import numpy as np
+
+from VisualizationStrategy.VisualizationStrategy import VisualizationStrategy
+
+
+class ContourVisualization(VisualizationStrategy):
+    """
+    Двумерная карта функции: растровое изображение сетки и линии уровня.
+
+    Изображение рисуется одним объектом imshow, поэтому перемещение,
+    масштабирование и анимация пути не перерисовывают многоугольники, как
+    у трехмерной поверхности. Уровни цвета и линии уровня берутся по
+    квантилям значений, чтобы функции с большим разбросом значений
+    (например, Била) не сливались в одно пятно у минимума.
+
+    Если задан source, после изменения границ осей сетка видимой области
+    пересчитывается с разрешением resolution: так при увеличении детали
+    остаются четкими. Пересчет откладывается на delay_ms, чтобы серия
+    событий перемещения вызывала его один раз.
+
+    Attributes:
+        source: Функция (bounds, resolution) -> (x, y, z), вычисляющая сетку
+            для границ (x_min, x_max, y_min, y_max), или None
+        resolution: Разрешение сетки видимой области по каждой оси
+        levels: Число линий уровня
+        delay_ms: Задержка пересчета после изменения границ осей
+    """
+
+    projection = None
+
+    def __init__(self, source=None, resolution=300, levels=20, delay_ms=150):
+        self.source = source
+        self.resolution = resolution
+        self.levels = levels
+        self.delay_ms = delay_ms
+        self._ax = None
+        self._image = None
+        self._contours = None
+        self._timer = None
+        self._updating = False
+
+    def plot(self, ax, x, y, z):
+        if self._timer is not None:
+            self._timer.stop()
+        self._ax = ax
+        self._image = ax.imshow(z, extent=self._extent(x, y), origin='lower',
+                                cmap='plasma', aspect='auto', interpolation='bilinear')
+        self._contours = None
+        self._draw_levels(x, y, z)
+        ax.set_xlim(x.min(), x.max())
+        ax.set_ylim(y.min(), y.max())
+        ax.set_xlabel('Ось X')
+        ax.set_ylabel('Ось Y')
+
+        if self.source is not None:
+            self._timer = ax.figure.canvas.new_timer(interval=self.delay_ms)
+            self._timer.single_shot = True
+            self._timer.add_callback(self._refresh)
+            ax.callbacks.connect('xlim_changed', self._on_limits_changed)
+            ax.callbacks.connect('ylim_changed', self._on_limits_changed)
+
+    @staticmethod
+    def _extent(x, y):
+        return x.min(), x.max(), y.min(), y.max()
+
+    def _draw_levels(self, x, y, z):
+        """Задает шкалу цвета изображения и рисует линии уровня по квантилям z."""
+        from matplotlib.colors import BoundaryNorm
+
+        levels = np.unique(np.nanquantile(z, np.linspace(0, 1, self.levels + 1)))
+        if self._contours is not None:
+            self._contours.remove()
+            self._contours = None
+        if len(levels) < 2:
+            # Постоянная функция - линий уровня нет
+            return
+        self._image.set_norm(BoundaryNorm(levels, 256))
+        self._contours = self._ax.contour(x, y, z, levels=levels[1:-1], colors='black',
+                                          linewidths=0.5, alpha=0.5)
+
+    def _on_limits_changed(self, ax):
+        if not self._updating:
+            self._timer.start()
+
+    def _refresh(self):
+        """Пересчитывает изображение и линии уровня для видимой области."""
+        ax = self._ax
+        x_min, x_max = sorted(ax.get_xlim())
+        y_min, y_max = sorted(ax.get_ylim())
+        x, y, z = self.source((x_min, x_max, y_min, y_max), self.resolution)
+
+        # Изменение изображения не должно снова вызывать пересчет
+        self._updating = True
+        try:
+            self._image.set_data(z)
+            self._image.set_extent(self._extent(x, y))
+            self._draw_levels(x, y, z)
+            ax.set_xlim(x_min, x_max)
+            ax.set_ylim(y_min, y_max)
+        finally:
+            self._updating = False
+        ax.figure.canvas.draw_idle()
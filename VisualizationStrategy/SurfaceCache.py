@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SurfaceCache:
+    """
+    LRU-кэш сеток поверхности для визуализации.
+
+    Ключ кэша - (класс функции, границы, разрешение), значение - тройка
+    массивов (x, y, z), готовая для передачи в VisualizationStrategy.plot.
+
+    Attributes:
+        max_entries: Максимальное число хранимых сеток
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def _key(func, bounds, resolution):
+        # Срез многомерной функции различается базовой точкой и осями
+        if hasattr(func, 'surface_key'):
+            return func.surface_key(), tuple(bounds), resolution
+        # Обертка CachedFunction дает ту же поверхность, что и исходная функция
+        func = getattr(func, 'wrapped', func)
+        func_class = func if isinstance(func, type) else type(func)
+        return func_class, tuple(bounds), resolution
+
+    def __contains__(self, key):
+        return self._key(*key) in self._entries
+
+    def get(self, func, bounds, resolution):
+        """
+        Возвращает сетку поверхности, вычисляя её при промахе кэша.
+
+        Args:
+            func: Класс или экземпляр двумерной тестовой функции (VectorFunction)
+            bounds: Границы (x_min, x_max, y_min, y_max)
+            resolution: Число узлов сетки по каждой оси
+
+        Returns:
+            tuple: Массивы x, y, z формы (resolution, resolution)
+        """
+        key = self._key(func, bounds, resolution)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        x_min, x_max, y_min, y_max = bounds
+        x, y = np.meshgrid(np.linspace(x_min, x_max, resolution),
+                           np.linspace(y_min, y_max, resolution))
+        surface = x, y, func.value(np.stack([x, y], axis=-1))
+
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._entries.clear()
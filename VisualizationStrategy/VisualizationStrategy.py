@@ -2,6 +2,16 @@ from abc import ABC, abstractmethod
 
 
 class VisualizationStrategy(ABC):
+    """
+    Базовый класс стратегии визуализации функции.
+
+    Attributes:
+        projection: Проекция осей, передаваемая в figure.add_subplot
+            ('3d' или None для двумерных осей)
+    """
+
+    projection = '3d'
+
     @abstractmethod
     def plot(self, ax, x, y, z):
-        pass
\ No newline at end of file
+        pass
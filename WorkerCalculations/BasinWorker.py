@@ -0,0 +1,43 @@
+import threading
+
+from PyQt5.QtCore import QRunnable
+
+from WorkerCalculations.WorkerSignals import WorkerSignals
+
+
+class BasinWorker(QRunnable):
+    """
+    Вычисляет карту бассейнов притяжения (BasinMap) вне потока GUI.
+
+    Узлы сетки считаются порциями; после каждой порции испускается сигнал
+    basinProgress и проверяется флаг отмены. Завершенная карта передается
+    сигналом resultReady, прерванная - не передается. Ошибка вычисления
+    передается текстом сигналом failed; сигнал finished отправляется в
+    любом случае.
+    """
+
+    def __init__(self, basin, strategy, params, chunk_size=None):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.basin = basin
+        self.strategy = strategy
+        self.params = params
+        self.chunk_size = chunk_size
+        self.token = threading.Event()
+
+    def run(self):
+        try:
+            for done, total in self.basin.compute(self.strategy, self.params['lr'], self.params['max_iters'],
+                                                  self.params['tolerance'], self.chunk_size):
+                self.signals.basinProgress.emit(done, total)
+                if self.token.is_set():
+                    break
+            if self.basin.complete:
+                self.signals.resultReady.emit(self.basin)
+        except Exception as error:
+            self.signals.failed.emit(f"{type(error).__name__}: {error}")
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        self.token.set()
@@ -1,21 +1,68 @@
+import threading
+
 from PyQt5.QtCore import QRunnable
 
+from OptimizationStrategy.TrajectoryStream import TrajectoryStream
 from WorkerCalculations.WorkerSignals import WorkerSignals
 
 
 class CalculationWorker(QRunnable):
-    def __init__(self, params, strategy):
+    """
+    Выполняет одну оптимизацию вне потока GUI.
+
+    Новые точки пути передаются сигналом chunkReady по мере вычисления,
+    не чаще раза в stream_interval секунд; итоговая траектория - сигналом
+    resultReady. Вызов cancel() прерывает оптимизацию в течение check_every
+    итераций, траектория при этом содержит уже пройденную часть пути.
+
+    Если в params задана траектория resume, запуск не начинается заново, а
+    продолжается с ее конца на max_iters итераций (OptimizationStrategy.resume):
+    сигналом chunkReady передаются только новые точки, resultReady - весь путь.
+
+    Ошибка оптимизации передается текстом сигналом failed вместо resultReady;
+    сигнал finished отправляется в любом случае.
+    """
+
+    def __init__(self, params, strategy, check_every=10, stream_interval=0.05):
         super().__init__()
         self.signals = WorkerSignals()
         self.params = params
         self.strategy = strategy
+        self.token = threading.Event()
+        self.stream = TrajectoryStream(self.signals.chunkReady.emit, self.token,
+                                       check_every, stream_interval)
 
     def run(self):
-        path = self.strategy.optimize(
-            initial_point=self.params['initial_point'],
-            lr=self.params['lr'],
-            max_iters=self.params['max_iters'],
-            tolerance=self.params['tolerance']
-        )
-        self.signals.resultReady.emit(path)
-        self.signals.finished.emit()
+        # Метрики стратегии передаются в GUI по мере выполнения. Обращение
+        # к сигналу каждый раз создает новый объект, поэтому подписка
+        # сохраняется для отписки
+        callback = self.signals.metricsReady.emit
+        self.strategy.metrics.add_callback(callback)
+        self.strategy.stream = self.stream
+        try:
+            if self.params.get('resume') is None:
+                trajectory = self.strategy.optimize(
+                    initial_point=self.params['initial_point'],
+                    lr=self.params['lr'],
+                    max_iters=self.params['max_iters'],
+                    tolerance=self.params['tolerance']
+                )
+            else:
+                trajectory = self.strategy.resume(
+                    self.params['resume'],
+                    lr=self.params['lr'],
+                    max_iters=self.params['max_iters'],
+                    tolerance=self.params['tolerance']
+                )
+            self.signals.resultReady.emit(trajectory)
+        except Exception as error:
+            # Исключение в потоке пула не дошло бы до GUI, и окно осталось
+            # бы в состоянии выполнения
+            self.signals.failed.emit(f"{type(error).__name__}: {error}")
+        finally:
+            self.strategy.stream = None
+            self.strategy.metrics.remove_callback(callback)
+            self.signals.finished.emit()
+
+    def cancel(self):
+        self.token.set()
@@ -0,0 +1,205 @@
+import itertools
+
+import numpy as np
+
+from OptimizationStrategy.Trajectory import Trajectory
+from StoppingCriterion.NonFiniteCriterion import NonFiniteCriterion
+
+
+class HyperparameterSweep:
+    """
+    Перебор сетки (lr, tolerance, max_iters) с отсевом методом
+    последовательного деления пополам (successive halving).
+
+    На ступени r каждая оставшаяся конфигурация получает бюджет
+    min_budget * eta ** r итераций (но не больше своего max_iters).
+    Сошедшиеся конфигурации выбывают с известным числом итераций,
+    расходящиеся (остановка по расхождению, нечисловое значение или рост
+    функции) отсеиваются сразу, а из остальных на следующую ступень
+    проходит лучшая 1 / eta часть по достигнутому значению функции.
+
+    Конфигурации с одинаковым lr идут по одному пути и различаются только
+    местом остановки, поэтому путь считается один раз на группу: с
+    наименьшей точностью группы и до наибольшего бюджета ее оставшихся
+    конфигураций. Исход каждой конфигурации определяется по общему пути,
+    обрезанному до ее бюджета. Если точность влияет не только на критерий
+    нормы градиента (GRADIENT_TOLERANCE стратегии), группа задается парой
+    (lr, tolerance). На следующей ступени путь продолжается с места
+    остановки (OptimizationStrategy.resume), а не пересчитывается.
+
+    Attributes:
+        lrs: Значения шага обучения
+        tolerances: Значения точности
+        max_iters: Значения максимального числа итераций
+        eta: Коэффициент отсева
+        min_budget: Бюджет итераций первой ступени
+    """
+
+    CONVERGED = 'converged'
+    DIVERGED = 'diverged'
+    PRUNED = 'pruned'
+    EXHAUSTED = 'max_iters'
+
+    def __init__(self, lrs, tolerances, max_iters, eta=3, min_budget=10):
+        self.lrs = np.asarray(lrs, dtype=float)
+        self.tolerances = np.asarray(tolerances, dtype=float)
+        self.max_iters = np.asarray(max_iters, dtype=int)
+        self.eta = eta
+        self.min_budget = min_budget
+        self._cancelled = False
+
+    def configurations(self):
+        """Список конфигураций сетки в порядке (lr, tolerance, max_iters)."""
+        return list(itertools.product(self.lrs, self.tolerances, self.max_iters))
+
+    def run(self, runner, strategy, initial_point, progress=None):
+        """
+        Выполняет перебор.
+
+        Args:
+            runner: ParallelRunner для параллельного выполнения запусков
+            strategy: Стратегия оптимизации
+            initial_point: Начальная точка всех запусков
+            progress: Функция (номер ступени, число оставшихся конфигураций)
+
+        Returns:
+            dict: iterations - число итераций до сходимости формы
+                (len(lrs), len(tolerances), len(max_iters)), NaN если
+                конфигурация не сошлась; status - исход каждой конфигурации
+                той же формы; iterations_spent - число вычисленных итераций;
+                iterations_budget - выделенный перебору бюджет итераций;
+                full_grid_iterations - бюджет полного перебора без отсева
+                (каждый общий путь до наибольшего max_iters группы)
+        """
+        self._cancelled = False
+        configs = self.configurations()
+        iterations = np.full(len(configs), np.nan)
+        status = np.full(len(configs), self.PRUNED, dtype=object)
+
+        # Группы конфигураций с общим путем
+        shared = strategy.GRADIENT_TOLERANCE
+        groups = {}
+        for i, (lr, tolerance, _) in enumerate(configs):
+            groups.setdefault((lr,) if shared else (lr, tolerance), []).append(i)
+        group_of = {i: key for key, members in groups.items() for i in members}
+        path_tolerance = {key: min(configs[i][1] for i in members) for key, members in groups.items()}
+        paths = {}
+        allocated = dict.fromkeys(groups, 0)
+        spent = 0
+
+        alive = list(range(len(configs)))
+        budget = self.min_budget
+        rung = 0
+        while alive and not self._cancelled:
+            if progress is not None:
+                progress(rung, len(alive))
+            budgets = {i: int(min(budget, configs[i][2])) for i in alive}
+
+            # Общие пути продлеваются до наибольшего бюджета оставшихся конфигураций
+            extents = {}
+            for i in alive:
+                extents[group_of[i]] = max(extents.get(group_of[i], 0), budgets[i])
+            keys, runs = [], []
+            for key, extent in extents.items():
+                path = paths.get(key)
+                run = dict(lr=key[0], tolerance=path_tolerance[key])
+                if path is None:
+                    run.update(initial_point=initial_point, max_iters=extent)
+                elif path.termination_reason == Trajectory.MAX_ITERS and len(path) - 1 < extent:
+                    run.update(initial_point=path.final_point, resume=path,
+                               max_iters=extent - (len(path) - 1))
+                else:
+                    # Путь уже остановлен или достаточно длинный
+                    continue
+                allocated[key] = extent
+                keys.append(key)
+                runs.append(run)
+
+            failed = set()
+            for run_index, trajectory, error in runner.run(strategy, runs):
+                key = keys[run_index]
+                if error is not None:
+                    failed.add(key)
+                    continue
+                spent += len(trajectory) - (len(paths[key]) if key in paths else 1)
+                paths[key] = trajectory
+            if self._cancelled:
+                break
+
+            scores = {}
+            for i in alive:
+                key = group_of[i]
+                if key in failed or key not in paths:
+                    status[i] = self.DIVERGED
+                    continue
+                outcome, result = self._outcome(paths[key], configs[i][1], budgets[i], shared)
+                if outcome == self.CONVERGED:
+                    status[i] = self.CONVERGED
+                    iterations[i] = result
+                elif outcome is not None:
+                    status[i] = outcome
+                elif budgets[i] < configs[i][2]:
+                    scores[i] = result
+                else:
+                    status[i] = self.EXHAUSTED
+
+            # Следующую ступень проходит лучшая 1 / eta часть продолжающих.
+            # Конфигурации одной группы до остановки идут по одному пути,
+            # поэтому равные значению на границе отбора проходят все вместе
+            alive = []
+            if scores:
+                keep = max(1, len(scores) // self.eta)
+                threshold = sorted(scores.values())[keep - 1]
+                alive = [i for i in scores if scores[i] <= threshold]
+            budget *= self.eta
+            rung += 1
+
+        shape = (len(self.lrs), len(self.tolerances), len(self.max_iters))
+        return {
+            'iterations': iterations.reshape(shape),
+            'status': status.reshape(shape),
+            'iterations_spent': spent,
+            'iterations_budget': int(sum(allocated.values())),
+            'full_grid_iterations': int(sum(max(configs[i][2] for i in members)
+                                            for members in groups.values())),
+        }
+
+    def _outcome(self, path, tolerance, budget, shared):
+        """
+        Исход конфигурации по общему пути, обрезанному до ее бюджета.
+
+        Args:
+            path: Общий путь группы (Trajectory)
+            tolerance: Точность конфигурации
+            budget: Бюджет итераций конфигурации на текущей ступени
+            shared: Путь общий для разных точностей (остановка по норме градиента)
+
+        Returns:
+            tuple: (CONVERGED и число итераций, DIVERGED или EXHAUSTED и
+                значение функции, или None и значение, если конфигурация
+                не остановилась в пределах бюджета)
+        """
+        steps = len(path) - 1
+        end = min(budget, steps)
+        stops = []
+        if shared:
+            below = np.flatnonzero(path.grad_norms[:end + 1] < tolerance)
+            if below.size:
+                stops.append(int(below[0]))
+        if path.converged and steps <= budget:
+            stops.append(steps)
+        if stops:
+            return self.CONVERGED, min(stops)
+
+        value = path.values[end]
+        stopped = steps <= budget and path.termination_reason != Trajectory.MAX_ITERS
+        if ((stopped and path.termination_reason == NonFiniteCriterion.reason)
+                or not np.isfinite(value) or value > path.values[0]):
+            return self.DIVERGED, value
+        if stopped:
+            # Сработал другой критерий остановки
+            return self.EXHAUSTED, value
+        return None, value
+
+    def cancel(self):
+        self._cancelled = True
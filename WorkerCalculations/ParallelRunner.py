@@ -0,0 +1,117 @@
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def _run_chunk(strategy, chunk):
+    """
+    Выполняет пакет независимых запусков в процессе пула.
+
+    Args:
+        strategy: Стратегия оптимизации (копия, переданная в процесс)
+        chunk: Список пар (индекс запуска, параметры optimize)
+
+    Returns:
+        list: Тройки (индекс, траектория или None, текст ошибки или None)
+    """
+    results = []
+    default_function = strategy.get_func()
+    for index, params in chunk:
+        params = dict(params)
+        strategy.set_func(params.pop('function', default_function))
+        try:
+            results.append((index, strategy.optimize(**params), None))
+        except Exception as error:
+            results.append((index, None, f"{type(error).__name__}: {error}"))
+    return results
+
+
+class ParallelRunner:
+    """
+    Параллельное выполнение независимых запусков оптимизации в пуле процессов.
+
+    Запуски отправляются пакетами, чтобы накладные расходы на передачу
+    стратегии и результатов между процессами не превышали время счета.
+    Пул создается при первом использовании и переиспользуется.
+
+    Каждый вызов run отслеживает только свои пакеты, поэтому завершение
+    одного задания не отменяет пакеты другого. Флаг отмены сбрасывается
+    вызывающим (reset) до запуска задания, чтобы отмена, поступившая до
+    начала счета, не терялась.
+
+    Attributes:
+        max_workers: Число процессов пула
+    """
+
+    def __init__(self, max_workers=None, start_method='spawn'):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # spawn: дочерние процессы не наследуют состояние Qt родителя
+        self._context = multiprocessing.get_context(start_method)
+        self._executor = None
+        # Пакеты выполняемых вызовов run: по списку на вызов
+        self._active = []
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=self._context)
+        return self._executor
+
+    def run(self, strategy, runs, chunk_size=None):
+        """
+        Выполняет запуски и возвращает результаты по мере готовности пакетов.
+
+        Args:
+            strategy: Стратегия оптимизации
+            runs: Список словарей параметров optimize (initial_point, lr,
+                max_iters, tolerance и дополнительные аргументы); ключ
+                'function' задает тестовую функцию запуска
+            chunk_size: Размер пакета (по умолчанию около четырех пакетов
+                на процесс)
+
+        Yields:
+            tuple: (индекс запуска, траектория или None, ошибка или None)
+        """
+        runs = list(runs)
+        if not runs:
+            return
+        chunk_size = chunk_size or max(1, math.ceil(len(runs) / (4 * self.max_workers)))
+        indexed = list(enumerate(runs))
+        chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+        if self._cancelled.is_set():
+            return
+        executor = self._get_executor()
+        futures = [executor.submit(_run_chunk, strategy, chunk) for chunk in chunks]
+        with self._lock:
+            self._active.append(futures)
+        try:
+            for future in as_completed(futures):
+                if self._cancelled.is_set():
+                    break
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            with self._lock:
+                self._active.remove(futures)
+
+    def reset(self):
+        """Сбрасывает флаг отмены перед новым заданием."""
+        self._cancelled.clear()
+
+    def cancel(self):
+        """Отменяет ожидающие пакеты; результаты уже выполняемых отбрасываются."""
+        self._cancelled.set()
+        with self._lock:
+            futures = [future for active in self._active for future in active]
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
\ No newline at end of file
@@ -0,0 +1,38 @@
+from PyQt5.QtCore import QRunnable
+
+from WorkerCalculations.WorkerSignals import WorkerSignals
+
+
+class RunScheduler(QRunnable):
+    """
+    Передает результаты параллельных запусков в GUI по мере готовности.
+
+    Сам счет выполняется в пуле процессов ParallelRunner, а этот объект
+    в потоке QThreadPool ожидает пакеты и отправляет каждый результат
+    сигналом runFinished (или runFailed). Ошибка самого пула (передача
+    стратегии в процесс, аварийное завершение процесса) передается текстом
+    сигналом failed; сигнал finished отправляется в любом случае.
+    """
+
+    def __init__(self, runner, strategy, runs, chunk_size=None):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.runner = runner
+        self.strategy = strategy
+        self.runs = runs
+        self.chunk_size = chunk_size
+
+    def run(self):
+        try:
+            for index, trajectory, error in self.runner.run(self.strategy, self.runs, self.chunk_size):
+                if error is None:
+                    self.signals.runFinished.emit(index, trajectory)
+                else:
+                    self.signals.runFailed.emit(index, error)
+        except Exception as error:
+            self.signals.failed.emit(f"{type(error).__name__}: {error}")
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        self.runner.cancel()
\ No newline at end of file
@@ -0,0 +1,42 @@
+import threading
+
+from PyQt5.QtCore import QRunnable
+
+from WorkerCalculations.WorkerSignals import WorkerSignals
+
+
+class SweepWorker(QRunnable):
+    """
+    Выполняет подбор гиперпараметров (HyperparameterSweep) вне потока GUI.
+
+    Запуски каждой ступени считаются в пуле процессов ParallelRunner.
+    Переход на новую ступень сообщается сигналом sweepProgress, итоговый
+    словарь результатов - сигналом resultReady. Результат прерванного
+    подбора не передается, ошибка передается текстом сигналом failed;
+    сигнал finished отправляется в любом случае.
+    """
+
+    def __init__(self, sweep, runner, strategy, initial_point):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.sweep = sweep
+        self.runner = runner
+        self.strategy = strategy
+        self.initial_point = initial_point
+        self.token = threading.Event()
+
+    def run(self):
+        try:
+            result = self.sweep.run(self.runner, self.strategy, self.initial_point,
+                                    progress=self.signals.sweepProgress.emit)
+            if not self.token.is_set():
+                self.signals.resultReady.emit(result)
+        except Exception as error:
+            self.signals.failed.emit(f"{type(error).__name__}: {error}")
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        self.token.set()
+        self.sweep.cancel()
+        self.runner.cancel()
@@ -3,4 +3,11 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 class WorkerSignals(QObject):
     finished = pyqtSignal()
-    resultReady = pyqtSignal(list)
\ No newline at end of file
+    resultReady = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    metricsReady = pyqtSignal(dict)
+    chunkReady = pyqtSignal(int, object, object)
+    runFinished = pyqtSignal(int, object)
+    runFailed = pyqtSignal(int, str)
+    sweepProgress = pyqtSignal(int, int)
+    basinProgress = pyqtSignal(int, int)
@@ -0,0 +1,68 @@
+import argparse
+import sys
+
+from Benchmark.BenchmarkSuite import BenchmarkSuite
+from Benchmark.StartupBenchmark import StartupBenchmark
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Замеры стратегий оптимизации без GUI")
+    parser.add_argument('--strategies', nargs='+', choices=BenchmarkSuite.STRATEGIES.keys())
+    parser.add_argument('--functions', nargs='+', choices=BenchmarkSuite.FUNCTIONS.keys())
+    parser.add_argument('--grid-size', type=int, default=5, help="Число начальных точек по каждой оси")
+    parser.add_argument('--dim', type=int, default=2,
+                        help="Размерность для функций произвольной размерности")
+    parser.add_argument('--lr', type=float, default=1e-3)
+    parser.add_argument('--max-iters', type=int, default=1000)
+    parser.add_argument('--tolerance', type=float, default=1e-4)
+    parser.add_argument('--profile', action='store_true',
+                        help="Измерять время фаз итерации (вычисления, шаг, остановка, запись)")
+    parser.add_argument('--cache', action='store_true',
+                        help="Кэшировать вычисления функции (CachedFunction)")
+    parser.add_argument('--cache-quantum', type=float,
+                        help="Шаг квантования ключей кэша (по умолчанию точные ключи)")
+    parser.add_argument('--startup', type=int, metavar='REPEATS',
+                        help="Вместо замеров стратегий измерить холодный старт GUI и CLI")
+    parser.add_argument('--json', help="Файл для результатов в JSON")
+    parser.add_argument('--csv', help="Файл для результатов в CSV")
+    parser.add_argument('--baseline', help="JSON с эталонными результатами для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Допустимый относительный рост времени и числа вычислений")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.startup:
+        startup = StartupBenchmark(args.startup)
+        results = startup.run()
+        print(startup.format_table(results))
+        if args.json:
+            BenchmarkSuite.save_json(results, args.json)
+        return 0
+
+    suite = BenchmarkSuite(args.strategies, args.functions, args.profile,
+                           args.cache, args.cache_quantum, args.dim)
+    results = suite.run(
+        suite.starting_points(grid_size=args.grid_size),
+        lr=args.lr,
+        max_iters=args.max_iters,
+        tolerance=args.tolerance
+    )
+    print(suite.format_table(results))
+
+    if args.json:
+        suite.save_json(results, args.json)
+    if args.csv:
+        suite.save_csv(results, args.csv)
+
+    if args.baseline:
+        regressions = suite.compare(results, suite.load_json(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"РЕГРЕССИЯ: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,242 @@
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+from OptimizationStrategy.StrategyRegistry import StrategyRegistry
+from RunStore.RunStore import RunStore
+from StoppingCriterion.EvaluationBudgetCriterion import EvaluationBudgetCriterion
+from StoppingCriterion.PlateauCriterion import PlateauCriterion
+from StoppingCriterion.RelativeChangeCriterion import RelativeChangeCriterion
+from StoppingCriterion.StepStallCriterion import StepStallCriterion
+from StoppingCriterion.TimeBudgetCriterion import TimeBudgetCriterion
+from TestFunctions.DatasetFunction import DatasetFunction
+from TestFunctions.FunctionRegistry import FunctionRegistry
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Запуски оптимизации без GUI. Результат каждого запуска - "
+                    "строка JSON в stdout и, при --store, запись в архиве запусков"
+    )
+    parser.add_argument('--strategy', default='gd', choices=StrategyRegistry.names())
+    parser.add_argument('--function', default='beale', choices=FunctionRegistry.names())
+    parser.add_argument('--x0', type=float, default=3.5)
+    parser.add_argument('--y0', type=float, default=2.0)
+    parser.add_argument('--dim', type=int, default=2,
+                        help="Размерность для функций произвольной размерности; "
+                             "начальная точка (x0, y0) повторяется до этой размерности")
+    parser.add_argument('--lr', type=float, default=1e-3)
+    parser.add_argument('--max-iters', type=int, default=100)
+    parser.add_argument('--tolerance', type=float, default=1e-4)
+    parser.add_argument('--grid-size', type=int,
+                        help="Серия запусков из равномерной сетки начальных точек в [-4, 4]^2")
+    parser.add_argument('--data',
+                        help="Каталог набора данных (features.npy, targets.npy): целевая функция - "
+                             "средняя потеря по строкам, данные читаются с диска порциями")
+    parser.add_argument('--loss', default='squared', choices=DatasetFunction.LOSSES)
+    parser.add_argument('--generate-data', type=int, metavar='N',
+                        help="Записать в --data синтетический набор из N строк размерности --dim")
+    parser.add_argument('--batch-size', type=int,
+                        help="Стохастический градиентный спуск по мини-батчам из --data")
+    parser.add_argument('--svrg', action='store_true', help="Оценка градиента SVRG для --batch-size")
+    parser.add_argument('--seed', type=int, help="Зерно перемешивания строк для --batch-size")
+    parser.add_argument('--ftol', type=float,
+                        help="Остановка при относительном изменении функции не больше FTOL")
+    parser.add_argument('--xtol', type=float,
+                        help="Остановка при относительной длине шага не больше XTOL")
+    parser.add_argument('--plateau', type=int, metavar='WINDOW',
+                        help="Остановка, если лучшее значение не улучшилось за WINDOW итераций")
+    parser.add_argument('--max-time', type=float, metavar='SECONDS',
+                        help="Ограничение времени одного запуска")
+    parser.add_argument('--max-evals', type=int,
+                        help="Ограничение числа вычислений функции, градиента и гессиана")
+    parser.add_argument('--config',
+                        help="JSON со списком запусков; ключи запуска (strategy, function, "
+                             "initial_point, dim, lr, max_iters, tolerance, data, loss, "
+                             "batch_size, svrg, seed, ftol, xtol, plateau, max_time, "
+                             "max_evals) заменяют аргументы")
+    parser.add_argument('--workers', type=int, default=1, help="Число процессов для серии запусков")
+    parser.add_argument('--store', help="Каталог архива запусков (RunStore)")
+    parser.add_argument('--resume', metavar='RUN_ID',
+                        help="Продолжить запуск RUN_ID из --store еще на --max-iters итераций "
+                             "с его методом, функцией и параметрами; результат - новый запуск")
+    parser.add_argument('--points', action='store_true', help="Выводить точки пути")
+    return parser.parse_args(argv)
+
+
+def build_runs(args, store=None):
+    """
+    Составляет список запусков из аргументов и файла конфигурации или
+    запуск-продолжение записи архива store (--resume).
+
+    Returns:
+        list: Словари с ключами strategy, function, initial_point, dim, lr,
+            max_iters, tolerance, data, loss, batch_size, svrg, seed и
+            ключами критериев остановки STOPPING_KEYS; у продолжения также
+            resume (идентификатор записи) и trajectory (ее траектория)
+    """
+    defaults = {
+        'strategy': args.strategy,
+        'function': 'data' if args.data else args.function,
+        'initial_point': [args.x0, args.y0],
+        'dim': args.dim,
+        'lr': args.lr,
+        'max_iters': args.max_iters,
+        'tolerance': args.tolerance,
+        'data': args.data,
+        'loss': args.loss,
+        'batch_size': args.batch_size,
+        'svrg': args.svrg,
+        'seed': args.seed,
+        'ftol': args.ftol,
+        'xtol': args.xtol,
+        'plateau': args.plateau,
+        'max_time': args.max_time,
+        'max_evals': args.max_evals,
+    }
+    if args.resume:
+        record = store.record(args.resume)
+        if record['strategy'] not in StrategyRegistry.names():
+            sys.exit(f"Запуск {args.resume} сохранен не из CLI: метод {record['strategy']}")
+        run = dict(defaults, **record['params'])
+        run.update(strategy=record['strategy'], function=record['function'],
+                   max_iters=args.max_iters, resume=args.resume,
+                   trajectory=store.load(args.resume, mmap=False))
+        return [run]
+    if args.config:
+        with open(args.config, encoding='utf-8') as file:
+            return [dict(defaults, **run) for run in json.load(file)]
+    if args.grid_size:
+        axis = np.linspace(-4, 4, args.grid_size)
+        return [dict(defaults, initial_point=[x, y]) for y in axis for x in axis]
+    return [defaults]
+
+
+def execute(runs, workers=1):
+    """
+    Выполняет запуски последовательно или в пуле процессов.
+
+    Yields:
+        tuple: (индекс запуска, траектория или None, ошибка или None)
+    """
+    # Запуски группируются по стратегии: одна стратегия на группу
+    groups = defaultdict(list)
+    for index, run in enumerate(runs):
+        groups[run['strategy']].append(index)
+
+    runner = None
+    if workers > 1:
+        # Пул процессов нужен только для серий
+        from WorkerCalculations.ParallelRunner import ParallelRunner
+        runner = ParallelRunner(workers)
+    try:
+        for name, indices in groups.items():
+            strategy = StrategyRegistry.create(name)
+            params = [optimize_params(runs[index]) for index in indices]
+            if runner is not None:
+                for position, trajectory, error in runner.run(strategy, params):
+                    yield indices[position], trajectory, error
+                continue
+            for index, run_params in zip(indices, params):
+                strategy.set_func(run_params.pop('function'))
+                try:
+                    yield index, strategy.optimize(**run_params), None
+                except Exception as error:
+                    yield index, None, f"{type(error).__name__}: {error}"
+    finally:
+        if runner is not None:
+            runner.shutdown()
+
+
+def optimize_params(run):
+    """Аргументы optimize запуска с тестовой функцией в ключе 'function'."""
+    if run.get('data'):
+        func = DatasetFunction.load(run['data'], run.get('loss', 'squared'))
+    else:
+        func = FunctionRegistry.get(run['function'])
+    params = {
+        'function': func,
+        'initial_point': func.expand_point(run['initial_point'], func.dimension or run['dim']),
+        'lr': run['lr'],
+        'max_iters': run['max_iters'],
+        'tolerance': run['tolerance'],
+    }
+    # Параметры стохастического режима передаются, только если заданы
+    if run.get('batch_size') is not None:
+        params['batch_size'] = run['batch_size']
+        params['svrg'] = bool(run.get('svrg'))
+        params['seed'] = run.get('seed')
+    criteria = stopping_criteria(run)
+    if criteria:
+        params['stopping_criteria'] = criteria
+    if run.get('trajectory') is not None:
+        # Продолжение с конца сохраненной траектории
+        params['resume'] = run['trajectory']
+        params['initial_point'] = run['trajectory'].final_point
+    return params
+
+
+# Ключи запуска и критерии остановки, которые они включают
+STOPPING_KEYS = {
+    'ftol': lambda value: RelativeChangeCriterion(rtol=value),
+    'xtol': lambda value: StepStallCriterion(rtol=value),
+    'plateau': lambda value: PlateauCriterion(window=value),
+    'max_time': TimeBudgetCriterion,
+    'max_evals': EvaluationBudgetCriterion,
+}
+
+
+def stopping_criteria(run):
+    """Дополнительные критерии остановки по заданным ключам запуска."""
+    return [make(run[key]) for key, make in STOPPING_KEYS.items() if run.get(key) is not None]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.generate_data:
+        if not args.data:
+            sys.exit("--generate-data требует --data")
+        DatasetFunction.generate(args.data, args.generate_data, args.dim, args.loss,
+                                 seed=args.seed or 0)
+    if args.resume and not args.store:
+        sys.exit("--resume требует --store")
+    store = RunStore(args.store) if args.store else None
+    runs = build_runs(args, store)
+    # Мини-батчи и SVRG есть только у градиентного спуска
+    for run in runs:
+        if ((run.get('batch_size') is not None or run.get('svrg'))
+                and StrategyRegistry.class_name(run['strategy']) != 'GradientDescentStrategy'):
+            sys.exit(f"batch_size и svrg поддерживаются только методами градиентного спуска, "
+                     f"а не {run['strategy']}")
+
+    failed = 0
+    for index, trajectory, error in execute(runs, args.workers):
+        run = runs[index]
+        output = {'index': index, 'strategy': run['strategy'], 'function': run['function']}
+        if error is not None:
+            failed += 1
+            output['error'] = error
+            print(RunStore.dumps(output))
+            continue
+
+        params = {key: run[key] for key in ('initial_point', 'dim', 'lr', 'max_iters', 'tolerance')}
+        if run.get('data'):
+            params.update({key: run[key] for key in ('data', 'loss', 'batch_size', 'svrg', 'seed')})
+        params.update({key: run[key] for key in STOPPING_KEYS if run.get(key) is not None})
+        if run.get('resume'):
+            params['resume'] = run['resume']
+        output['params'] = params
+        if store is not None:
+            output['id'] = store.save(trajectory, params, run['strategy'], run['function'])
+        output['summary'] = RunStore.summarize(trajectory, params)
+        if args.points:
+            output['points'] = trajectory.points.tolist()
+        print(RunStore.dumps(output))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,17 @@
 import sys
-from PyQt5.QtWidgets import (QApplication)
 
-from GUI.MainWindow import MainWindow
 
+def main():
+    # Qt и окно импортируются только при запуске GUI: для запусков без
+    # интерфейса используется cli.py
+    from PyQt5.QtWidgets import QApplication
+    from GUI.MainWindow import MainWindow
 
-if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())